@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Load modules of other skills by file path.
+
+Skills are not installed packages, so a script that reuses another skill's
+module (or its own sibling, when the script is itself loaded by path)
+loads it from its file. Each module is registered once in sys.modules
+under a caller-chosen name, so every skill loading the same file under
+that name shares one module object.
+
+This file uses only the standard library and can be bootstrapped from
+any skill with runpy:
+
+    SKILL_MODULES_PATH = Path(__file__).resolve().parents[2] / "_shared" / "skill_modules.py"
+    load_module = runpy.run_path(str(SKILL_MODULES_PATH))["load_module"]
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+
+def load_module(module_name, path):
+    """
+    Loads the Python file at path as module_name.
+
+    Returns the module already registered under module_name if there is
+    one. A module whose execution fails is not left registered.
+
+    Raises:
+        FileNotFoundError: If path does not exist
+        Exception: Whatever executing the module raises
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Module not found: {path}")
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Content-hash cache for extracted research and summaries.
+
+Re-running the collector on an inquiry whose research files have not
+changed should not re-extract or re-summarize anything. This module stores
+``AgentResearch`` and ``ResearchSummary`` results under the inquiry's
+``.cache/extract/`` directory, keyed by a SHA-256 of the input content plus
+the extractor/summarizer version, so a version bump invalidates old entries.
+
+The cache is bounded by total size; the least recently used entries are
+evicted first (entry mtime is refreshed on every hit).
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+
+try:
+    from .extract import EXTRACTOR_VERSION, AgentResearch
+    from .summarize import SUMMARIZER_VERSION, Divergence, ResearchSummary, ThemeOccurrence
+    from .utils import logger
+except ImportError:
+    from extract import EXTRACTOR_VERSION, AgentResearch
+    from summarize import SUMMARIZER_VERSION, Divergence, ResearchSummary, ThemeOccurrence
+    from utils import logger
+
+
+CACHE_DIRNAME = ".cache/extract"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def content_hash(*parts: str) -> str:
+    """Return a SHA-256 hex digest over the given string parts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def summary_from_dict(data: dict) -> ResearchSummary:
+    """Rebuild a ResearchSummary (and its nested dataclasses) from a dict."""
+    data = dict(data)
+    data["common_themes"] = [ThemeOccurrence(**t) for t in data.get("common_themes", [])]
+    data["agreements"] = [ThemeOccurrence(**t) for t in data.get("agreements", [])]
+    data["divergences"] = [Divergence(**d) for d in data.get("divergences", [])]
+    return ResearchSummary(**data)
+
+
+class ExtractionCache:
+    """On-disk cache of extraction and summary results for one inquiry."""
+
+    def __init__(self, inquiry_path: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize cache.
+
+        Args:
+            inquiry_path: Path to inquiry directory
+            max_bytes: Upper bound on total cache size before LRU eviction
+        """
+        self.cache_dir = Path(inquiry_path) / CACHE_DIRNAME
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def research_key(self, content: str, agent_id: str) -> str:
+        """Cache key for an agent's extracted research."""
+        return content_hash("research", EXTRACTOR_VERSION, agent_id, content)
+
+    def research_key_file(self, path: Path, agent_id: str) -> str:
+        """Cache key for an agent's research, hashed while streaming the file.
+
+        Equals research_key() of the file's text for UTF-8 files, without
+        ever holding the whole file in memory.
+        """
+        digest = hashlib.sha256()
+        for part in ("research", EXTRACTOR_VERSION, agent_id):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        digest.update(b"\0")
+        return digest.hexdigest()
+
+    def summary_key(
+        self,
+        inquiry_id: str,
+        inquiry_title: str,
+        reports: list[AgentResearch],
+        similarity_backend: str = "minhash",
+    ) -> str:
+        """Cache key for a summary over a set of extracted reports.
+
+        Reports are identified by the hash of their full source content
+        (recorded in metadata), since streamed extraction only keeps a
+        prefix of raw_content.
+        """
+        fingerprints = [
+            f"{r.agent_id}:{r.metadata.get('content_sha256') or content_hash(r.raw_content)}"
+            for r in reports
+        ]
+        return content_hash(
+            "summary",
+            SUMMARIZER_VERSION,
+            EXTRACTOR_VERSION,
+            similarity_backend,
+            inquiry_id,
+            inquiry_title,
+            *fingerprints,
+        )
+
+    def get_research(self, key: str) -> Optional[AgentResearch]:
+        """Return cached research for key, or None on a miss."""
+        data = self._read(key)
+        if data is None:
+            return None
+        return AgentResearch(**data)
+
+    def put_research(self, key: str, research: AgentResearch) -> None:
+        """Store extracted research under key."""
+        self._write(key, asdict(research))
+
+    def get_summary(self, key: str) -> Optional[ResearchSummary]:
+        """Return cached summary for key, or None on a miss."""
+        data = self._read(key)
+        if data is None:
+            return None
+        return summary_from_dict(data)
+
+    def put_summary(self, key: str, summary: ResearchSummary) -> None:
+        """Store a research summary under key."""
+        self._write(key, asdict(summary))
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[dict]:
+        path = self._entry_path(key)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        # Refresh recency for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return data
+
+    def _write(self, key: str, data: dict) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(".tmp")
+
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {path.name}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self.evict()
+
+    def evict(self) -> int:
+        """Evict least recently used entries until under max_bytes.
+
+        Returns number of entries removed.
+        """
+        if not self.cache_dir.exists():
+            return 0
+
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        return removed
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        if not self.cache_dir.exists():
+            return
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
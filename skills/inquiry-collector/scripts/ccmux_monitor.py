@@ -5,8 +5,8 @@ This module provides ccmux session monitoring for the inquiry-collector skill.
 It uses ccmux MCP tools to track agent sessions and extract their output.
 
 Note: This module is designed to be called from within a Claude Code session
-where ccmux MCP tools are available. For standalone testing, use the mock
-functions or file_monitor.py instead.
+where ccmux MCP tools are available. For standalone testing, drive it with
+the in-process LocalCcmuxServer (local_ccmux.py) or use file_monitor.py.
 """
 
 import json
@@ -19,6 +19,7 @@ from pathlib import Path
 from typing import Optional
 
 try:
+    from .polling import PollScheduler
     from .utils import (
         get_timestamp,
         has_completion_marker,
@@ -27,6 +28,7 @@ try:
         print_warning,
     )
 except ImportError:
+    from polling import PollScheduler
     from utils import (
         get_timestamp,
         has_completion_marker,
@@ -56,6 +58,7 @@ class AgentSession:
     status: AgentStatus = AgentStatus.PENDING
     output: str = ""
     error: Optional[str] = None
+    read_offset: int = 0  # Output lines already consumed
 
 
 class CcmuxMonitor:
@@ -160,6 +163,197 @@ class CcmuxMonitor:
         }
         return status_map.get(ccmux_status.lower(), AgentStatus.PENDING)
 
+    def parse_bulk_status_response(self, response: dict) -> list[AgentSession]:
+        """Update every session's status from one ccmux_list_panes response.
+
+        Replaces a ccmux_get_status call per pane: the pane list already
+        carries each pane's status. Newly tagged panes are added.
+
+        Args:
+            response: Response from ccmux_list_panes
+
+        Returns:
+            Sessions whose status changed (including new sessions)
+        """
+        by_pane = {s.pane_id: s for s in self.sessions}
+        changed = []
+
+        for pane in response.get("panes", []):
+            if not self._matches_inquiry_tag(pane.get("tags", [])):
+                continue
+
+            status = self._map_status(pane.get("status", ""))
+            session = by_pane.get(pane.get("pane_id", ""))
+
+            if session is None:
+                session = AgentSession(
+                    session_id=pane.get("session_id", ""),
+                    pane_id=pane.get("pane_id", ""),
+                    agent_number=self._extract_agent_number(
+                        pane.get("tags", []), pane.get("name", "")
+                    ),
+                    status=status,
+                )
+                self.sessions.append(session)
+                by_pane[session.pane_id] = session
+                changed.append(session)
+            elif session.status != status and session.status != AgentStatus.COMPLETE:
+                # A completion marker seen in output is sticky
+                session.status = status
+                changed.append(session)
+
+        self.sessions.sort(key=lambda s: s.agent_number)
+        return changed
+
+    def get_incremental_output_command(self, session: AgentSession, lines: int = 2000) -> str:
+        """Generate command to read only pane output not yet consumed.
+
+        Returns MCP tool call parameters as JSON for ccmux_read_pane.
+        """
+        return json.dumps({
+            "pane_id": session.pane_id,
+            "offset": session.read_offset,
+            "lines": lines,
+        })
+
+    def parse_incremental_output(self, response: dict, session: AgentSession) -> str:
+        """Parse an offset-based ccmux_read_pane response.
+
+        Appends the new lines to the session output, advances the read
+        cursor and checks the new lines, together with the last line read
+        before them, for a completion marker.
+
+        Args:
+            response: Response from ccmux_read_pane (with offset)
+            session: AgentSession to update
+
+        Returns:
+            Newly read output
+        """
+        chunk = response.get("output", response.get("content", ""))
+
+        # Advance even when the new lines are blank (an empty chunk)
+        before = session.read_offset
+        if "next_offset" in response:
+            session.read_offset = response["next_offset"]
+        else:
+            session.read_offset += len(chunk.splitlines())
+        if session.read_offset <= before:
+            return ""
+
+        # Output holds the consumed lines joined by "\n", blank lines included
+        last_line = session.output[session.output.rfind("\n") + 1:]
+        if before > 0:
+            session.output += "\n"
+        session.output += chunk
+
+        # Markers are line-anchored; a heading may continue from the last
+        # line of the previous read ("##" there, its title here)
+        if has_completion_marker(f"{last_line}\n{chunk}" if before > 0 else chunk):
+            session.status = AgentStatus.COMPLETE
+
+        return chunk
+
+    def poll_once(self, client, lines: int = 2000, follow: bool = False) -> dict:
+        """Run one batched monitoring cycle against a ccmux client.
+
+        Issues a single list call for every pane's status, then reads new
+        output only from panes whose status changed. With follow=True,
+        working panes are also read incrementally so completion markers are
+        noticed before ccmux reports the pane as complete.
+
+        Args:
+            client: Object with list_panes() and
+                read_pane(pane_id, offset=..., lines=...) returning the
+                same dicts as the ccmux MCP tools (e.g. LocalCcmuxServer)
+            lines: Maximum lines to fetch per pane read
+            follow: Also read working panes every cycle
+
+        Returns:
+            Cycle statistics: round_trips, changed, lines_read, complete
+        """
+        changed = self.parse_bulk_status_response(client.list_panes())
+        round_trips = 1
+        lines_read = 0
+
+        changed_ids = {s.pane_id for s in changed}
+        for session in self.sessions:
+            if session.pane_id not in changed_ids and not (
+                follow and session.status == AgentStatus.WORKING
+            ):
+                continue
+
+            # Drain the pane in chunks of at most `lines`
+            while True:
+                response = client.read_pane(
+                    session.pane_id, offset=session.read_offset, lines=lines
+                )
+                round_trips += 1
+                before = session.read_offset
+                self.parse_incremental_output(response, session)
+                lines_read += session.read_offset - before
+                # Stop when drained, or when a read made no progress
+                if response.get("total_lines", 0) <= session.read_offset or session.read_offset <= before:
+                    break
+
+        return {
+            "round_trips": round_trips,
+            "changed": len(changed),
+            "lines_read": lines_read,
+            "complete": sum(1 for s in self.sessions if s.status == AgentStatus.COMPLETE),
+        }
+
+    def wait_for_completion(
+        self,
+        client,
+        scheduler: Optional[PollScheduler] = None,
+        follow: bool = False,
+        agent_deadlines: Optional[dict[int, float]] = None,
+    ) -> dict:
+        """Poll a ccmux client until every agent completes or times out.
+
+        Uses poll_once per cycle with an adaptive backoff schedule: the
+        interval resets whenever a pane changes status or produces output.
+        Agents past their deadline are marked TIMEOUT.
+
+        Args:
+            client: ccmux client (see poll_once)
+            scheduler: Optional pre-configured PollScheduler
+            follow: Also read working panes every cycle
+            agent_deadlines: Optional agent number -> seconds before that
+                agent is given up on (defaults to timeout)
+
+        Returns:
+            Completion summary including polling telemetry
+        """
+        if scheduler is None:
+            scheduler = PollScheduler(
+                timeout=self.timeout,
+                agent_deadlines=agent_deadlines,
+            )
+
+        round_trips = 0
+        while True:
+            stats = self.poll_once(client, follow=follow)
+            round_trips += stats["round_trips"]
+
+            for session in self.sessions:
+                if session.status == AgentStatus.COMPLETE:
+                    scheduler.mark_complete(session.agent_number)
+
+            activity = bool(stats["changed"] or stats["lines_read"])
+            outstanding = scheduler.outstanding(self.get_incomplete_agents())
+            if not outstanding or not scheduler.wait(activity, outstanding):
+                break
+
+        for session in self.sessions:
+            if session.status != AgentStatus.COMPLETE and scheduler.expired(session.agent_number):
+                session.status = AgentStatus.TIMEOUT
+
+        summary = self.get_completion_summary()
+        summary["polling"] = dict(scheduler.telemetry(), round_trips=round_trips)
+        return summary
+
     def get_pane_output_command(self, pane_id: str, lines: int = 2000) -> str:
         """Generate command to read pane output.
 
@@ -179,6 +373,7 @@ class CcmuxMonitor:
         """
         output = response.get("output", response.get("content", ""))
         session.output = output
+        session.read_offset = len(output.splitlines())
 
         # Check for completion marker in output
         if has_completion_marker(output):
@@ -236,6 +431,7 @@ class CcmuxMonitor:
         pending = [s for s in self.sessions if s.status == AgentStatus.PENDING]
         working = [s for s in self.sessions if s.status == AgentStatus.WORKING]
         errors = [s for s in self.sessions if s.status == AgentStatus.ERROR]
+        timed_out = [s for s in self.sessions if s.status == AgentStatus.TIMEOUT]
 
         return {
             "expected": self.expected_agents,
@@ -244,6 +440,7 @@ class CcmuxMonitor:
             "pending": len(pending),
             "working": len(working),
             "errors": len(errors),
+            "timed_out": len(timed_out),
             "incomplete_agents": self.get_incomplete_agents(),
         }
 
@@ -273,16 +470,25 @@ Expected to find {expected_agents} sessions tagged with "{inquiry_id}" or "agent
 
 ### 2. Check Status
 
-For each found session, use `ccmux_get_status` with the pane_id.
+Re-run `ccmux_list_panes` once per polling cycle; each pane entry already
+carries its status, so there is no need to call `ccmux_get_status` per pane.
 
 Look for status: "complete" or "idle"
 
+Back off between cycles: wait 1s after the first check, double the wait
+after each cycle in which no pane changed status or produced output (up to
+30s), and drop back to 1s as soon as one does.
+
 ### 3. Extract Output
 
-For complete sessions, use `ccmux_read_pane` with:
+For working or newly complete sessions, use `ccmux_read_pane` with:
 - pane_id: [from step 1]
+- offset: number of lines already read from this pane (0 at first)
 - lines: 2000
 
+Append the returned output and advance the offset, so each cycle only
+fetches new lines.
+
 ### 4. Timeout Handling
 
 If agents don't complete within {timeout} seconds:
@@ -14,10 +14,12 @@ import argparse
 import json
 import sys
 from pathlib import Path
+from typing import Optional
 
 try:
+    from .cache import ExtractionCache
     from .ccmux_monitor import CcmuxMonitor, create_monitor_instructions
-    from .extract import extract_agent_research
+    from .extract import extract_agent_research, extract_agent_research_file
     from .file_monitor import FileMonitor, check_files, wait_for_files
     from .summarize import Summarizer, generate_summary_markdown
     from .utils import (
@@ -31,10 +33,12 @@ try:
         print_warning,
         save_inquiry_report,
         update_inquiry_phase,
+        STREAMING_THRESHOLD,
     )
 except ImportError:
+    from cache import ExtractionCache
     from ccmux_monitor import CcmuxMonitor, create_monitor_instructions
-    from extract import extract_agent_research
+    from extract import extract_agent_research, extract_agent_research_file
     from file_monitor import FileMonitor, check_files, wait_for_files
     from summarize import Summarizer, generate_summary_markdown
     from utils import (
@@ -48,6 +52,7 @@ except ImportError:
         print_warning,
         save_inquiry_report,
         update_inquiry_phase,
+        STREAMING_THRESHOLD,
     )
 
 
@@ -126,6 +131,7 @@ def collect_from_files(
     timeout: int = 300,
     dry_run: bool = False,
     force: bool = False,
+    cache: Optional[ExtractionCache] = None,
 ) -> tuple[list, bool]:
     """Collect research outputs from files.
 
@@ -135,6 +141,7 @@ def collect_from_files(
         timeout: Timeout in seconds
         dry_run: If True, don't write files
         force: If True, overwrite existing files
+        cache: Optional extraction cache; unchanged files skip extraction
 
     Returns:
         Tuple of (extracted_reports, all_complete)
@@ -157,16 +164,32 @@ def collect_from_files(
     extracted = []
 
     for file_info in files:
-        if not file_info.content:
+        # Large transcripts are never loaded: they are hashed and extracted
+        # by streaming from disk with bounded memory
+        streaming = file_info.size >= STREAMING_THRESHOLD
+        if not streaming and not file_info.content:
             continue
 
         agent_id = str(file_info.agent_number)
-        research = extract_agent_research(file_info.content, agent_id)
+        research = None
+        if cache is not None:
+            if streaming:
+                cache_key = cache.research_key_file(file_info.path, agent_id)
+            else:
+                cache_key = cache.research_key(file_info.content, agent_id)
+            research = cache.get_research(cache_key)
+        if research is None:
+            if streaming:
+                research = extract_agent_research_file(file_info.path, agent_id)
+            else:
+                research = extract_agent_research(file_info.content, agent_id)
+            if cache is not None and not dry_run:
+                cache.put_research(cache_key, research)
         extracted.append(research)
 
         print_progress(
             f"Agent {agent_id}: {research.completeness_score():.0%} complete "
-            f"({len(file_info.content)} chars)"
+            f"({research.metadata.get('content_chars', len(file_info.content))} chars)"
         )
 
         # Generate standardized report (unless it's the source file)
@@ -219,6 +242,8 @@ def generate_summary(
     inquiry_path: Path,
     extracted_reports: list,
     dry_run: bool = False,
+    cache: Optional[ExtractionCache] = None,
+    similarity_backend: str = "minhash",
 ) -> Path:
     """Generate SUMMARY.md from extracted reports.
 
@@ -226,6 +251,8 @@ def generate_summary(
         inquiry_path: Path to inquiry directory
         extracted_reports: List of AgentResearch objects
         dry_run: If True, don't write file
+        cache: Optional extraction cache; unchanged inputs skip analysis
+        similarity_backend: Summarizer similarity engine ("minhash" or "tfidf")
 
     Returns:
         Path to generated summary file
@@ -234,12 +261,26 @@ def generate_summary(
     inquiry_id = report.get("inquiry_id", "INQ-???")
     inquiry_title = report.get("title", "")
 
-    summarizer = Summarizer(inquiry_id, inquiry_title)
+    summary = None
+    if cache is not None:
+        cache_key = cache.summary_key(
+            inquiry_id,
+            inquiry_title,
+            extracted_reports,
+            similarity_backend,
+        )
+        summary = cache.get_summary(cache_key)
+
+    if summary is None:
+        summarizer = Summarizer(inquiry_id, inquiry_title, similarity_backend)
+
+        for research in extracted_reports:
+            summarizer.add_report(research)
 
-    for research in extracted_reports:
-        summarizer.add_report(research)
+        summary = summarizer.analyze()
+        if cache is not None and not dry_run:
+            cache.put_summary(cache_key, summary)
 
-    summary = summarizer.analyze()
     markdown = generate_summary_markdown(summary)
 
     summary_path = inquiry_path / "SUMMARY.md"
@@ -324,6 +365,17 @@ Examples:
         action="store_true",
         help="Overwrite existing research files",
     )
+    parser.add_argument(
+        "--similarity",
+        choices=["minhash", "tfidf"],
+        default="minhash",
+        help="Similarity backend for agreement/divergence detection (default: minhash)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-extract and re-summarize even if inputs are unchanged",
+    )
     parser.add_argument(
         "--base-path",
         type=Path,
@@ -374,12 +426,15 @@ Examples:
         sys.exit(0)
 
     elif args.mode == "file":
+        cache = None if args.no_cache else ExtractionCache(inquiry_path)
+
         extracted, all_complete = collect_from_files(
             inquiry_path,
             expected_agents,
             timeout=args.timeout,
             dry_run=args.dry_run,
             force=args.force,
+            cache=cache,
         )
 
         if not extracted:
@@ -387,7 +442,15 @@ Examples:
             sys.exit(1)
 
         # Generate summary
-        generate_summary(inquiry_path, extracted, dry_run=args.dry_run)
+        generate_summary(
+            inquiry_path,
+            extracted,
+            dry_run=args.dry_run,
+            cache=cache,
+            similarity_backend=args.similarity,
+        )
+        if cache is not None:
+            print_progress(f"Cache: {cache.hits} hits, {cache.misses} misses")
 
         # Update status
         update_status(
@@ -1,14 +1,38 @@
 #!/usr/bin/env python3
 """Extract structured content from agent research outputs."""
 
+import hashlib
+import mmap
 import re
 from dataclasses import dataclass, field
-from typing import Optional
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 try:
-    from .utils import parse_markdown_sections
+    from .utils import iter_markdown_sections, parse_markdown_sections
 except ImportError:
-    from utils import parse_markdown_sections
+    from utils import iter_markdown_sections, parse_markdown_sections
+
+
+# Bump when extraction output changes so cached results are invalidated
+EXTRACTOR_VERSION = "3"
+
+# Streaming extraction keeps at most this much of the raw report and of
+# each section, so memory stays bounded regardless of report size
+RAW_CONTENT_LIMIT = 64 * 1024
+SECTION_CONTENT_LIMIT = 256 * 1024
+
+TIMESTAMP_VALUE = r"(\d{4}-\d{2}-\d{2}(?:\s+\d{2}:\d{2}(?::\d{2})?)?)"
+TIMESTAMP_PATTERN = re.compile(
+    r"(?:completed|timestamp|date):\s*" + TIMESTAMP_VALUE, re.IGNORECASE
+)
+AGENT_PATTERN = re.compile(r"(?:agent|model|assistant):\s*([^\n]+)", re.IGNORECASE)
+
+# Labels whose value starts on a later line (the patterns above allow
+# whitespace, including newlines, between label and value)
+TIMESTAMP_LABEL_ONLY = re.compile(r"(?:completed|timestamp|date):\s*$", re.IGNORECASE)
+AGENT_LABEL_ONLY = re.compile(r"(?:agent|model|assistant):\s*$", re.IGNORECASE)
+TIMESTAMP_VALUE_PATTERN = re.compile(r"\s*" + TIMESTAMP_VALUE)
 
 
 @dataclass
@@ -88,6 +112,14 @@ class ContentExtractor:
         ],
     }
 
+    # Paragraph phrases used when sections can't be found, checked in order
+    HEURISTIC_PHRASES = {
+        "problem_analysis": ["the problem is", "the issue", "challenge", "question"],
+        "evidence_gathered": ["found that", "discovered", "evidence shows", "data indicates"],
+        "key_findings": ["conclude", "key finding", "main finding", "in summary"],
+        "recommendations": ["recommend", "suggest", "should", "propose"],
+    }
+
     def __init__(self):
         # Compile patterns for efficiency
         self._compiled_patterns = {}
@@ -108,7 +140,7 @@ class ContentExtractor:
 
         # Try section-based extraction first
         sections = parse_markdown_sections(content)
-        self._extract_from_sections(sections, research)
+        self._extract_from_sections(sections.items(), research)
 
         # If minimal content found, try heuristic extraction
         if research.completeness_score() < 0.4:
@@ -119,64 +151,88 @@ class ContentExtractor:
 
         return research
 
+    def extract_stream(
+        self,
+        lines: Iterable[str],
+        agent_id: str,
+        raw_limit: int = RAW_CONTENT_LIMIT,
+        section_limit: int = SECTION_CONTENT_LIMIT,
+    ) -> AgentResearch:
+        """Extract structured research from a stream of lines.
+
+        Produces the same fields as extract() in a single pass without
+        holding the whole report: only sections whose headings map to an
+        AgentResearch field are buffered (capped at section_limit), the
+        heuristic fallback keeps a handful of candidate paragraphs, and
+        raw_content is truncated to raw_limit characters. As in extract(),
+        a heading that occurs more than once keeps its last section.
+        """
+        state = _StreamState(raw_limit)
+        sections = dict(iter_markdown_sections(
+            state.observe(lines, self._paragraph_fields),
+            keep=lambda heading: bool(self._heading_fields(heading)),
+            max_chars=section_limit,
+        ))
+
+        research = AgentResearch(agent_id=agent_id, raw_content="")
+        self._extract_from_sections(sections.items(), research)
+        research.raw_content = "".join(state.raw_parts)
+
+        # If minimal content found, replay heuristics on kept candidates
+        if research.completeness_score() < 0.4:
+            self._apply_heuristics(state.candidate_paragraphs(), research)
+
+        research.metadata = state.metadata()
+        return research
+
+    def _heading_fields(self, heading: str) -> list[str]:
+        """Return the AgentResearch fields a section heading maps to."""
+        return [
+            field_name
+            for field_name, patterns in self._compiled_patterns.items()
+            if any(pattern.search(heading) for pattern in patterns)
+        ]
+
+    def _paragraph_fields(self, para: str) -> list[str]:
+        """Return the fields a paragraph could fill heuristically."""
+        # Skip very short paragraphs
+        if len(para) < 50:
+            return []
+
+        para_lower = para.lower()
+        return [
+            field_name
+            for field_name, phrases in self.HEURISTIC_PHRASES.items()
+            if any(phrase in para_lower for phrase in phrases)
+        ]
+
     def _extract_from_sections(
-        self, sections: dict[str, str], research: AgentResearch
+        self, sections: Iterable[tuple[str, str]], research: AgentResearch
     ) -> None:
         """Extract content by matching section headings."""
-        for heading, content in sections.items():
-            for field_name, patterns in self._compiled_patterns.items():
-                for pattern in patterns:
-                    if pattern.search(heading):
-                        current = getattr(research, field_name)
-                        if not current:
-                            setattr(research, field_name, content)
-                        break
+        for heading, content in sections:
+            for field_name in self._heading_fields(heading):
+                if not getattr(research, field_name):
+                    setattr(research, field_name, content)
 
     def _extract_heuristically(self, content: str, research: AgentResearch) -> None:
         """Extract content using heuristic analysis.
 
         Looks for paragraph patterns that indicate different section types.
         """
-        paragraphs = self._split_paragraphs(content)
+        self._apply_heuristics(self._split_paragraphs(content), research)
 
+    def _apply_heuristics(self, paragraphs: Iterable[str], research: AgentResearch) -> None:
+        """Fill empty fields from the first paragraph matching each one.
+
+        Each paragraph fills at most one field, checked in HEURISTIC_PHRASES
+        order.
+        """
         for para in paragraphs:
-            para_lower = para.lower()
-
-            # Skip very short paragraphs
-            if len(para) < 50:
-                continue
-
-            # Problem analysis indicators
-            if not research.problem_analysis and any(
-                phrase in para_lower
-                for phrase in ["the problem is", "the issue", "challenge", "question"]
-            ):
-                research.problem_analysis = para
-                continue
-
-            # Evidence indicators
-            if not research.evidence_gathered and any(
-                phrase in para_lower
-                for phrase in ["found that", "discovered", "evidence shows", "data indicates"]
-            ):
-                research.evidence_gathered = para
-                continue
-
-            # Findings indicators
-            if not research.key_findings and any(
-                phrase in para_lower
-                for phrase in ["conclude", "key finding", "main finding", "in summary"]
-            ):
-                research.key_findings = para
-                continue
-
-            # Recommendation indicators
-            if not research.recommendations and any(
-                phrase in para_lower
-                for phrase in ["recommend", "suggest", "should", "propose"]
-            ):
-                research.recommendations = para
-                continue
+            for field_name in self._paragraph_fields(para):
+                if not getattr(research, field_name):
+                    setattr(research, field_name, para)
+                    break
 
     def _split_paragraphs(self, content: str) -> list[str]:
         """Split content into paragraphs."""
@@ -189,31 +245,170 @@ class ContentExtractor:
         metadata = {}
 
         # Look for timestamp patterns
-        timestamp_match = re.search(
-            r"(?:completed|timestamp|date):\s*(\d{4}-\d{2}-\d{2}(?:\s+\d{2}:\d{2}(?::\d{2})?)?)",
-            content,
-            re.IGNORECASE,
-        )
+        timestamp_match = TIMESTAMP_PATTERN.search(content)
         if timestamp_match:
             metadata["timestamp"] = timestamp_match.group(1)
 
         # Look for agent identifier
-        agent_match = re.search(
-            r"(?:agent|model|assistant):\s*([^\n]+)",
-            content,
-            re.IGNORECASE,
-        )
+        agent_match = AGENT_PATTERN.search(content)
         if agent_match:
             metadata["agent_identifier"] = agent_match.group(1).strip()
 
         # Count words for statistics
         words = len(content.split())
         metadata["word_count"] = words
+        metadata["content_chars"] = len(content)
+        metadata["content_sha256"] = hashlib.sha256(content.encode("utf-8")).hexdigest()
 
         return metadata
 
 
+class _StreamState:
+    """Per-line bookkeeping for ContentExtractor.extract_stream()."""
+
+    # Candidates kept per heuristic field. Each paragraph fills at most one
+    # field, so with four fields the fourth candidate is always reachable.
+    CANDIDATES_PER_FIELD = 4
+
+    def __init__(self, raw_limit: int):
+        self.raw_limit = raw_limit
+        self.raw_parts: list[str] = []
+        self.raw_chars = 0
+        self.content_chars = 0
+        self.word_count = 0
+        self.timestamp: Optional[str] = None
+        self.agent_identifier: Optional[str] = None
+        self.timestamp_pending = False
+        self.agent_pending = False
+        self.digest = hashlib.sha256()
+        self.candidates: dict[int, str] = {}  # paragraph index -> paragraph
+        self.candidate_counts: dict[str, int] = {}
+
+    def observe(self, lines: Iterable[str], paragraph_fields) -> Iterator[str]:
+        """Record metadata and paragraphs for each line, then pass it on."""
+        paragraph: list[str] = []
+        paragraph_chars = 0
+        paragraph_index = 0
+
+        for line in lines:
+            self.digest.update(line.encode("utf-8"))
+            self.content_chars += len(line)
+            self.word_count += len(line.split())
+
+            if self.raw_chars < self.raw_limit:
+                part = line[:self.raw_limit - self.raw_chars]
+                self.raw_parts.append(part)
+                self.raw_chars += len(part)
+
+            # Both metadata labels end in a colon; skip the regexes otherwise
+            if ":" in line or self.timestamp_pending or self.agent_pending:
+                if self.timestamp is None:
+                    self._scan_timestamp(line)
+                if self.agent_identifier is None:
+                    self._scan_agent(line)
+
+            # Paragraphs are separated by blank lines
+            if line.strip():
+                if paragraph_chars < SECTION_CONTENT_LIMIT:
+                    paragraph.append(line.rstrip("\n"))
+                    paragraph_chars += len(line)
+            elif paragraph:
+                self._consider(paragraph_index, "\n".join(paragraph).strip(), paragraph_fields)
+                paragraph_index += 1
+                paragraph = []
+                paragraph_chars = 0
+
+            yield line
+
+        if paragraph:
+            self._consider(paragraph_index, "\n".join(paragraph).strip(), paragraph_fields)
+
+    def _scan_timestamp(self, line: str) -> None:
+        if self.timestamp_pending and line.strip():
+            self.timestamp_pending = False
+            match = TIMESTAMP_VALUE_PATTERN.match(line)
+            if match:
+                self.timestamp = match.group(1)
+                return
+
+        match = TIMESTAMP_PATTERN.search(line)
+        if match:
+            self.timestamp = match.group(1)
+        elif not self.timestamp_pending and TIMESTAMP_LABEL_ONLY.search(line):
+            self.timestamp_pending = True
+
+    def _scan_agent(self, line: str) -> None:
+        if self.agent_pending and line.strip():
+            self.agent_identifier = line.strip()
+            return
+
+        match = AGENT_PATTERN.search(line)
+        if match and match.group(1).strip():
+            self.agent_identifier = match.group(1).strip()
+        elif AGENT_LABEL_ONLY.search(line):
+            self.agent_pending = True
+
+    def _consider(self, index: int, para: str, paragraph_fields) -> None:
+        for field_name in paragraph_fields(para):
+            count = self.candidate_counts.get(field_name, 0)
+            if count < self.CANDIDATES_PER_FIELD:
+                self.candidate_counts[field_name] = count + 1
+                self.candidates[index] = para
+
+    def candidate_paragraphs(self) -> list[str]:
+        """Candidate paragraphs in document order."""
+        return [self.candidates[i] for i in sorted(self.candidates)]
+
+    def metadata(self) -> dict:
+        """Metadata equivalent to ContentExtractor._extract_metadata()."""
+        metadata = {}
+        if self.timestamp is not None:
+            metadata["timestamp"] = self.timestamp
+        if self.agent_identifier is not None:
+            metadata["agent_identifier"] = self.agent_identifier
+        metadata["word_count"] = self.word_count
+        metadata["content_chars"] = self.content_chars
+        metadata["content_sha256"] = self.digest.hexdigest()
+        if self.content_chars > self.raw_chars:
+            metadata["raw_content_truncated"] = True
+        return metadata
+
+
 def extract_agent_research(content: str, agent_id: str) -> AgentResearch:
     """Convenience function to extract research from content."""
     extractor = ContentExtractor()
     return extractor.extract(content, agent_id)
+
+
+def iter_file_lines(path: Path, use_mmap: bool = True) -> Iterator[str]:
+    """Yield decoded lines of a file, optionally through a memory map."""
+    with open(path, "rb") as f:
+        if use_mmap:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be mapped
+                return
+            with mapped:
+                for line in iter(mapped.readline, b""):
+                    yield line.decode("utf-8", errors="replace")
+        else:
+            for line in f:
+                yield line.decode("utf-8", errors="replace")
+
+
+def extract_agent_research_file(
+    path: Path,
+    agent_id: str,
+    use_mmap: bool = True,
+) -> AgentResearch:
+    """Extract research from a report file without loading it whole.
+
+    The file's path is recorded as metadata["source_path"], so consumers of
+    the full text (theme extraction) can re-stream it when raw_content was
+    truncated.
+    """
+    extractor = ContentExtractor()
+    research = extractor.extract_stream(iter_file_lines(path, use_mmap), agent_id)
+    research.metadata["source_path"] = str(path)
+    return research
@@ -6,6 +6,7 @@ It watches the research/ directory for agent output files and detects
 completion markers.
 """
 
+import mmap
 import os
 import re
 import time
@@ -15,24 +16,26 @@ from pathlib import Path
 from typing import Optional
 
 try:
+    from .polling import PollScheduler
     from .utils import (
         ensure_research_dir,
-        estimate_content_completeness,
         get_timestamp,
-        has_completion_marker,
         logger,
         print_progress,
         print_warning,
+        scan_completion,
+        STREAMING_THRESHOLD,
     )
 except ImportError:
+    from polling import PollScheduler
     from utils import (
         ensure_research_dir,
-        estimate_content_completeness,
         get_timestamp,
-        has_completion_marker,
         logger,
         print_progress,
         print_warning,
+        scan_completion,
+        STREAMING_THRESHOLD,
     )
 
 
@@ -52,7 +55,8 @@ class ResearchFile:
     path: Path
     agent_number: int
     status: FileStatus = FileStatus.NOT_FOUND
-    content: str = ""
+    content: str = ""  # Left empty for files of STREAMING_THRESHOLD or more
+    size: int = 0
     last_modified: Optional[float] = None
     error: Optional[str] = None
 
@@ -83,6 +87,7 @@ class FileMonitor:
         expected_agents: int,
         timeout: int = 300,
         stable_seconds: int = 60,
+        agent_deadlines: Optional[dict[int, float]] = None,
     ):
         """Initialize file monitor.
 
@@ -91,13 +96,18 @@ class FileMonitor:
             expected_agents: Number of expected research agents
             timeout: Timeout in seconds for agent completion
             stable_seconds: Seconds of no modification to consider file stable
+            agent_deadlines: Optional agent number -> seconds before that
+                agent is given up on (defaults to timeout)
         """
         self.inquiry_path = Path(inquiry_path)
         self.research_dir = ensure_research_dir(self.inquiry_path)
         self.expected_agents = expected_agents
         self.timeout = timeout
         self.stable_seconds = stable_seconds
+        self.agent_deadlines = agent_deadlines or {}
         self.files: list[ResearchFile] = []
+        self.timed_out_agents: list[int] = []
+        self.poll_telemetry: Optional[dict] = None
 
     def scan_existing(self) -> list[ResearchFile]:
         """Scan research/ directory for existing files.
@@ -145,15 +155,25 @@ class FileMonitor:
     def _read_and_check_file(self, research_file: ResearchFile) -> None:
         """Read file content and check completion status."""
         try:
-            research_file.content = research_file.path.read_text()
-            research_file.last_modified = research_file.path.stat().st_mtime
-
-            # Check for completion
-            if has_completion_marker(research_file.content):
+            stat = research_file.path.stat()
+            research_file.size = stat.st_size
+            research_file.last_modified = stat.st_mtime
+
+            # Check for completion (marker and completeness in one scan).
+            # Large reports are scanned through a memory map, never loaded.
+            if stat.st_size >= STREAMING_THRESHOLD:
+                research_file.content = ""
+                with open(research_file.path, "rb") as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    complete, completeness = scan_completion(mapped)
+            else:
+                research_file.content = research_file.path.read_text()
+                complete, completeness = scan_completion(research_file.content)
+            if complete:
                 research_file.status = FileStatus.COMPLETE
             elif self._is_file_stable(research_file):
                 # File hasn't changed and has reasonable content
-                if estimate_content_completeness(research_file.content) > 0.5:
+                if completeness > 0.5:
                     research_file.status = FileStatus.COMPLETE
                 else:
                     research_file.status = FileStatus.PARTIAL
@@ -173,45 +193,77 @@ class FileMonitor:
         age = time.time() - research_file.last_modified
         return age > self.stable_seconds
 
-    def wait_for_completion(self, poll_interval: float = 5.0) -> list[ResearchFile]:
+    def wait_for_completion(
+        self,
+        poll_interval: float = 1.0,
+        max_interval: float = 30.0,
+        scheduler: Optional[PollScheduler] = None,
+    ) -> list[ResearchFile]:
         """Wait for all expected agent files to be complete.
 
+        Polls with exponential backoff: the interval starts at
+        poll_interval, doubles while no file changes, and resets whenever a
+        file grows, is modified or changes status.
+
         Args:
-            poll_interval: Seconds between directory checks
+            poll_interval: Initial seconds between directory checks
+            max_interval: Upper bound on seconds between checks
+            scheduler: Optional pre-configured PollScheduler
 
         Returns:
             List of ResearchFile objects (complete or timed out)
         """
-        start_time = time.time()
+        if scheduler is None:
+            scheduler = PollScheduler(
+                timeout=self.timeout,
+                min_interval=poll_interval,
+                max_interval=max(poll_interval, max_interval),
+                agent_deadlines=self.agent_deadlines,
+            )
 
         print_progress(f"Waiting for {self.expected_agents} research files...")
 
+        previous: dict[Path, tuple] = {}
+
         while True:
             self.scan_existing()
 
-            # Check if all expected files are complete
+            # Any new, grown, touched or re-classified file counts as activity
+            current = {
+                f.path: (f.size, f.last_modified, f.status) for f in self.files
+            }
+            activity = current != previous
+            previous = current
+
+            for f in self.files:
+                if f.status == FileStatus.COMPLETE:
+                    scheduler.mark_complete(f.agent_number)
+
             complete_count = sum(
                 1 for f in self.files if f.status == FileStatus.COMPLETE
             )
 
-            elapsed = time.time() - start_time
             print_progress(
                 f"\rProgress: {complete_count}/{self.expected_agents} complete "
-                f"({elapsed:.0f}s elapsed)",
+                f"({scheduler.elapsed():.0f}s elapsed)",
                 end="",
             )
 
-            if complete_count >= self.expected_agents:
-                print_progress("")  # Newline
-                return self.files
+            outstanding = scheduler.outstanding(self.get_incomplete_agents())
+            if not outstanding or not scheduler.wait(activity, outstanding):
+                break
+
+        print_progress("")  # Newline
+        self.timed_out_agents = self.get_incomplete_agents()
+        self.poll_telemetry = scheduler.telemetry()
 
-            # Check timeout
-            if elapsed > self.timeout:
-                print_progress("")  # Newline
-                print_warning(f"Timeout after {self.timeout}s")
-                return self.files
+        if self.timed_out_agents:
+            print_warning(
+                f"Timeout after {scheduler.elapsed():.0f}s waiting for agents "
+                f"{self.timed_out_agents}"
+            )
 
-            time.sleep(poll_interval)
+        return self.files
 
     def get_missing_agents(self) -> list[int]:
         """Get list of agent numbers without files."""
@@ -258,6 +310,8 @@ class FileMonitor:
             "errors": len(errors),
             "missing_agents": self.get_missing_agents(),
             "incomplete_agents": self.get_incomplete_agents(),
+            "timed_out_agents": self.timed_out_agents,
+            "polling": self.poll_telemetry,
         }
 
 
@@ -280,14 +334,24 @@ def wait_for_files(
     inquiry_path: Path,
     expected_agents: int,
     timeout: int = 300,
-    poll_interval: float = 5.0,
+    poll_interval: float = 1.0,
+    max_interval: float = 30.0,
+    agent_deadlines: Optional[dict[int, float]] = None,
 ) -> tuple[list[ResearchFile], dict]:
     """Wait for files to be complete.
 
     Returns:
         Tuple of (files, summary)
     """
-    monitor = FileMonitor(inquiry_path, expected_agents, timeout=timeout)
-    files = monitor.wait_for_completion(poll_interval=poll_interval)
+    monitor = FileMonitor(
+        inquiry_path,
+        expected_agents,
+        timeout=timeout,
+        agent_deadlines=agent_deadlines,
+    )
+    files = monitor.wait_for_completion(
+        poll_interval=poll_interval,
+        max_interval=max_interval,
+    )
     summary = monitor.get_completion_summary()
     return files, summary
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""In-process stand-in for the ccmux MCP server.
+
+LocalCcmuxServer keeps panes in memory and answers list_panes, get_status
+and read_pane with the same response shapes as the ccmux MCP tools, so
+CcmuxMonitor can be exercised without a running ccmux. It counts calls,
+which makes the round-trips of a monitoring cycle measurable.
+
+Usage:
+    python local_ccmux.py --agents 50 --cycles 10
+"""
+
+import argparse
+import json
+import random
+import sys
+from dataclasses import dataclass, field
+
+try:
+    from .ccmux_monitor import CcmuxMonitor
+except ImportError:
+    from ccmux_monitor import CcmuxMonitor
+
+
+@dataclass
+class LocalPane:
+    """A simulated ccmux pane."""
+    pane_id: str
+    session_id: str
+    name: str
+    tags: list[str] = field(default_factory=list)
+    status: str = "working"
+    lines: list[str] = field(default_factory=list)
+
+
+class LocalCcmuxServer:
+    """Minimal in-memory ccmux server for development and testing."""
+
+    def __init__(self):
+        """Initialize server with no panes."""
+        self.panes: dict[str, LocalPane] = {}
+        self.calls: dict[str, int] = {"list_panes": 0, "get_status": 0, "read_pane": 0}
+
+    def add_pane(self, pane_id: str, name: str, tags: list[str], status: str = "working") -> LocalPane:
+        """Create a pane.
+
+        Args:
+            pane_id: Pane identifier
+            name: Pane name (e.g. "inquiry-INQ-001-agent-1")
+            tags: Pane tags (e.g. ["inquiry-INQ-001", "agent-1"])
+            status: Initial ccmux status
+
+        Returns:
+            The created pane
+        """
+        pane = LocalPane(
+            pane_id=pane_id,
+            session_id=f"session-{pane_id}",
+            name=name,
+            tags=list(tags),
+            status=status,
+        )
+        self.panes[pane_id] = pane
+        return pane
+
+    def write(self, pane_id: str, text: str) -> None:
+        """Append output text to a pane."""
+        self.panes[pane_id].lines.extend(text.splitlines())
+
+    def set_status(self, pane_id: str, status: str) -> None:
+        """Set a pane's ccmux status."""
+        self.panes[pane_id].status = status
+
+    def list_panes(self) -> dict:
+        """Equivalent of ccmux_list_panes: every pane with its status."""
+        self.calls["list_panes"] += 1
+        return {
+            "panes": [
+                {
+                    "pane_id": p.pane_id,
+                    "session_id": p.session_id,
+                    "name": p.name,
+                    "tags": list(p.tags),
+                    "status": p.status,
+                }
+                for p in self.panes.values()
+            ]
+        }
+
+    def get_status(self, pane_id: str) -> dict:
+        """Equivalent of ccmux_get_status for one pane."""
+        self.calls["get_status"] += 1
+        pane = self.panes.get(pane_id)
+        if pane is None:
+            return {"error": f"Unknown pane: {pane_id}"}
+        return {"pane_id": pane_id, "status": pane.status}
+
+    def read_pane(self, pane_id: str, lines: int = 2000, offset: int = None) -> dict:
+        """Equivalent of ccmux_read_pane.
+
+        Without offset, returns the last `lines` lines. With offset, returns
+        up to `lines` lines starting at that line and the cursor for the
+        next read.
+        """
+        self.calls["read_pane"] += 1
+        pane = self.panes.get(pane_id)
+        if pane is None:
+            return {"error": f"Unknown pane: {pane_id}"}
+
+        if offset is None:
+            chunk = pane.lines[-lines:] if lines else []
+            next_offset = len(pane.lines)
+        else:
+            chunk = pane.lines[offset:offset + lines]
+            next_offset = offset + len(chunk)
+
+        return {
+            "pane_id": pane_id,
+            "output": "\n".join(chunk),
+            "next_offset": next_offset,
+            "total_lines": len(pane.lines),
+        }
+
+    def total_calls(self) -> int:
+        """Total number of tool calls served."""
+        return sum(self.calls.values())
+
+
+def simulate(agents: int, cycles: int, seed: int = 1, follow: bool = False) -> dict:
+    """Run a simulated inquiry and compare per-pane and batched polling.
+
+    Each cycle every agent writes a few lines; agents finish at random
+    cycles by writing a conclusion. Per-pane polling is the previous
+    workflow (get_status plus a full read for every pane each cycle).
+
+    Returns:
+        Round-trip and transferred-line totals for both strategies
+    """
+    rng = random.Random(seed)
+    inquiry_id = "INQ-SIM"
+    server = LocalCcmuxServer()
+    finish_at = {}
+    for n in range(1, agents + 1):
+        pane_id = f"pane-{n}"
+        server.add_pane(pane_id, f"inquiry-{inquiry_id}-agent-{n}", [f"inquiry-{inquiry_id}", f"agent-{n}"])
+        finish_at[pane_id] = rng.randint(1, cycles)
+
+    monitor = CcmuxMonitor(inquiry_id, expected_agents=agents)
+    monitor.parse_sessions_response(server.list_panes())
+    server.calls = dict.fromkeys(server.calls, 0)
+
+    naive_calls = 0
+    naive_lines = 0
+    batched_lines = 0
+
+    for cycle in range(1, cycles + 1):
+        for pane_id, pane in server.panes.items():
+            if pane.status != "working":
+                continue
+            server.write(pane_id, "\n".join(f"finding {cycle}.{i}" for i in range(20)))
+            if cycle >= finish_at[pane_id]:
+                server.write(pane_id, "## Conclusion\nDone.")
+                server.set_status(pane_id, "complete")
+
+        # Previous workflow: status and full read for every pane
+        naive_calls += 2 * len(server.panes)
+        naive_lines += sum(len(p.lines) for p in server.panes.values())
+
+        before = {s.pane_id: s.read_offset for s in monitor.sessions}
+        monitor.poll_once(server, follow=follow)
+        batched_lines += sum(s.read_offset - before[s.pane_id] for s in monitor.sessions)
+
+    return {
+        "agents": agents,
+        "cycles": cycles,
+        "complete": sum(1 for s in monitor.sessions if s.status.value == "complete"),
+        "per_pane": {"round_trips": naive_calls, "lines_read": naive_lines},
+        "batched": {"round_trips": server.total_calls(), "lines_read": batched_lines},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulate ccmux monitoring against a local stand-in server"
+    )
+    parser.add_argument("--agents", type=int, default=50, help="Number of simulated agents")
+    parser.add_argument("--cycles", type=int, default=10, help="Number of polling cycles")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument("--follow", action="store_true", help="Also read working panes every cycle")
+    args = parser.parse_args()
+
+    if args.agents < 1 or args.cycles < 1:
+        print("Error: --agents and --cycles must be positive", file=sys.stderr)
+        sys.exit(1)
+
+    print(json.dumps(simulate(args.agents, args.cycles, args.seed, args.follow), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Adaptive polling schedule shared by the inquiry monitors.
+
+Instead of sleeping a fixed interval for the whole timeout, PollScheduler
+starts with a short interval and backs off exponentially (with jitter)
+while nothing happens. Any observed activity, such as a research file
+growing or a pane changing status, resets the interval to the minimum, so
+quickly finishing agents are noticed quickly and long-running agents are
+not polled needlessly.
+
+Agents may have individual deadlines on top of the overall timeout, and
+the scheduler records timing telemetry for the collection report.
+"""
+
+import random
+import time
+from typing import Callable, Hashable, Iterable, Optional
+
+
+class PollScheduler:
+    """Exponential backoff polling schedule with jitter and deadlines."""
+
+    def __init__(
+        self,
+        timeout: float = 300,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        factor: float = 2.0,
+        jitter: float = 0.1,
+        agent_deadlines: Optional[dict[Hashable, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        seed: Optional[int] = None,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            timeout: Overall timeout in seconds
+            min_interval: Interval after activity (and the first interval)
+            max_interval: Upper bound on the backoff interval
+            factor: Multiplier applied to the interval after an idle poll
+            jitter: Fraction of the interval added or removed at random
+            agent_deadlines: Agent -> seconds after start before that agent
+                is considered timed out (defaults to the overall timeout)
+            clock: Monotonic clock, replaceable for simulation
+            sleep: Sleep function, replaceable for simulation
+            seed: Seed for the jitter generator
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Require 0 < min_interval <= max_interval")
+        if factor < 1:
+            raise ValueError("Backoff factor must be >= 1")
+
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.factor = factor
+        self.jitter = jitter
+        self.agent_deadlines = dict(agent_deadlines or {})
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = random.Random(seed)
+
+        self.started = clock()
+        self.interval = min_interval
+        self.polls = 0
+        self.active_polls = 0
+        self.slept = 0.0
+        self.first_activity: Optional[float] = None
+        self.completed_at: dict[Hashable, float] = {}
+
+    def elapsed(self) -> float:
+        """Seconds since the scheduler was created."""
+        return self._clock() - self.started
+
+    def timed_out(self) -> bool:
+        """Whether the overall timeout has passed."""
+        return self.elapsed() >= self.timeout
+
+    def deadline_for(self, agent: Hashable) -> float:
+        """Deadline of an agent in seconds after start."""
+        return min(self.agent_deadlines.get(agent, self.timeout), self.timeout)
+
+    def expired(self, agent: Hashable) -> bool:
+        """Whether an agent has passed its deadline."""
+        return self.elapsed() >= self.deadline_for(agent)
+
+    def outstanding(self, agents: Iterable[Hashable]) -> list[Hashable]:
+        """Agents from the given iterable that are still within their deadline."""
+        return [a for a in agents if not self.expired(a)]
+
+    def mark_complete(self, agent: Hashable) -> None:
+        """Record the time at which an agent was first seen complete."""
+        self.completed_at.setdefault(agent, round(self.elapsed(), 3))
+
+    def record(self, activity: bool) -> float:
+        """Record the outcome of a poll and compute the next interval.
+
+        Args:
+            activity: Whether the poll observed any change
+
+        Returns:
+            Interval (seconds) before the next poll, jitter applied
+        """
+        self.polls += 1
+        if activity:
+            self.active_polls += 1
+            if self.first_activity is None:
+                self.first_activity = self.elapsed()
+            self.interval = self.min_interval
+        elif self.polls > 1:
+            self.interval = min(self.interval * self.factor, self.max_interval)
+
+        spread = self.interval * self.jitter
+        return max(0.0, self.interval + self._rng.uniform(-spread, spread))
+
+    def wait(self, activity: bool, agents: Iterable[Hashable] = ()) -> bool:
+        """Record a poll and sleep until the next one.
+
+        The sleep never overshoots the overall timeout or the earliest
+        deadline among the given outstanding agents.
+
+        Args:
+            activity: Whether the poll observed any change
+            agents: Agents still being waited for
+
+        Returns:
+            False if the timeout has passed and polling should stop
+        """
+        delay = self.record(activity)
+        elapsed = self.elapsed()
+
+        horizon = self.timeout
+        for agent in agents:
+            deadline = self.deadline_for(agent)
+            if deadline > elapsed:
+                horizon = min(horizon, deadline)
+
+        delay = min(delay, max(0.0, horizon - elapsed))
+        if elapsed >= self.timeout:
+            return False
+
+        self._sleep(delay)
+        self.slept += delay
+        return True
+
+    def telemetry(self) -> dict:
+        """Timing statistics for the polling run."""
+        return {
+            "elapsed": round(self.elapsed(), 3),
+            "polls": self.polls,
+            "active_polls": self.active_polls,
+            "slept": round(self.slept, 3),
+            "mean_interval": round(self.slept / self.polls, 3) if self.polls else 0.0,
+            "first_activity": (
+                round(self.first_activity, 3) if self.first_activity is not None else None
+            ),
+            "completed_at": dict(self.completed_at),
+        }
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""Near-duplicate clustering of findings for the summarizer.
+
+Two similarity engines are available, both built once over the whole
+corpus of texts (finding sentences and recommendation stances):
+
+- ``minhash`` (default): each text is reduced to a set of word shingles
+  and MinHash signatures are bucketed with LSH banding, so only texts that
+  share a band are ever compared. Candidates are verified with exact
+  Jaccard similarity. Near-linear in the number of texts.
+- ``tfidf``: one sparse TF-IDF matrix over all texts and a single
+  vectorized cosine-similarity product. Uses NumPy (and SciPy sparse
+  matrices when installed), falling back to pure-Python sparse vectors.
+
+Similar pairs from different agents are merged into clusters with
+union-find.
+"""
+
+import hashlib
+import math
+import random
+import re
+from collections import Counter, defaultdict
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+BACKENDS = ("minhash", "tfidf")
+
+# Mersenne prime used for universal hashing of shingle hashes
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Words that carry no topical signal and inflate sentence overlap
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "been", "but", "by", "can",
+    "for", "from", "has", "have", "in", "is", "it", "its", "of", "on", "or",
+    "that", "the", "this", "to", "was", "we", "were", "which", "while",
+    "will", "with",
+})
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences and list items."""
+    parts = re.split(r"(?<=[.!?])\s+|\n+", text)
+    sentences = []
+    for part in parts:
+        # Strip list markers and emphasis
+        part = re.sub(r"^\s*(?:[-*+]|\d+[.)])\s+", "", part)
+        part = part.replace("**", "").strip()
+        if part:
+            sentences.append(part)
+    return sentences
+
+
+def shingle_tokens(text: str) -> list[str]:
+    """Reduce text to its normalized content words, in order."""
+    words = re.findall(r"\w+", text.lower())
+    return [w for w in words if w not in STOPWORDS]
+
+
+def shingle(text: str) -> frozenset[str]:
+    """Reduce text to its set of normalized content words."""
+    return frozenset(shingle_tokens(text))
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    """Exact Jaccard similarity of two shingle sets."""
+    if not a or not b:
+        return 0.0
+    intersection = len(a & b)
+    return intersection / (len(a) + len(b) - intersection)
+
+
+class MinHasher:
+    """Compute fixed-length MinHash signatures for shingle sets."""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        """Initialize hasher.
+
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            seed: Seed for the permutation coefficients
+        """
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._perms = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+            for _ in range(num_perm)
+        ]
+        self._token_hashes: dict[str, int] = {}
+
+    def _hash_token(self, token: str) -> int:
+        value = self._token_hashes.get(token)
+        if value is None:
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            self._token_hashes[token] = value
+        return value
+
+    def signature(self, shingles: Iterable[str]) -> tuple[int, ...]:
+        """Return the MinHash signature of a shingle set."""
+        hashes = [self._hash_token(s) for s in shingles]
+        if not hashes:
+            return (_MAX_HASH,) * self.num_perm
+        return tuple(
+            min((a * h + b) % _PRIME for h in hashes) & _MAX_HASH
+            for a, b in self._perms
+        )
+
+
+class LSHIndex:
+    """Locality-sensitive hashing over MinHash signatures using banding."""
+
+    def __init__(self, bands: int, rows: int):
+        """Initialize index.
+
+        Args:
+            bands: Number of bands the signature is split into
+            rows: Signature values per band (bands * rows == num_perm)
+        """
+        self.bands = bands
+        self.rows = rows
+        self._buckets: list[dict[tuple, list[int]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+
+    def add(self, item_id: int, signature: tuple[int, ...]) -> None:
+        """Insert an item's signature into every band bucket."""
+        for band in range(self.bands):
+            start = band * self.rows
+            key = signature[start:start + self.rows]
+            self._buckets[band][key].append(item_id)
+
+    def candidate_pairs(self) -> set[tuple[int, int]]:
+        """Return all item pairs that share at least one band bucket."""
+        pairs = set()
+        for buckets in self._buckets:
+            for members in buckets.values():
+                if len(members) < 2:
+                    continue
+                for i, first in enumerate(members):
+                    for second in members[i + 1:]:
+                        pairs.add((first, second) if first < second else (second, first))
+        return pairs
+
+
+class MinHashEngine:
+    """Jaccard similarity over word shingles with MinHash/LSH candidates."""
+
+    # Minimum Jaccard similarity for two texts to be considered similar
+    DEFAULT_THRESHOLD = 0.3
+
+    def __init__(self, texts: list[str], num_perm: int = 64, bands: int = 32):
+        """Initialize engine.
+
+        Args:
+            texts: Corpus of texts; later calls refer to them by index
+            num_perm: MinHash signature length
+            bands: LSH bands; more bands lowers the candidate threshold
+        """
+        hasher = MinHasher(num_perm=num_perm)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingles = [shingle(text) for text in texts]
+        self.signatures = [
+            hasher.signature(s) if s else None for s in self.shingles
+        ]
+
+    def similarity(self, first: int, second: int) -> float:
+        """Exact Jaccard similarity of two texts."""
+        return jaccard(self.shingles[first], self.shingles[second])
+
+    def similar_pairs(self, ids: list[int], threshold: float) -> list[tuple[int, int]]:
+        """Return pairs of text indices in ids at or above threshold."""
+        index = LSHIndex(bands=self.bands, rows=self.rows)
+        for i in ids:
+            if self.signatures[i] is not None:
+                index.add(i, self.signatures[i])
+
+        return [
+            (first, second)
+            for first, second in index.candidate_pairs()
+            if self.similarity(first, second) >= threshold
+        ]
+
+
+class TfidfEngine:
+    """Cosine similarity over a TF-IDF matrix built once for the corpus."""
+
+    # Minimum cosine similarity for two texts to be considered similar
+    DEFAULT_THRESHOLD = 0.5
+
+    def __init__(self, texts: list[str]):
+        """Initialize engine.
+
+        Args:
+            texts: Corpus of texts; later calls refer to them by index
+        """
+        token_counts = [Counter(shingle_tokens(text)) for text in texts]
+
+        doc_freq: Counter = Counter()
+        for counts in token_counts:
+            doc_freq.update(counts.keys())
+
+        n_docs = len(texts)
+        self.vocabulary = {token: i for i, token in enumerate(sorted(doc_freq))}
+        idf = {
+            token: math.log((1 + n_docs) / (1 + df)) + 1.0
+            for token, df in doc_freq.items()
+        }
+
+        # L2-normalized sparse rows: list of {column: weight}
+        self._rows: list[dict[int, float]] = []
+        for counts in token_counts:
+            row = {self.vocabulary[t]: c * idf[t] for t, c in counts.items()}
+            norm = math.sqrt(sum(w * w for w in row.values()))
+            if norm:
+                row = {col: w / norm for col, w in row.items()}
+            self._rows.append(row)
+
+        self._matrix = self._build_matrix() if np is not None else None
+
+    def _build_matrix(self):
+        data, indices, indptr = [], [], [0]
+        for row in self._rows:
+            indices.extend(row.keys())
+            data.extend(row.values())
+            indptr.append(len(indices))
+
+        shape = (len(self._rows), len(self.vocabulary))
+        if sparse is not None:
+            return sparse.csr_matrix(
+                (np.asarray(data, dtype=np.float64), indices, indptr), shape=shape
+            )
+
+        dense = np.zeros(shape, dtype=np.float64)
+        for i, row in enumerate(self._rows):
+            if row:
+                dense[i, list(row.keys())] = list(row.values())
+        return dense
+
+    def similarity(self, first: int, second: int) -> float:
+        """Cosine similarity of two texts."""
+        a, b = self._rows[first], self._rows[second]
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(w * b.get(col, 0.0) for col, w in a.items())
+
+    def similarity_matrix(self, ids: list[int]):
+        """Full cosine-similarity matrix for the texts in ids.
+
+        Returns a NumPy array when NumPy is available, otherwise a list
+        of lists.
+        """
+        if self._matrix is not None:
+            sub = self._matrix[ids]
+            product = sub @ sub.T
+            return product.toarray() if sparse is not None else product
+
+        return [[self.similarity(i, j) for j in ids] for i in ids]
+
+    def similar_pairs(self, ids: list[int], threshold: float) -> list[tuple[int, int]]:
+        """Return pairs of text indices in ids at or above threshold."""
+        if not ids:
+            return []
+
+        if self._matrix is not None:
+            sub = self._matrix[ids]
+            if sparse is not None:
+                # Threshold the sparse product directly; no dense n x n array
+                upper = sparse.triu(sub @ sub.T, k=1).tocoo()
+                keep = upper.data >= threshold
+                rows, cols = upper.row[keep], upper.col[keep]
+                order = np.lexsort((cols, rows))
+                rows, cols = rows[order], cols[order]
+            else:
+                rows, cols = np.nonzero(sub @ sub.T >= threshold)
+                upper = rows < cols
+                rows, cols = rows[upper], cols[upper]
+            return [(ids[r], ids[c]) for r, c in zip(rows.tolist(), cols.tolist())]
+
+        # Pure-Python fallback: accumulate dot products through an inverted
+        # index so only texts sharing a term are ever multiplied
+        postings: dict[int, list[tuple[int, float]]] = defaultdict(list)
+        for i in ids:
+            for col, weight in self._rows[i].items():
+                postings[col].append((i, weight))
+
+        dots: dict[tuple[int, int], float] = defaultdict(float)
+        for entries in postings.values():
+            for pos, (first, w1) in enumerate(entries):
+                for second, w2 in entries[pos + 1:]:
+                    dots[(first, second)] += w1 * w2
+
+        return [pair for pair, dot in dots.items() if dot >= threshold]
+
+
+def create_engine(texts: list[str], backend: str = "minhash"):
+    """Build a similarity engine over texts for the named backend."""
+    if backend == "minhash":
+        return MinHashEngine(texts)
+    if backend == "tfidf":
+        return TfidfEngine(texts)
+    raise ValueError(f"Unknown similarity backend: {backend}")
+
+
+def _find(parent: dict[int, int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_pairs(
+    groups: dict[int, str],
+    pairs: Iterable[tuple[int, int]],
+) -> list[list[int]]:
+    """Merge similar pairs into clusters with union-find.
+
+    Args:
+        groups: Text index -> group id (e.g. agent id) for every text
+        pairs: Similar (index, index) pairs
+
+    Returns:
+        Clusters (lists of text indices) spanning at least two groups,
+        largest first.
+    """
+    parent = {i: i for i in groups}
+    for first, second in pairs:
+        if groups[first] == groups[second]:
+            continue
+        parent[_find(parent, first)] = _find(parent, second)
+
+    clusters: dict[int, list[int]] = defaultdict(list)
+    for i in sorted(groups):
+        clusters[_find(parent, i)].append(i)
+
+    result = [
+        members for members in clusters.values()
+        if len({groups[i] for i in members}) >= 2
+    ]
+    result.sort(key=lambda members: len({groups[i] for i in members}), reverse=True)
+    return result
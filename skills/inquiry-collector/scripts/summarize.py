@@ -6,19 +6,26 @@ SUMMARY.md file that prepares for the synthesis phase.
 """
 
 import re
+from bisect import bisect_right
 from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 try:
-    from .extract import AgentResearch
+    from .extract import AgentResearch, iter_file_lines
+    from .similarity import cluster_pairs, create_engine, split_sentences
     from .utils import get_timestamp, parse_markdown_sections
 except ImportError:
-    from extract import AgentResearch
+    from extract import AgentResearch, iter_file_lines
+    from similarity import cluster_pairs, create_engine, split_sentences
     from utils import get_timestamp, parse_markdown_sections
 
 
+# Bump when summary output changes so cached summaries are invalidated
+SUMMARIZER_VERSION = "5"
+
+
 @dataclass
 class ThemeOccurrence:
     """A theme found across multiple agents."""
@@ -51,27 +58,55 @@ class ResearchSummary:
     agent_summaries: list[dict] = field(default_factory=list)
 
 
+# Keywords that often indicate themes
+THEME_INDICATORS = [
+    "important", "key", "critical", "essential", "significant",
+    "recommend", "suggest", "should", "must", "need",
+    "finding", "conclusion", "result", "evidence",
+]
+
+_SENTENCE_SPLIT = re.compile(r"[.!?]\s+")
+
+# One scanner for every indicator word, plus the phrase that follows it
+# (up to , ; : or the end of the sentence, never crossing a line break).
+# Both are compiled once; _extract_key_phrases never builds a regex per hit.
+_INDICATOR_PATTERN = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, THEME_INDICATORS)) + r")(?=\s)"
+)
+_PHRASE_PATTERN = re.compile(r"\s+(?:that\s+)?([^,;:\n]+)(?:[,;:]|$)")
+
+
 class Summarizer:
     """Analyze research reports and generate summary."""
 
-    # Keywords that often indicate themes
-    THEME_INDICATORS = [
-        "important", "key", "critical", "essential", "significant",
-        "recommend", "suggest", "should", "must", "need",
-        "finding", "conclusion", "result", "evidence",
-    ]
+    THEME_INDICATORS = THEME_INDICATORS
 
-    def __init__(self, inquiry_id: str, inquiry_title: str = ""):
+    def __init__(
+        self,
+        inquiry_id: str,
+        inquiry_title: str = "",
+        similarity_backend: str = "minhash",
+    ):
         """Initialize summarizer.
 
         Args:
             inquiry_id: The inquiry ID (e.g., INQ-001)
             inquiry_title: Optional title for the inquiry
+            similarity_backend: Engine for agreement/divergence matching,
+                "minhash" or "tfidf" (see similarity.py)
         """
         self.inquiry_id = inquiry_id
         self.inquiry_title = inquiry_title
+        self.similarity_backend = similarity_backend
         self.reports: list[AgentResearch] = []
 
+        # Populated by _build_similarity_index()
+        self._engine = None
+        self._corpus_agents: dict[int, str] = {}  # corpus index -> agent_id
+        self._finding_ids: list[int] = []
+        self._stance_ids: dict[str, int] = {}  # agent_id -> corpus index
+        self._corpus: list[str] = []
+
     def add_report(self, report: AgentResearch) -> None:
         """Add a research report to analyze."""
         self.reports.append(report)
@@ -86,6 +121,7 @@ class Summarizer:
         )
 
         # Extract and analyze themes
+        self._build_similarity_index()
         summary.common_themes = self._find_common_themes()
         summary.agreements = self._find_agreements()
         summary.divergences = self._find_divergences()
@@ -124,72 +160,137 @@ class Summarizer:
     def _extract_key_phrases(self, report: AgentResearch) -> list[tuple[str, str]]:
         """Extract key phrases from a report.
 
+        Scans the report's full text: when streamed extraction truncated
+        raw_content, the source file is re-streamed and scanned a run of
+        complete sentences at a time (see _scan_key_phrases), which gives
+        the same phrases as scanning the whole text at once.
+
         Returns list of (phrase, context_excerpt) tuples.
         """
-        phrases = []
-        content = report.raw_content.lower()
+        phrases: list[tuple[str, str]] = []
+        source = report.metadata.get("source_path")
+        if not (report.metadata.get("raw_content_truncated") and source and Path(source).is_file()):
+            self._scan_key_phrases(report.raw_content.lower(), phrases)
+            return phrases
+
+        buffer = ""
+        for line in iter_file_lines(Path(source)):
+            # Earlier text holds no boundary except one that ends the buffer
+            search_from = max(0, len(buffer.rstrip()) - 1)
+            buffer += line.lower()
+            # Cut after the last sentence boundary that cannot grow further
+            cut = 0
+            for boundary in _SENTENCE_SPLIT.finditer(buffer, search_from):
+                if boundary.end() < len(buffer):
+                    cut = boundary.end()
+            if cut:
+                self._scan_key_phrases(buffer[:cut], phrases)
+                buffer = buffer[cut:]
+        self._scan_key_phrases(buffer, phrases)
+        return phrases
 
-        # Split into sentences
-        sentences = re.split(r"[.!?]\s+", content)
+    @staticmethod
+    def _scan_key_phrases(content: str, phrases: list[tuple[str, str]]) -> None:
+        """Append the key phrases of lowercased text made of whole sentences.
 
-        for sentence in sentences:
-            # Look for theme indicator keywords
-            for indicator in self.THEME_INDICATORS:
-                if indicator in sentence:
-                    # Extract the key noun phrase
-                    key_phrase = self._extract_noun_phrase(sentence, indicator)
-                    if key_phrase and len(key_phrase) > 5:
-                        phrases.append((key_phrase, sentence[:200]))
+        A single precompiled pattern finds every indicator in one scan over
+        the content; the phrase after each hit is read with a second
+        precompiled pattern bounded to the enclosing sentence.
+        """
+        # Sentence boundaries, then one scan for every indicator occurrence
+        starts, ends = [0], []
+        for boundary in _SENTENCE_SPLIT.finditer(content):
+            ends.append(boundary.start())
+            starts.append(boundary.end())
+        ends.append(len(content))
+
+        seen = set()  # (sentence index, indicator)
+        for match in _INDICATOR_PATTERN.finditer(content):
+            idx = bisect_right(starts, match.start()) - 1
+            # Only the first occurrence of each indicator per sentence
+            key = (idx, match.group(0))
+            if key in seen:
+                continue
+
+            phrase_match = _PHRASE_PATTERN.match(content, match.end(), ends[idx])
+            if not phrase_match:
+                continue
+            seen.add(key)
+
+            # Extract the key noun phrase: words up to punctuation
+            key_phrase = " ".join(phrase_match.group(1).split())[:100]
+            if len(key_phrase) > 5:
+                excerpt = content[starts[idx]:min(ends[idx], starts[idx] + 200)]
+                phrases.append((key_phrase, excerpt))
+
+    def _build_similarity_index(self) -> None:
+        """Build one similarity engine over all findings and recommendations.
+
+        Finding sentences and recommendation stances share a corpus so the
+        engine (and, for TF-IDF, its vocabulary and IDF weights) is built once.
+        """
+        self._corpus = []
+        self._corpus_agents = {}
+        self._finding_ids = []
+        self._stance_ids = {}
 
-        return phrases
+        for report in self.reports:
+            if report.key_findings:
+                for sentence in split_sentences(report.key_findings):
+                    self._finding_ids.append(len(self._corpus))
+                    self._corpus_agents[len(self._corpus)] = report.agent_id
+                    self._corpus.append(sentence)
 
-    def _extract_noun_phrase(self, sentence: str, indicator: str) -> Optional[str]:
-        """Extract noun phrase near an indicator word."""
-        # Simple extraction: words after indicator up to punctuation
-        pattern = rf"{indicator}\s+(?:that\s+)?(.+?)(?:[,;:]|$)"
-        match = re.search(pattern, sentence)
-        if match:
-            phrase = match.group(1).strip()
-            # Clean up
-            phrase = re.sub(r"\s+", " ", phrase)
-            return phrase[:100]  # Limit length
-        return None
+        for report in self.reports:
+            if report.recommendations:
+                self._stance_ids[report.agent_id] = len(self._corpus)
+                self._corpus_agents[len(self._corpus)] = report.agent_id
+                self._corpus.append(self._extract_stance(report.recommendations))
+
+        self._engine = create_engine(self._corpus, self.similarity_backend)
 
     def _find_agreements(self) -> list[ThemeOccurrence]:
-        """Find points where agents agree."""
-        agreements = []
+        """Find points where agents agree.
 
-        # Compare key findings across agents
-        findings = {}
-        for report in self.reports:
-            if report.key_findings:
-                # Normalize and compare
-                normalized = self._normalize_text(report.key_findings)
-                for existing_norm, (theme, agents) in list(findings.items()):
-                    similarity = self._text_similarity(normalized, existing_norm)
-                    if similarity > 0.3:  # 30% similarity threshold
-                        agents.append(report.agent_id)
-                        break
-                else:
-                    # New finding
-                    findings[normalized] = (report.key_findings[:200], [report.agent_id])
-
-        # Filter to multi-agent agreements
-        for normalized, (original, agents) in findings.items():
-            if len(agents) >= 2:
-                agreements.append(ThemeOccurrence(
-                    theme=original,
-                    agent_ids=agents,
-                ))
+        Key findings are compared sentence by sentence; similar sentences
+        from different agents are clustered by the similarity engine so the
+        cost stays near-linear (MinHash/LSH) or a single matrix product
+        (TF-IDF) rather than a Python loop over every pair.
+        """
+        threshold = self._engine.DEFAULT_THRESHOLD
+        pairs = self._engine.similar_pairs(self._finding_ids, threshold)
+        groups = {i: self._corpus_agents[i] for i in self._finding_ids}
 
-        return agreements
+        agreements = []
+        for cluster in cluster_pairs(groups, pairs):
+            agent_ids = []
+            excerpts = []
+            for i in cluster:
+                if groups[i] not in agent_ids:
+                    agent_ids.append(groups[i])
+                    excerpts.append(self._corpus[i][:200])
+
+            agreements.append(ThemeOccurrence(
+                theme=self._corpus[cluster[0]][:200],
+                agent_ids=agent_ids,
+                excerpts=excerpts,
+            ))
+
+        return agreements[:10]  # Top 10 agreements
 
     def _find_divergences(self) -> list[Divergence]:
-        """Find points where agents disagree."""
+        """Find points where agents disagree.
+
+        Stances that the similarity engine considers equivalent are merged
+        into a single position, so only genuinely different stances count
+        as divergence.
+        """
         divergences = []
+        threshold = self._engine.DEFAULT_THRESHOLD
 
         # Compare recommendations
-        recommendations = {}
+        recommendations = {}  # rec_type -> {stance: agent_ids}
+        stance_reps = {}  # rec_type -> [(stance, corpus index)]
         for report in self.reports:
             if report.recommendations:
                 # Extract recommendation type
@@ -197,8 +298,17 @@ class Summarizer:
                 if rec_type:
                     if rec_type not in recommendations:
                         recommendations[rec_type] = {}
+                        stance_reps[rec_type] = []
+
+                    stance_id = self._stance_ids[report.agent_id]
+                    stance = self._corpus[stance_id]
+                    for existing, existing_id in stance_reps[rec_type]:
+                        if self._engine.similarity(stance_id, existing_id) >= threshold:
+                            stance = existing
+                            break
+                    else:
+                        stance_reps[rec_type].append((stance, stance_id))
 
-                    stance = self._extract_stance(report.recommendations)
                     if stance not in recommendations[rec_type]:
                         recommendations[rec_type][stance] = []
                     recommendations[rec_type][stance].append(report.agent_id)
@@ -238,26 +348,6 @@ class Summarizer:
         sentence = re.split(r"[.!?]", text)[0]
         return sentence[:100].strip()
 
-    def _normalize_text(self, text: str) -> str:
-        """Normalize text for comparison."""
-        text = text.lower()
-        text = re.sub(r"[^\w\s]", "", text)
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
-
-    def _text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate simple word-based similarity."""
-        words1 = set(text1.split())
-        words2 = set(text2.split())
-
-        if not words1 or not words2:
-            return 0.0
-
-        intersection = words1 & words2
-        union = words1 | words2
-
-        return len(intersection) / len(union)
-
     def _generate_synthesis_questions(self, summary: ResearchSummary) -> list[str]:
         """Generate questions for the synthesis phase."""
         questions = []
@@ -1,14 +1,29 @@
 #!/usr/bin/env python3
 """Shared utilities for inquiry-collector skill."""
 
-import json
+import io
 import logging
 import os
 import re
+import runpy
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+# Modules shared with the inquiry skill are loaded from it by file path
+INQUIRY_SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "inquiry" / "scripts"
+SKILL_MODULES_PATH = Path(__file__).resolve().parent.parent.parent / "_shared" / "skill_modules.py"
+load_module = runpy.run_path(str(SKILL_MODULES_PATH))["load_module"]
+
+
+def load_inquiry_module(name: str):
+    """Load a standard-library-only module from skills/inquiry/scripts by path."""
+    return load_module(f"inquiry_{name}", INQUIRY_SCRIPTS_DIR / f"{name}.py")
+
+
+inquiry_registry = load_inquiry_module("inquiry_registry")
+phase_journal = load_inquiry_module("phase_journal")
 
 # Configure logging
 logging.basicConfig(
@@ -22,56 +37,37 @@ logger = logging.getLogger(__name__)
 def find_inquiry_path(inquiry_id: str, base_path: Optional[Path] = None) -> Optional[Path]:
     """Find the inquiry directory by ID.
 
-    Searches for directories matching INQ-XXX pattern in:
-    1. Provided base_path
-    2. ./inquiries/
-    3. ./feature-management/inquiries/
+    Resolves the ID through the inquiry registry of, in order:
+    1. ./inquiries/
+    2. ./feature-management/inquiries/
+    3. The base directory itself
     """
     if base_path is None:
         base_path = Path.cwd()
 
-    # Normalize inquiry ID format
-    if not inquiry_id.upper().startswith("INQ-"):
-        inquiry_id = f"INQ-{inquiry_id}"
-    inquiry_id = inquiry_id.upper()
-
-    # Search paths in order of preference
-    search_paths = [
-        base_path / "inquiries",
-        base_path / "feature-management" / "inquiries",
-        base_path,
-    ]
-
-    for search_path in search_paths:
-        if not search_path.exists():
-            continue
-
-        # Look for directory starting with inquiry_id
-        for item in search_path.iterdir():
-            if item.is_dir() and item.name.upper().startswith(inquiry_id):
-                return item
-
-    return None
+    return inquiry_registry.find_inquiry_dir(
+        inquiry_id,
+        [
+            base_path / "inquiries",
+            base_path / "feature-management" / "inquiries",
+            base_path,
+        ],
+    )
 
 
 def load_inquiry_report(inquiry_path: Path) -> dict[str, Any]:
-    """Load and parse inquiry_report.json."""
+    """Load and parse inquiry_report.json, folding in pending journal events."""
     report_path = inquiry_path / "inquiry_report.json"
 
     if not report_path.exists():
         raise FileNotFoundError(f"inquiry_report.json not found in {inquiry_path}")
 
-    with open(report_path) as f:
-        return json.load(f)
+    return phase_journal.load_report(inquiry_path)
 
 
 def save_inquiry_report(inquiry_path: Path, report: dict[str, Any]) -> None:
-    """Save inquiry_report.json with proper formatting."""
-    report_path = inquiry_path / "inquiry_report.json"
-
-    with open(report_path, "w") as f:
-        json.dump(report, f, indent=2)
-        f.write("\n")
+    """Save inquiry_report.json with proper formatting (atomically)."""
+    phase_journal.write_report(inquiry_path, report)
 
 
 def update_inquiry_phase(
@@ -81,6 +77,10 @@ def update_inquiry_phase(
 ) -> dict[str, Any]:
     """Update inquiry phase and add to history.
 
+    The transition is only appended to the inquiry's phase journal;
+    inquiry_report.json is rewritten by (lazy) compaction, not on every
+    transition.
+
     Args:
         inquiry_path: Path to inquiry directory
         new_phase: New phase value
@@ -89,30 +89,15 @@ def update_inquiry_phase(
     Returns:
         Updated inquiry report
     """
-    report = load_inquiry_report(inquiry_path)
-
-    today = datetime.now().strftime("%Y-%m-%d")
-
-    # Add to phase history
-    if "phase_history" not in report:
-        report["phase_history"] = []
-
-    history_entry = {
-        "phase": new_phase,
-        "entered_date": today,
-    }
-    if notes:
-        history_entry["notes"] = notes
-
-    report["phase_history"].append(history_entry)
-
-    # Update current phase and status
-    report["phase"] = new_phase
-    report["status"] = new_phase
-    report["updated_date"] = today
+    if not (inquiry_path / "inquiry_report.json").exists():
+        raise FileNotFoundError(f"inquiry_report.json not found in {inquiry_path}")
 
-    save_inquiry_report(inquiry_path, report)
-    return report
+    report = load_inquiry_report(inquiry_path)
+    phase_journal.record_transition(
+        inquiry_path, new_phase, from_phase=report.get("phase"), notes=notes, source="inquiry-collector"
+    )
+    # Fold the new event from the journal tail; the report is not re-read
+    return phase_journal.apply_pending(inquiry_path, report)[0]
 
 
 def ensure_research_dir(inquiry_path: Path) -> Path:
@@ -140,78 +125,177 @@ def slugify(text: str) -> str:
     return text.strip("-")
 
 
-def parse_markdown_sections(content: str) -> dict[str, str]:
-    """Parse markdown content into sections by heading.
+HEADING_PATTERN = re.compile(r"^#{1,3}\s+(.+)$")
 
-    Returns dict mapping heading text to section content.
+
+def iter_markdown_sections(
+    lines: Iterable[str],
+    keep: Optional[Callable[[str], bool]] = None,
+    max_chars: Optional[int] = None,
+) -> Iterator[tuple[str, str]]:
+    """Stream markdown sections as (heading, content) pairs.
+
+    Lines are consumed one at a time, so the input can be a file object,
+    an mmap line iterator or any other iterable of lines. Only the current
+    section is buffered.
+
+    Args:
+        lines: Markdown lines (trailing newlines are ignored)
+        keep: Optional predicate on heading text; sections it rejects are
+            skipped without buffering their content
+        max_chars: Optional cap on buffered content per section
+
+    Yields:
+        (heading, stripped section content) for each kept section
     """
-    sections = {}
     current_heading = None
-    current_content = []
+    current_content: list[str] = []
+    buffered = 0
+    keeping = False
+
+    for line in lines:
+        line = line.rstrip("\n")
 
-    for line in content.split("\n"):
         # Check for heading (## or ###)
-        heading_match = re.match(r"^#{1,3}\s+(.+)$", line)
+        heading_match = HEADING_PATTERN.match(line)
 
         if heading_match:
-            # Save previous section
-            if current_heading is not None:
-                sections[current_heading] = "\n".join(current_content).strip()
+            # Emit previous section
+            if keeping:
+                yield current_heading, "\n".join(current_content).strip()
 
             current_heading = heading_match.group(1).strip()
             current_content = []
-        else:
+            buffered = 0
+            keeping = keep is None or keep(current_heading)
+        elif keeping:
+            if max_chars is not None:
+                if buffered >= max_chars:
+                    continue
+                line = line[:max_chars - buffered]
+                buffered += len(line) + 1
             current_content.append(line)
 
-    # Save last section
-    if current_heading is not None:
-        sections[current_heading] = "\n".join(current_content).strip()
+    # Emit last section
+    if keeping:
+        yield current_heading, "\n".join(current_content).strip()
 
-    return sections
 
+def parse_markdown_sections(content: str) -> dict[str, str]:
+    """Parse markdown content into sections by heading.
 
-def has_completion_marker(content: str) -> bool:
-    """Check if content has a completion marker.
+    Returns dict mapping heading text to section content.
+    """
+    return dict(iter_markdown_sections(io.StringIO(content)))
+
+
+# Reports at least this large are scanned and extracted straight from the
+# file (through mmap) instead of being read into one string
+STREAMING_THRESHOLD = 1024 * 1024
+
+# Completion markers, matched against lowercased text. Heading markers must
+# start a line; the pattern has no "^" anchor so the regex engine can skip
+# ahead to each "##" literal, and the line start is checked per match.
+_HEADING_MARKER = r"##\s+(?:conclusion|summary)"
+_HEADING_MARKER_TEXT = re.compile(_HEADING_MARKER)
+_HEADING_MARKER_BYTES = re.compile(_HEADING_MARKER.encode("ascii"))
+LITERAL_MARKERS = ("---end---", "**completed**")
+_LITERAL_MARKERS_BYTES = tuple(marker.encode("ascii") for marker in LITERAL_MARKERS)
+
+# Section keywords used to estimate how complete a report is
+EXPECTED_SECTIONS = (
+    "problem",
+    "approach",
+    "evidence",
+    "finding",
+    "recommendation",
+    "conclusion",
+)
+_SECTIONS_BYTES = tuple(section.encode("ascii") for section in EXPECTED_SECTIONS)
+
+SCAN_CHUNK_SIZE = 1024 * 1024
+
+
+def _has_heading_marker(pattern: re.Pattern, chunk, newline) -> bool:
+    for match in pattern.finditer(chunk):
+        start = match.start()
+        if start == 0 or chunk[start - 1:start] == newline:
+            return True
+    return False
+
+
+def scan_completion(content) -> tuple[bool, float]:
+    """Detect a completion marker and estimate completeness in one pass.
+
+    Works on str, bytes or an mmap. The content is scanned in chunks cut
+    at line boundaries; each chunk is lowercased once and checked for all
+    markers and section keywords, so no full lowercase copy of a large
+    report is made. Scanning stops early once a marker and every expected
+    section have been seen.
 
     Markers:
     - ## Conclusion section
     - ## Summary section
     - ---END--- marker
-    """
-    content_lower = content.lower()
+    - **COMPLETED** marker
 
-    markers = [
-        r"^##\s+conclusion",
-        r"^##\s+summary",
-        r"---end---",
-        r"\*\*completed\*\*",
-    ]
+    Args:
+        content: Report text (str), raw bytes, or an mmap of the file
 
-    for marker in markers:
-        if re.search(marker, content_lower, re.MULTILINE):
-            return True
+    Returns:
+        Tuple of (has completion marker, fraction of expected sections found)
+    """
+    if isinstance(content, str):
+        heading, literals, sections, newline = (
+            _HEADING_MARKER_TEXT, LITERAL_MARKERS, EXPECTED_SECTIONS, "\n"
+        )
+    else:
+        heading, literals, sections, newline = (
+            _HEADING_MARKER_BYTES, _LITERAL_MARKERS_BYTES, _SECTIONS_BYTES, b"\n"
+        )
+
+    has_marker = False
+    missing = list(sections)
+    tail = content[:0]
+    size = len(content)
+    pos = 0
+
+    while pos < size and (missing or not has_marker):
+        end = content.find(newline, min(pos + SCAN_CHUNK_SIZE, size))
+        end = size if end == -1 else end + 1
+        chunk = content[pos:end].lower()
+        pos = end
+
+        if missing:
+            missing = [s for s in missing if s not in chunk]
+        if not has_marker:
+            has_marker = (
+                any(marker in chunk for marker in literals)
+                # Re-check the previous chunk's last line with this chunk so
+                # a "##" whose title starts on the next line is still seen
+                or _has_heading_marker(heading, tail + chunk[:256], newline)
+                or _has_heading_marker(heading, chunk, newline)
+            )
+            # The whole line is kept: a cut inside it would pass for a line start
+            tail = chunk[chunk.rfind(newline, 0, len(chunk) - 1) + 1:]
+
+    return has_marker, (len(sections) - len(missing)) / len(sections)
+
+
+def has_completion_marker(content) -> bool:
+    """Check if content has a completion marker.
 
-    return False
+    See scan_completion() for the markers recognized.
+    """
+    return scan_completion(content)[0]
 
 
-def estimate_content_completeness(content: str) -> float:
+def estimate_content_completeness(content) -> float:
     """Estimate how complete a research report is (0.0 to 1.0).
 
     Checks for presence of expected sections.
     """
-    expected_sections = [
-        "problem",
-        "approach",
-        "evidence",
-        "finding",
-        "recommendation",
-        "conclusion",
-    ]
-
-    content_lower = content.lower()
-    found = sum(1 for section in expected_sections if section in content_lower)
-
-    return found / len(expected_sections)
+    return scan_completion(content)[1]
 
 
 def print_progress(message: str, end: str = "\n") -> None:
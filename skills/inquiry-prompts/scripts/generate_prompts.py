@@ -4,32 +4,48 @@ Generate research agent prompts from INQ QUESTION.md files.
 
 This script parses QUESTION.md files with various formats (numbered lists,
 headed sections, bullets) and distributes questions across research agents
-using different algorithms (round-robin, balanced, grouped).
+using different algorithms (round-robin, balanced, grouped, weighted).
 
 Usage:
     uv run python generate_prompts.py <inquiry_path> [options]
 
 Options:
-    --algorithm   Distribution algorithm: round-robin, balanced, grouped (default: round-robin)
+    --algorithm   Distribution algorithm: round-robin, balanced, grouped, weighted (default: round-robin)
     --output      Output mode: json, files (default: json)
     --agents      Override number of research agents (default: from inquiry_report.json)
 """
 
 import argparse
+import heapq
 import json
+import math
+import os
 import re
+import runpy
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 
+# Modules of other skills are loaded by path with the shared loader
+SKILL_MODULES_PATH = Path(__file__).resolve().parents[2] / "_shared" / "skill_modules.py"
+load_module = runpy.run_path(str(SKILL_MODULES_PATH))["load_module"]
+
+# Phase transitions are journaled by the inquiry skill's phase_journal
+PHASE_JOURNAL_PATH = (
+    Path(__file__).resolve().parents[2] / "inquiry" / "scripts" / "phase_journal.py"
+)
+
+
 @dataclass
 class Question:
     """Represents a parsed question with optional grouping."""
     text: str
     group: Optional[str] = None  # Heading group for grouped distribution
     source_line: int = 0
+    weight: Optional[float] = None  # Relative cost from a {weight: N} annotation
 
 
 @dataclass
@@ -60,149 +76,309 @@ class AgentPrompt:
     questions: list[str]
     prompt: str
     output_file: str
+    estimated_tokens: int = 0
 
 
-def parse_numbered_list(content: str) -> list[Question]:
-    """Parse numbered list format: 1. Question text"""
-    questions = []
-    pattern = r'^(\d+)\.\s+(.+?)(?=\n\d+\.|$)'
-    matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
-
-    for num, text in matches:
-        clean_text = text.strip()
-        if clean_text:
-            questions.append(Question(text=clean_text, source_line=int(num)))
+@dataclass
+class QuestionTokens:
+    """Everything needed to parse QUESTION.md, collected in one pass.
+
+    The candidate question lists for every format are built side by side;
+    parse_question_md() picks one once the format is known.
+    """
+    numbered_count: int = 0
+    headed_count: int = 0
+    bullet_count: int = 0
+    main_heading: Optional[str] = None
+    paragraph: list[str] = field(default_factory=list)
+    numbered: list[Question] = field(default_factory=list)
+    bullets: list[Question] = field(default_factory=list)
+    sections: list[Question] = field(default_factory=list)
+
+
+def _marker_rest(line: str, marker_len: int, has_newline: bool) -> Optional[str]:
+    """Return the text after a list/heading marker, or None if it is not one.
+
+    A marker must be followed by whitespace; a marker at the end of a line
+    counts when a newline follows, since the newline is whitespace too.
+    """
+    rest = line[marker_len:]
+    if rest[:1].isspace() or (not rest and has_newline):
+        return rest
+    return None
+
+
+def _number_prefix(line: str) -> int:
+    """Length of a leading "N." prefix (digits and dot), or 0."""
+    i = 0
+    while i < len(line) and line[i].isdecimal():
+        i += 1
+    return i + 1 if i and line[i:i + 1] == "." else 0
+
+
+def _heading_marker(line: str) -> int:
+    """Number of leading '#' characters if there are 2 or 3, else 0."""
+    if not line.startswith("##"):
+        return 0
+    hashes = 3 if line.startswith("###") else 2
+    return 0 if line[hashes:hashes + 1] == "#" else hashes
+
+
+class _Section:
+    """Questions of one "## Heading" section, accumulated line by line."""
+
+    def __init__(self, heading: str):
+        self.heading = heading
+        self.bullets: list[str] = []
+        self.bullet_matched = False
+        self.pending_bullet = False
+        self.lines: list[str] = []
+        self.started = False
+
+    def feed(self, line: str) -> None:
+        stripped = line.strip()
+        if not stripped:
+            return
+        if stripped[0] != "#":
+            self.lines.append(stripped)
+
+        if self.pending_bullet:
+            # An empty bullet takes the next non-blank line as its text
+            self.pending_bullet = False
+            self.bullet_matched = True
+            self.bullets.append(stripped)
+            return
+
+        # Section content is stripped first, so its first line loses indentation
+        if not self.started:
+            self.started = True
+            line = line.lstrip()
+
+        if line[:1] in ("-", "*"):
+            rest = _marker_rest(line, 1, True)
+            if rest is not None:
+                if rest.strip():
+                    self.bullet_matched = True
+                    self.bullets.append(rest.strip())
+                else:
+                    self.pending_bullet = True
+
+    def questions(self) -> list[Question]:
+        if self.bullet_matched:
+            return [Question(text=text, group=self.heading) for text in self.bullets]
+        if self.lines:
+            return [Question(text=" ".join(self.lines), group=self.heading)]
+        return []
+
+
+def tokenize_question_md(content: str) -> QuestionTokens:
+    """Scan QUESTION.md once, line by line, collecting every format's data.
+
+    Produces the format indicator counts, the main question and the
+    candidate questions for the numbered, bullet and headed formats.
+    """
+    tokens = QuestionTokens()
+    lines = content.split("\n")
+    last = len(lines) - 1
+
+    # The main question is read from the stripped content
+    first_text = next((i for i, line in enumerate(lines) if line.strip()), None)
+    last_text = next((i for i in range(last, -1, -1) if lines[i].strip()), None)
+
+    paragraph_state = "start"  # start -> collecting -> done
+    tentative_heading: Optional[str] = None
+    pending_number: Optional[int] = None
+    pending_bullet = False
+    bullet_number = 0
+    section: Optional[_Section] = None
+    pending_heading = False
+    pending_lines: list[str] = []
+    pending_ws = ""
+
+    for i, line in enumerate(lines):
+        has_newline = i < last
+        stripped = line.strip()
 
-    return questions
+        # Main question: first "# " heading, else the leading paragraph
+        main_pending = tokens.main_heading is None or paragraph_state != "done"
+        if main_pending and first_text is not None and first_text <= i <= last_text:
+            if stripped and tentative_heading is not None and tokens.main_heading is None:
+                tokens.main_heading = tentative_heading
+            view = line
+            if i == first_text:
+                view = view.lstrip()
+            if i == last_text:
+                view = view.rstrip()
+            if tokens.main_heading is None and tentative_heading is None and view.startswith("# "):
+                if i == last_text or line.rstrip() != "#":
+                    tokens.main_heading = view[2:].strip()
+                else:
+                    # "# " alone only counts if more text follows
+                    tentative_heading = ""
+
+            if paragraph_state != "done":
+                if not stripped:
+                    if paragraph_state == "collecting":
+                        paragraph_state = "done"
+                elif stripped[0] in "#-*" or _number_prefix(stripped):
+                    paragraph_state = "done"
+                else:
+                    tokens.paragraph.append(stripped)
+                    paragraph_state = "collecting"
+
+        # Numbered list items
+        number_len = _number_prefix(line) if line[:1].isdecimal() else 0
+        if number_len:
+            tokens.numbered_count += 1
+        if pending_number is not None:
+            if stripped:
+                tokens.numbered.append(Question(text=stripped, source_line=pending_number))
+                pending_number = None
+        elif number_len:
+            rest = _marker_rest(line, number_len, has_newline)
+            if rest is not None:
+                if rest.strip():
+                    tokens.numbered.append(
+                        Question(text=rest.strip(), source_line=int(line[:number_len - 1]))
+                    )
+                elif has_newline:
+                    pending_number = int(line[:number_len - 1])
+
+        # Bullet items
+        bullet_rest = _marker_rest(line, 1, has_newline) if line[:1] in ("-", "*") else None
+        if bullet_rest is not None:
+            tokens.bullet_count += 1
+        if pending_bullet:
+            if stripped:
+                bullet_number += 1
+                tokens.bullets.append(Question(text=stripped, source_line=bullet_number))
+                pending_bullet = False
+        elif bullet_rest is not None:
+            if bullet_rest.strip():
+                bullet_number += 1
+                tokens.bullets.append(Question(text=bullet_rest.strip(), source_line=bullet_number))
+            elif has_newline:
+                pending_bullet = True
+
+        # Headed sections
+        hashes = _heading_marker(line) if line[:1] == "#" else 0
+        heading_rest = _marker_rest(line, hashes, has_newline) if hashes else None
+        if heading_rest is not None:
+            tokens.headed_count += 1
+
+        if pending_heading:
+            # A heading marker alone on its line takes the next non-blank line
+            pending_lines.append(line)
+            if stripped:
+                pending_heading = False
+                if section is not None:
+                    tokens.sections.extend(section.questions())
+                section = _Section(stripped)
+            else:
+                pending_ws += line + ("\n" if has_newline else "")
+            continue
 
+        if heading_rest is not None:
+            if heading_rest.strip():
+                if section is not None:
+                    tokens.sections.extend(section.questions())
+                section = _Section(heading_rest.strip())
+            else:
+                pending_heading = True
+                pending_lines = [line]
+                pending_ws = heading_rest + ("\n" if has_newline else "")
+        elif section is not None:
+            section.feed(line)
+
+    if pending_heading and not pending_ws[1:].strip("\n"):
+        # Only whitespace followed the marker and none of it can form a
+        # heading title: the lines stay part of the current section
+        if section is not None:
+            for line in pending_lines:
+                section.feed(line)
+    elif pending_heading:
+        # An empty heading: it closes the current section and adds nothing
+        if section is not None:
+            tokens.sections.extend(section.questions())
+        section = None
+
+    if section is not None:
+        tokens.sections.extend(section.questions())
+
+    return tokens
 
-def parse_headed_sections(content: str) -> list[Question]:
-    """Parse headed section format: ## Heading\nQuestion text or bullet items"""
-    questions = []
-
-    # Find all ## or ### headings and their content
-    # Pattern: ## Heading followed by content until next ## or end
-    pattern = r'^(#{2,3})\s+(.+?)$'
-
-    # Split content by headings, keeping the delimiters
-    parts = re.split(pattern, content, flags=re.MULTILINE)
-
-    # parts will be: [before_first_heading, '##', 'heading1', content1, '##', 'heading2', content2, ...]
-    # Index 0: content before first heading
-    # Index 1, 2, 3: first heading (##, heading text, content)
-    # Index 4, 5, 6: second heading...
-
-    i = 1  # Skip content before first heading
-    while i + 2 < len(parts):
-        hash_marks = parts[i]
-        heading = parts[i + 1].strip()
-        content_after = parts[i + 2] if i + 2 < len(parts) else ""
-
-        # Check if section contains bullet items
-        bullet_pattern = r'^[-*]\s+(.+?)(?=\n[-*]|\n\n|$)'
-        bullet_matches = re.findall(bullet_pattern, content_after.strip(), re.MULTILINE | re.DOTALL)
-
-        if bullet_matches:
-            # Section has bullets - each bullet is a separate question in this group
-            for bullet_text in bullet_matches:
-                clean_text = bullet_text.strip()
-                if clean_text:
-                    questions.append(Question(
-                        text=clean_text,
-                        group=heading
-                    ))
-        else:
-            # No bullets - treat section content as single question
-            lines = []
-            for line in content_after.strip().split('\n'):
-                stripped = line.strip()
-                if stripped and not stripped.startswith('#'):
-                    lines.append(stripped)
 
-            if lines:
-                question_text = ' '.join(lines)
-                questions.append(Question(
-                    text=question_text,
-                    group=heading
-                ))
+def parse_numbered_list(content: str) -> list[Question]:
+    """Parse numbered list format: 1. Question text"""
+    return tokenize_question_md(content).numbered
 
-        i += 3
 
-    return questions
+def parse_headed_sections(content: str) -> list[Question]:
+    """Parse headed section format: ## Heading\nQuestion text or bullet items"""
+    return tokenize_question_md(content).sections
 
 
 def parse_bullet_points(content: str) -> list[Question]:
     """Parse bullet point format: - Question or * Question"""
-    questions = []
-    pattern = r'^[-*]\s+(.+?)(?=\n[-*]|\n\n|$)'
-    matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
-
-    line_num = 0
-    for text in matches:
-        clean_text = text.strip()
-        if clean_text:
-            line_num += 1
-            questions.append(Question(text=clean_text, source_line=line_num))
-
-    return questions
+    return tokenize_question_md(content).bullets
 
 
-def detect_format(content: str) -> str:
-    """Detect the primary format of the QUESTION.md content."""
-    # Count format indicators
-    numbered_count = len(re.findall(r'^\d+\.', content, re.MULTILINE))
-    headed_count = len(re.findall(r'^#{2,3}\s+', content, re.MULTILINE))
-    bullet_count = len(re.findall(r'^[-*]\s+', content, re.MULTILINE))
-
+def _format_from_tokens(tokens: QuestionTokens) -> str:
     # Headings indicate intentional grouping structure - prefer headed format
     # even when sections contain bullets/numbers as sub-items
-    if headed_count > 0:
+    if tokens.headed_count > 0:
         return "headed"
-    elif numbered_count > 0 and numbered_count >= bullet_count:
+    elif tokens.numbered_count > 0 and tokens.numbered_count >= tokens.bullet_count:
         return "numbered"
-    elif bullet_count > 0:
+    elif tokens.bullet_count > 0:
         return "bullets"
     else:
         return "plain"
 
 
+def _main_question_from_tokens(tokens: QuestionTokens) -> str:
+    if tokens.main_heading is not None:
+        return tokens.main_heading
+    return ' '.join(tokens.paragraph) if tokens.paragraph else "Research the following questions"
+
+
+def detect_format(content: str) -> str:
+    """Detect the primary format of the QUESTION.md content."""
+    return _format_from_tokens(tokenize_question_md(content))
+
+
 def extract_main_question(content: str) -> str:
     """Extract the main question from QUESTION.md (usually the first heading or paragraph)."""
-    lines = content.strip().split('\n')
+    return _main_question_from_tokens(tokenize_question_md(content))
 
-    # Look for # Main heading first
-    for line in lines:
-        if line.startswith('# ') and not line.startswith('## '):
-            return line[2:].strip()
 
-    # Otherwise take first non-empty paragraph before any lists/headings
-    paragraph_lines = []
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            if paragraph_lines:
-                break
-            continue
-        if stripped.startswith('#') or stripped.startswith('-') or stripped.startswith('*'):
-            break
-        if re.match(r'^\d+\.', stripped):
-            break
-        paragraph_lines.append(stripped)
+# Optional trailing cost annotation, e.g. "Compare vendors {weight: 3}"
+WEIGHT_PATTERN = re.compile(r'\s*\{weight\s*[:=]\s*(\d+(?:\.\d+)?)\}\s*$', re.IGNORECASE)
 
-    return ' '.join(paragraph_lines) if paragraph_lines else "Research the following questions"
+
+def apply_weight_annotations(questions: list[Question]) -> None:
+    """Move trailing {weight: N} annotations from question text into Question.weight."""
+    for question in questions:
+        if "{" not in question.text:
+            continue
+        match = WEIGHT_PATTERN.search(question.text)
+        if match:
+            question.weight = float(match.group(1))
+            question.text = question.text[:match.start()]
 
 
 def parse_question_md(content: str) -> ParsedQuestions:
     """Parse QUESTION.md content and extract questions."""
-    format_detected = detect_format(content)
-    main_question = extract_main_question(content)
+    tokens = tokenize_question_md(content)
+    format_detected = _format_from_tokens(tokens)
+    main_question = _main_question_from_tokens(tokens)
 
     if format_detected == "headed":
-        sub_questions = parse_headed_sections(content)
+        sub_questions = tokens.sections
     elif format_detected == "numbered":
-        sub_questions = parse_numbered_list(content)
+        sub_questions = tokens.numbered
     elif format_detected == "bullets":
-        sub_questions = parse_bullet_points(content)
+        sub_questions = tokens.bullets
     else:
         # Plain text - treat the whole content (minus main question) as one question
         sub_questions = [Question(text=main_question)]
@@ -211,6 +387,8 @@ def parse_question_md(content: str) -> ParsedQuestions:
     if not sub_questions and main_question:
         sub_questions = [Question(text=main_question)]
 
+    apply_weight_annotations(sub_questions)
+
     return ParsedQuestions(
         main_question=main_question,
         sub_questions=sub_questions,
@@ -272,8 +450,44 @@ def distribute_balanced(questions: list[Question], num_agents: int) -> list[list
     return distribution
 
 
-def distribute_grouped(questions: list[Question], num_agents: int) -> list[list[Question]]:
-    """Distribute questions keeping groups together."""
+def _assign_lpt(
+    units: list[list[Question]],
+    costs: list[float],
+    num_agents: int,
+) -> tuple[list[list[Question]], list[float]]:
+    """Assign units of work to agents with longest-processing-time-first.
+
+    Units are taken in decreasing cost order and each goes to the currently
+    least-loaded agent, found with a heap of (load, agent index).
+
+    Returns:
+        Tuple of (distribution, load per agent)
+    """
+    distribution: list[list[Question]] = [[] for _ in range(num_agents)]
+    loads = [0.0] * num_agents
+    heap = [(0.0, agent_idx) for agent_idx in range(num_agents)]
+
+    for unit_idx in sorted(range(len(units)), key=lambda i: -costs[i]):
+        load, agent_idx = heapq.heappop(heap)
+        distribution[agent_idx].extend(units[unit_idx])
+        loads[agent_idx] = load + costs[unit_idx]
+        heapq.heappush(heap, (loads[agent_idx], agent_idx))
+
+    return distribution, loads
+
+
+def distribute_grouped(
+    questions: list[Question],
+    num_agents: int,
+    split_oversized: bool = False,
+) -> list[list[Question]]:
+    """Distribute questions keeping groups together.
+
+    Groups are assigned largest first to the agent with the fewest
+    questions (a heap, so large question sets and agent counts stay fast).
+    With split_oversized, a group larger than an even share of questions is
+    cut into contiguous chunks of that size so it cannot overload one agent.
+    """
     # Group questions by their group attribute
     groups: dict[Optional[str], list[Question]] = {}
     for q in questions:
@@ -282,36 +496,126 @@ def distribute_grouped(questions: list[Question], num_agents: int) -> list[list[
             groups[group_key] = []
         groups[group_key].append(q)
 
-    # Sort groups by size (largest first for better distribution)
-    sorted_groups = sorted(groups.values(), key=len, reverse=True)
+    units = list(groups.values())
+    if split_oversized and num_agents:
+        share = max(1, math.ceil(len(questions) / num_agents))
+        units = [
+            group[start:start + share]
+            for group in units
+            for start in range(0, len(group), share)
+        ]
 
-    # Assign groups to agents using bin-packing approach
-    distribution: list[list[Question]] = [[] for _ in range(num_agents)]
-    agent_counts = [0] * num_agents
+    distribution, _ = _assign_lpt(units, [len(unit) for unit in units], num_agents)
+    return distribution
+
+
+def distribution_metrics(loads: list[float]) -> dict:
+    """Summarize how evenly work is spread across agents.
+
+    Args:
+        loads: Work per agent (question count or estimated tokens)
+
+    Returns:
+        Dict with max, min, mean, standard deviation and imbalance
+        (max / mean; 1.0 is perfectly balanced)
+    """
+    if not loads:
+        return {"max": 0, "min": 0, "mean": 0, "stdev": 0, "imbalance": 1.0}
+
+    mean = sum(loads) / len(loads)
+    variance = sum((load - mean) ** 2 for load in loads) / len(loads)
+    return {
+        "max": max(loads),
+        "min": min(loads),
+        "mean": round(mean, 2),
+        "stdev": round(math.sqrt(variance), 2),
+        "imbalance": round(max(loads) / mean, 3) if mean else 1.0,
+    }
+
+
+# Rough chars-per-token ratio for English prose
+CHARS_PER_TOKEN = 4
+
+# Research cost model, in tokens: a fixed overhead per question plus output
+# that grows with how much the question asks
+QUESTION_BASE_TOKENS = 200
+RESEARCH_TOKENS_PER_QUESTION_TOKEN = 20
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a piece of text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def estimate_question_cost(question: Question) -> float:
+    """Estimate the research cost of a question in tokens.
 
-    for group in sorted_groups:
-        # Find agent with fewest questions
-        min_idx = agent_counts.index(min(agent_counts))
-        distribution[min_idx].extend(group)
-        agent_counts[min_idx] += len(group)
+    Cost grows with question length; a {weight: N} annotation scales it.
+    """
+    cost = QUESTION_BASE_TOKENS + RESEARCH_TOKENS_PER_QUESTION_TOKEN * estimate_tokens(question.text)
+    if question.weight is not None:
+        cost *= question.weight
+    return cost
+
+
+def distribute_weighted(questions: list[Question], num_agents: int) -> list[list[Question]]:
+    """Distribute questions by estimated cost so agents finish together.
+
+    Groups are kept together unless a group alone costs more than an even
+    share of the total, in which case its questions are scheduled
+    individually. Questions keep their original order within each agent.
+    """
+    costs = {id(q): estimate_question_cost(q) for q in questions}
+    target = sum(costs.values()) / num_agents if num_agents else 0.0
+
+    groups: dict[str, list[Question]] = {}
+    for q in questions:
+        groups.setdefault(q.group or "ungrouped", []).append(q)
+
+    units: list[list[Question]] = []
+    for key, group in groups.items():
+        group_cost = sum(costs[id(q)] for q in group)
+        if key == "ungrouped" or group_cost > target:
+            units.extend([q] for q in group)
+        else:
+            units.append(group)
+
+    distribution, _ = _assign_lpt(
+        units, [sum(costs[id(q)] for q in unit) for unit in units], num_agents
+    )
+
+    order = {id(q): i for i, q in enumerate(questions)}
+    for agent_questions in distribution:
+        agent_questions.sort(key=lambda q: order[id(q)])
 
     return distribution
 
 
-def generate_prompt_text(
-    agent_number: int,
+# Placeholders left in the shared prompt skeleton and filled per agent
+_AGENT_SLOT = "\x00agent\x00"
+_QUESTIONS_SLOT = "\x00questions\x00"
+_SLOT_PATTERN = re.compile(f"({re.escape(_AGENT_SLOT)}|{re.escape(_QUESTIONS_SLOT)})")
+
+
+def format_questions(questions: list[Question]) -> str:
+    """Format an agent's assigned questions for the prompt."""
+    if len(questions) == 1:
+        return f"- {questions[0].text}"
+    return "\n".join(f"{i+1}. {q.text}" for i, q in enumerate(questions))
+
+
+def build_prompt_skeleton(
     total_agents: int,
     context: InquiryContext,
-    questions: list[Question],
     main_question: str
-) -> str:
-    """Generate the full prompt text for a research agent."""
+) -> list[str]:
+    """Render the parts of the prompt shared by every agent of an inquiry.
 
-    # Format assigned questions
-    if len(questions) == 1:
-        questions_text = f"- {questions[0].text}"
-    else:
-        questions_text = "\n".join(f"{i+1}. {q.text}" for i, q in enumerate(questions))
+    Returns the prompt split into literal text and slot markers; pass it to
+    fill_prompt() once per agent instead of re-rendering the whole prompt.
+    """
+    agent_number = _AGENT_SLOT
+    questions_text = _QUESTIONS_SLOT
 
     # Format constraints
     constraints_text = "\n".join(f"- {c}" for c in context.constraints) if context.constraints else "- None specified"
@@ -384,13 +688,32 @@ Sources consulted during research
 **Phase**: Research (Phase 1)
 """
 
-    return prompt
+    return _SLOT_PATTERN.split(prompt)
+
+
+def fill_prompt(skeleton: list[str], agent_number: int, questions: list[Question]) -> str:
+    """Fill a prompt skeleton with one agent's number and questions."""
+    values = {_AGENT_SLOT: str(agent_number), _QUESTIONS_SLOT: format_questions(questions)}
+    return "".join(values.get(part, part) for part in skeleton)
+
+
+def generate_prompt_text(
+    agent_number: int,
+    total_agents: int,
+    context: InquiryContext,
+    questions: list[Question],
+    main_question: str
+) -> str:
+    """Generate the full prompt text for a research agent."""
+    skeleton = build_prompt_skeleton(total_agents, context, main_question)
+    return fill_prompt(skeleton, agent_number, questions)
 
 
 def generate_prompts(
     inquiry_path: Path,
     algorithm: str = "round-robin",
-    num_agents: Optional[int] = None
+    num_agents: Optional[int] = None,
+    split_groups: bool = False
 ) -> dict:
     """Generate research agent prompts for an inquiry."""
 
@@ -417,11 +740,20 @@ def generate_prompts(
     elif algorithm == "balanced":
         distribution = distribute_balanced(parsed.sub_questions, context.research_agents)
     elif algorithm == "grouped":
-        distribution = distribute_grouped(parsed.sub_questions, context.research_agents)
+        distribution = distribute_grouped(
+            parsed.sub_questions, context.research_agents, split_oversized=split_groups
+        )
+    elif algorithm == "weighted":
+        distribution = distribute_weighted(parsed.sub_questions, context.research_agents)
     else:
         raise ValueError(f"Unknown algorithm: {algorithm}")
 
-    # Generate prompts for each agent
+    balance = {
+        "questions": distribution_metrics([len(agent_qs) for agent_qs in distribution]),
+    }
+
+    # Generate prompts for each agent from one shared skeleton
+    skeleton = build_prompt_skeleton(context.research_agents, context, parsed.main_question)
     prompts = []
     for agent_idx, questions in enumerate(distribution):
         agent_num = agent_idx + 1
@@ -430,19 +762,16 @@ def generate_prompts(
             # Agent has no questions - give them the main question
             questions = [Question(text=parsed.main_question)]
 
-        prompt_text = generate_prompt_text(
-            agent_number=agent_num,
-            total_agents=context.research_agents,
-            context=context,
-            questions=questions,
-            main_question=parsed.main_question
-        )
+        prompt_text = fill_prompt(skeleton, agent_num, questions)
 
         prompts.append(AgentPrompt(
             agent_number=agent_num,
             questions=[q.text for q in questions],
             prompt=prompt_text,
-            output_file=f"research/agent-{agent_num}.md"
+            output_file=f"research/agent-{agent_num}.md",
+            estimated_tokens=round(
+                estimate_tokens(prompt_text) + sum(estimate_question_cost(q) for q in questions)
+            )
         ))
 
     return {
@@ -453,11 +782,16 @@ def generate_prompts(
         "format_detected": parsed.format_detected,
         "main_question": parsed.main_question,
         "total_questions": len(parsed.sub_questions),
+        "makespan_tokens": max((p.estimated_tokens for p in prompts), default=0),
+        "balance": dict(
+            balance, tokens=distribution_metrics([p.estimated_tokens for p in prompts])
+        ),
         "prompts": [
             {
                 "agent_number": p.agent_number,
                 "questions": p.questions,
                 "output_file": p.output_file,
+                "estimated_tokens": p.estimated_tokens,
                 "prompt": p.prompt
             }
             for p in prompts
@@ -465,17 +799,9 @@ def generate_prompts(
     }
 
 
-def write_prompt_files(inquiry_path: Path, result: dict) -> list[str]:
-    """Write prompts to research/agent-N.md files."""
-    research_dir = inquiry_path / "research"
-    research_dir.mkdir(exist_ok=True)
-
-    written_files = []
-    for prompt_data in result["prompts"]:
-        output_path = inquiry_path / prompt_data["output_file"]
-
-        # Add frontmatter to the prompt
-        content = f"""---
+def render_prompt_file(result: dict, prompt_data: dict) -> str:
+    """Render a prompt file: YAML frontmatter followed by the prompt."""
+    return f"""---
 inquiry_id: {result["inquiry_id"]}
 agent_number: {prompt_data["agent_number"]}
 total_agents: {result["total_agents"]}
@@ -486,12 +812,159 @@ questions_assigned: {len(prompt_data["questions"])}
 {prompt_data["prompt"]}
 """
 
-        with open(output_path, 'w') as f:
-            f.write(content)
 
-        written_files.append(str(output_path))
+def write_prompt_files_batch(items: list[tuple[Path, dict]]) -> list[str]:
+    """Write prompts for several inquiries with one atomic-rename pass.
+
+    Every file is first written to a temporary name next to its target;
+    only when all of them were written are they renamed into place, so a
+    failure never leaves an inquiry with a partial set of prompts.
 
-    return written_files
+    Args:
+        items: (inquiry_path, generate_prompts() result) pairs
+
+    Returns:
+        Paths of the written files
+    """
+    staged: list[tuple[Path, Path]] = []
+    try:
+        for inquiry_path, result in items:
+            (inquiry_path / "research").mkdir(exist_ok=True)
+            for prompt_data in result["prompts"]:
+                output_path = inquiry_path / prompt_data["output_file"]
+                tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+                with open(tmp_path, 'w') as f:
+                    f.write(render_prompt_file(result, prompt_data))
+                staged.append((tmp_path, output_path))
+    except OSError:
+        for tmp_path, _ in staged:
+            tmp_path.unlink(missing_ok=True)
+        raise
+
+    for tmp_path, output_path in staged:
+        os.replace(tmp_path, output_path)
+
+    return [str(output_path) for _, output_path in staged]
+
+
+def write_prompt_files(inquiry_path: Path, result: dict) -> list[str]:
+    """Write prompts to research/agent-N.md files."""
+    return write_prompt_files_batch([(inquiry_path, result)])
+
+
+DEFAULT_INQUIRIES_DIR = Path("feature-management/inquiries")
+
+
+def has_prompts(inquiry_path: Path) -> bool:
+    """Check whether an inquiry already has research/agent-N.md files."""
+    research_dir = inquiry_path / "research"
+    return research_dir.is_dir() and any(research_dir.glob("agent-*.md"))
+
+
+def load_phase_journal():
+    """Load the inquiry skill's phase_journal module, or None if unavailable."""
+    try:
+        return load_module("inquiry_phase_journal", PHASE_JOURNAL_PATH)
+    except Exception:
+        return None
+
+
+def discover_pending_inquiries(inquiries_dir: Path) -> list[Path]:
+    """Find inquiries in the research phase that have no prompts yet.
+
+    Args:
+        inquiries_dir: Directory containing INQ-* inquiry directories
+
+    Returns:
+        Sorted list of inquiry paths
+    """
+    if not inquiries_dir.is_dir():
+        raise FileNotFoundError(f"Inquiries directory not found at {inquiries_dir}")
+
+    phase_journal = load_phase_journal()
+    pending = []
+    with os.scandir(inquiries_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir() or not entry.name.startswith("INQ-"):
+                continue
+            inquiry_path = Path(entry.path)
+            try:
+                if phase_journal is not None:
+                    # Includes transitions not yet compacted into the report
+                    phase = phase_journal.load_report(inquiry_path).get("phase")
+                else:
+                    with open(inquiry_path / "inquiry_report.json", 'r') as f:
+                        phase = json.load(f).get("phase")
+            except (OSError, json.JSONDecodeError):
+                continue
+            if phase == "research" and not has_prompts(inquiry_path):
+                pending.append(inquiry_path)
+
+    return sorted(pending)
+
+
+def generate_batch(
+    inquiries_dir: Path,
+    algorithm: str = "round-robin",
+    num_agents: Optional[int] = None,
+    split_groups: bool = False,
+    max_workers: Optional[int] = None
+) -> tuple[list[tuple[Path, dict]], list[dict]]:
+    """Generate prompts for every pending inquiry concurrently.
+
+    Returns:
+        Tuple of ((inquiry_path, result) pairs, errors)
+    """
+    pending = discover_pending_inquiries(inquiries_dir)
+
+    def generate(inquiry_path: Path) -> dict:
+        return generate_prompts(inquiry_path, algorithm, num_agents, split_groups)
+
+    generated: list[tuple[Path, dict]] = []
+    errors: list[dict] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [(path, executor.submit(generate, path)) for path in pending]
+        for inquiry_path, future in futures:
+            try:
+                generated.append((inquiry_path, future.result()))
+            except (OSError, ValueError) as e:
+                errors.append({"inquiry_path": str(inquiry_path), "error": str(e)})
+
+    return generated, errors
+
+
+def run_batch(args: argparse.Namespace) -> None:
+    """Handle --all: generate (and optionally write) prompts for all pending inquiries."""
+    generated, errors = generate_batch(
+        args.inquiries_dir,
+        algorithm=args.algorithm,
+        num_agents=args.agents,
+        split_groups=args.split_groups
+    )
+
+    if args.output == "files":
+        written = write_prompt_files_batch(generated)
+        output = {
+            "status": "success" if not errors else "partial",
+            "inquiries": [
+                {
+                    "inquiry_id": result["inquiry_id"],
+                    "inquiry_path": str(inquiry_path),
+                    "total_agents": result["total_agents"],
+                    "makespan_tokens": result["makespan_tokens"]
+                }
+                for inquiry_path, result in generated
+            ],
+            "files_written": len(written),
+            "errors": errors
+        }
+    else:
+        output = {
+            "inquiries": [result for _, result in generated],
+            "errors": errors
+        }
+
+    print(json.dumps(output, indent=2))
 
 
 def main():
@@ -501,14 +974,31 @@ def main():
     parser.add_argument(
         "inquiry_path",
         type=Path,
+        nargs="?",
         help="Path to the inquiry directory containing QUESTION.md and inquiry_report.json"
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Generate prompts for every research-phase inquiry that has none"
+    )
+    parser.add_argument(
+        "--inquiries-dir",
+        type=Path,
+        default=DEFAULT_INQUIRIES_DIR,
+        help=f"Inquiries directory searched by --all (default: {DEFAULT_INQUIRIES_DIR})"
+    )
     parser.add_argument(
         "--algorithm",
-        choices=["round-robin", "balanced", "grouped"],
+        choices=["round-robin", "balanced", "grouped", "weighted"],
         default="round-robin",
         help="Distribution algorithm (default: round-robin)"
     )
+    parser.add_argument(
+        "--split-groups",
+        action="store_true",
+        help="With --algorithm grouped, split groups larger than an even share"
+    )
     parser.add_argument(
         "--output",
         choices=["json", "files"],
@@ -523,11 +1013,19 @@ def main():
 
     args = parser.parse_args()
 
+    if args.all == (args.inquiry_path is not None):
+        parser.error("provide either an inquiry path or --all")
+
     try:
+        if args.all:
+            run_batch(args)
+            return
+
         result = generate_prompts(
             inquiry_path=args.inquiry_path,
             algorithm=args.algorithm,
-            num_agents=args.agents
+            num_agents=args.agents,
+            split_groups=args.split_groups
         )
 
         if args.output == "files":
@@ -537,7 +1035,10 @@ def main():
                 "files_written": written,
                 "inquiry_id": result["inquiry_id"],
                 "total_agents": result["total_agents"],
-                "algorithm": result["algorithm"]
+                "algorithm": result["algorithm"],
+                "makespan_tokens": result["makespan_tokens"],
+                "balance": result["balance"],
+                "estimated_tokens": [p["estimated_tokens"] for p in result["prompts"]]
             }
             print(json.dumps(output, indent=2))
         else:
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+BM25 Scoring
+
+A small in-memory inverted index scored with Okapi BM25. Documents are
+token lists keyed by an ID; a query only touches the postings of its own
+terms, so scoring cost depends on how common the query terms are rather
+than on corpus size.
+"""
+
+import heapq
+import math
+from collections import Counter
+from typing import Hashable, Iterable, Mapping, Optional
+
+DEFAULT_K1 = 1.5
+DEFAULT_B = 0.75
+
+
+class BM25Index:
+    """Inverted index with Okapi BM25 scoring."""
+
+    def __init__(self, k1: float = DEFAULT_K1, b: float = DEFAULT_B):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: Term-frequency saturation
+            b: Document-length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.postings: dict[str, dict[Hashable, int]] = {}
+        self.doc_lengths: dict[Hashable, int] = {}
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def add(self, doc_id: Hashable, tokens: Iterable[str]) -> None:
+        """Index a document, replacing any document with the same ID."""
+        self.add_counts(doc_id, Counter(tokens))
+
+    def add_counts(self, doc_id: Hashable, counts: Mapping[str, int]) -> None:
+        """Index a document given as term -> count (e.g. a persisted Counter)."""
+        if doc_id in self.doc_lengths:
+            self.remove(doc_id)
+        for term, tf in counts.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+        length = sum(counts.values())
+        self.doc_lengths[doc_id] = length
+        self.total_length += length
+
+    def remove(self, doc_id: Hashable, tokens: Optional[Iterable[str]] = None) -> None:
+        """
+        Remove a document.
+
+        Passing the document's tokens limits the work to its own postings;
+        without them every posting list is checked.
+        """
+        length = self.doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self.total_length -= length
+        terms = set(tokens) if tokens is not None else list(self.postings)
+        for term in terms:
+            docs = self.postings.get(term)
+            if docs and docs.pop(doc_id, None) is not None and not docs:
+                del self.postings[term]
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency (always positive)."""
+        df = len(self.postings.get(term, ()))
+        n = len(self.doc_lengths)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def scores(self, query_tokens: Iterable[str]) -> dict[Hashable, float]:
+        """Score every document sharing a term with the query."""
+        if not self.doc_lengths:
+            return {}
+        avg_length = self.total_length / len(self.doc_lengths) or 1.0
+        k1, b = self.k1, self.b
+
+        scores: dict[Hashable, float] = {}
+        for term, query_tf in Counter(query_tokens).items():
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = self.idf(term) * query_tf
+            for doc_id, tf in docs.items():
+                norm = k1 * (1 - b + b * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+        return scores
+
+    def top_k(self, query_tokens: Iterable[str], k: int = 10) -> list[tuple[Hashable, float]]:
+        """Return the k best (doc_id, score) pairs, best first."""
+        scores = self.scores(query_tokens)
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
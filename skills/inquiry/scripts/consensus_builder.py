@@ -6,15 +6,27 @@ Generates consensus documents and prepares FEAT work items for Phase 4.
 """
 
 import json
-import re
+import runpy
 import sys
 from datetime import date
 from pathlib import Path
 from typing import Optional
 
+from .document_parser import parse_document_file
 from .phase_manager import load_inquiry, save_inquiry, find_inquiry
 
 
+# Modules of other skills are loaded by path with the shared loader
+SKILL_MODULES_PATH = Path(__file__).resolve().parents[2] / "_shared" / "skill_modules.py"
+load_module = runpy.run_path(str(SKILL_MODULES_PATH))["load_module"]
+
+# In-process FEAT creation reuses the work-item-creation skill
+CREATE_ITEM_PATH = (
+    Path(__file__).resolve().parents[2] / "work-item-creation" / "scripts" / "create_item.py"
+)
+DEFAULT_FEAT_DESCRIPTION = "Implementation based on consensus decision"
+
+
 CONSENSUS_TEMPLATE = """# Consensus: {title}
 
 **Inquiry**: {inquiry_id}
@@ -142,40 +154,14 @@ def parse_debate_resolutions(debate_path: Path) -> list[dict]:
 
     Returns list of decisions with resolutions.
     """
-    if not debate_path.exists():
-        return []
-
-    content = debate_path.read_text()
     decisions = []
-
-    # Find all decision point sections
-    decision_sections = re.findall(
-        r'### Decision Point (\d+):\s*([^\n]+)(.*?)(?=### Decision Point|\Z)',
-        content,
-        re.DOTALL
-    )
-
-    for num, topic, section in decision_sections:
-        resolution_match = re.search(
-            r'\*\*Prevailing Position\*\*:\s*([^\n]+)',
-            section
-        )
-        rationale_match = re.search(
-            r'\*\*Rationale\*\*:\s*\n(.*?)(?=\*\*|\n---|\Z)',
-            section,
-            re.DOTALL
-        )
-        confidence_match = re.search(
-            r'\*\*Confidence\*\*:\s*([^\n]+)',
-            section
-        )
-
+    for d in parse_document_file(debate_path)["decisions"]:
         decisions.append({
-            "num": int(num),
-            "topic": topic.strip(),
-            "resolution": resolution_match.group(1).strip() if resolution_match else "[Not specified]",
-            "rationale": rationale_match.group(1).strip() if rationale_match else "[See debate document]",
-            "confidence": confidence_match.group(1).strip() if confidence_match else "Medium"
+            "num": d["num"],
+            "topic": d["topic"],
+            "resolution": d["resolution"] or "[Not specified]",
+            "rationale": d["rationale"] or "[See debate document]",
+            "confidence": d["confidence"] or "Medium"
         })
 
     return decisions
@@ -245,7 +231,7 @@ def create_consensus_template(inquiry_path: Path) -> str:
             type="new_feature",
             priority="P1",
             effort="medium",
-            description="Implementation based on consensus decision",
+            description=DEFAULT_FEAT_DESCRIPTION,
             inquiry_id=report.get("inquiry_id", "Unknown"),
             decision_ref="Decision 1"
         ),
@@ -267,34 +253,16 @@ def extract_feat_requirements(inquiry_path: Path) -> list[dict]:
     feats = []
 
     # Try to extract from consensus
-    if consensus_path.exists():
-        content = consensus_path.read_text()
-        work_items_match = re.search(
-            r'## Work Items to Spawn\s*\n(.*?)(?=\n## |\Z)',
-            content,
-            re.DOTALL
-        )
-
-        if work_items_match:
-            section = work_items_match.group(1)
-            # Parse FEAT sections
-            feat_matches = re.findall(
-                r'### FEAT-\w+:\s*([^\n]+)\s*\n'
-                r'.*?\*\*Type\*\*:\s*([^\n]+)\s*\n'
-                r'.*?\*\*Priority\*\*:\s*([^\n]+)\s*\n'
-                r'.*?\*\*Estimated Effort\*\*:\s*([^\n]+)',
-                section,
-                re.DOTALL
-            )
-            for title, feat_type, priority, effort in feat_matches:
-                feats.append({
-                    "title": title.strip(),
-                    "type": feat_type.strip(),
-                    "priority": priority.strip(),
-                    "effort": effort.strip(),
-                    "component": report.get("component", "unknown"),
-                    "source_inquiry": report.get("inquiry_id")
-                })
+    for item in parse_document_file(consensus_path)["work_items"]:
+        feats.append({
+            "title": item["title"],
+            "type": item["type"] or "new_feature",
+            "priority": item["priority"] or "P1",
+            "effort": item["effort"] or "medium",
+            "description": item["description"] or DEFAULT_FEAT_DESCRIPTION,
+            "component": report.get("component", "unknown"),
+            "source_inquiry": report.get("inquiry_id")
+        })
 
     # If no feats found, generate suggestion from decisions
     if not feats:
@@ -305,6 +273,7 @@ def extract_feat_requirements(inquiry_path: Path) -> list[dict]:
                 "type": "new_feature",
                 "priority": "P1",
                 "effort": "medium",
+                "description": f"Implement the resolution of Decision {d['num']} ({d['topic']}): {d['resolution']}",
                 "component": report.get("component", "unknown"),
                 "source_inquiry": report.get("inquiry_id"),
                 "auto_generated": True
@@ -328,6 +297,78 @@ def update_inquiry_with_feats(inquiry_path: Path, feat_ids: list[str]) -> dict:
     return report
 
 
+def load_feature_creator():
+    """Load create_features from the work-item-creation skill, or None if unavailable."""
+    try:
+        return load_module("work_item_creation_create_item", CREATE_ITEM_PATH).create_features
+    except Exception:
+        return None
+
+
+def spawn_feats(inquiry_path: Path, feats: Optional[list[dict]] = None) -> list[dict]:
+    """
+    Create FEAT work items for an inquiry in one transaction.
+
+    All FEAT IDs are reserved at once and spawned_features is updated with
+    every new ID in a single write of inquiry_report.json. If creating any
+    item fails, the creator removes the items already written and nothing
+    is recorded, so the spawn can be retried.
+
+    Args:
+        inquiry_path: Path to inquiry directory
+        feats: FEAT requirements (default: extract_feat_requirements())
+
+    Returns:
+        Created items as {"success", "id", "path"} dicts
+
+    Raises:
+        FileNotFoundError: If the work-item-creation skill is unavailable
+        ValueError: If the inquiry has already spawned features
+        OSError: If writing a work item fails
+    """
+    report = load_inquiry(inquiry_path)
+    if report.get("spawned_features"):
+        raise ValueError(
+            f"Inquiry has already spawned {', '.join(report['spawned_features'])}; "
+            "use --add-feat to record further features"
+        )
+
+    if feats is None:
+        feats = extract_feat_requirements(inquiry_path)
+    if not feats:
+        return []
+
+    create_features = load_feature_creator()
+    if create_features is None:
+        raise FileNotFoundError(f"Work item creator not found: {CREATE_ITEM_PATH}")
+
+    items = []
+    for feat in feats:
+        items.append({
+            "item_type": "feature",
+            "title": feat["title"],
+            "component": feat["component"],
+            "priority": feat["priority"],
+            "description": feat.get("description") or DEFAULT_FEAT_DESCRIPTION,
+            "metadata": {
+                "type": feat["type"],
+                "estimated_effort": feat["effort"],
+                "notes": f"Spawned from inquiry {feat['source_inquiry']}",
+            },
+        })
+
+    # Inquiries live in feature-management/inquiries/; anywhere else the
+    # creator falls back to feature-management/ under the working directory
+    feature_mgmt_dir = None
+    if inquiry_path.resolve().parent.name == "inquiries":
+        feature_mgmt_dir = str(inquiry_path.resolve().parent.parent)
+
+    # Consensus FEATs are distinct decisions: near-duplicates are tagged, never skipped
+    created = create_features(items, feature_mgmt_dir, dedupe="link")
+    update_inquiry_with_feats(inquiry_path, [item["id"] for item in created])
+    return created
+
+
 def generate_feat_creation_commands(inquiry_path: Path) -> str:
     """Generate CLI commands to create FEAT work items."""
     feats = extract_feat_requirements(inquiry_path)
@@ -364,6 +405,8 @@ def main():
                         help="Write template to CONSENSUS.md")
     parser.add_argument("--add-feat", action="append", dest="feat_ids",
                         help="Add FEAT ID to spawned_features")
+    parser.add_argument("--spawn", action="store_true",
+                        help="Create the FEAT work items in-process and record them in spawned_features")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
 
     args = parser.parse_args()
@@ -382,6 +425,18 @@ def main():
                 print(f"Updated spawned_features: {report.get('spawned_features', [])}")
             return
 
+        if args.spawn:
+            created = spawn_feats(inquiry_path)
+            if args.json:
+                print(json.dumps({"created": created, "count": len(created)}, indent=2))
+            elif not created:
+                print("No FEAT requirements found; nothing spawned")
+            else:
+                print(f"Spawned {len(created)} FEAT work items:")
+                for item in created:
+                    print(f"  {item['id']}: {item['path']}")
+            return
+
         if args.output == "template":
             template = create_consensus_template(inquiry_path)
             if args.write:
@@ -418,7 +473,7 @@ def main():
             else:
                 print(commands)
 
-    except FileNotFoundError as e:
+    except (FileNotFoundError, ValueError) as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
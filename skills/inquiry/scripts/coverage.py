@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Coverage Tracking for Inquiry Synthesis
+
+Reports which research paragraphs the synthesis actually consumed, so large
+inquiries can be checked for lost findings. A paragraph is covered when it
+was retrieved for the synthesis prompt (synthesis_context.json) or quoted
+in SYNTHESIS.md, meaning SYNTHESIS.md shares a run of at least
+QUOTE_SHINGLE_WORDS consecutive words with it. Paragraphs shorter than that
+need a run of all their words (at least MIN_SHINGLE_WORDS), and paragraphs
+below MIN_SHINGLE_WORDS count only if their exact text appears as a line of
+SYNTHESIS.md.
+
+Covered and uncovered sets are bitsets (Python ints) over paragraph
+positions in the research index. The uncovered paragraphs are clustered
+into emergent themes with a vectorized k-means over their embeddings
+(numpy); without numpy they are grouped by section heading instead.
+
+Usage:
+    python3 -m skills.inquiry.scripts.coverage INQ-001
+"""
+
+import json
+import math
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .paragraphs import Paragraph
+from .phase_manager import find_inquiry
+from .research_index import ResearchIndex
+from .synthesis_generator import RETRIEVAL_RECORD_FILE
+
+QUOTE_SHINGLE_WORDS = 8
+# Shorter runs match by chance; shorter paragraphs need their exact text
+MIN_SHINGLE_WORDS = 4
+DEFAULT_MAX_CLUSTERS = 8
+KMEANS_ITERATIONS = 25
+LABEL_TERMS = 4
+# Cluster labels are computed from at most this many members
+LABEL_SAMPLE = 200
+
+
+def iter_bits(bits: int):
+    """Yield the positions of the set bits of a bitset, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def _shingles(words: list[str], size: int) -> set[int]:
+    return {hash(tuple(words[i:i + size])) for i in range(len(words) - size + 1)}
+
+
+def _words(text: str) -> list[str]:
+    return re.findall(r"\w+", text.lower())
+
+
+def _normalize_line(line: str) -> str:
+    """Lowercase, collapse whitespace and drop list/quote/heading markers."""
+    return " ".join(line.lower().lstrip(" \t>#*-").split())
+
+
+class CoverageTracker:
+    """Covered/uncovered bitsets over the paragraphs of a research index."""
+
+    def __init__(self, index: ResearchIndex):
+        """
+        Initialize tracker with nothing covered.
+
+        Args:
+            index: Up-to-date research index of the inquiry
+        """
+        self.paragraphs: list[Paragraph] = sorted(
+            index.paragraphs.values(), key=lambda p: (p.source, p.index)
+        )
+        self.position = {p.id: i for i, p in enumerate(self.paragraphs)}
+        self.all_bits = (1 << len(self.paragraphs)) - 1
+        self.retrieved = 0
+        self.quoted = 0
+
+    def mark_retrieved(self, paragraph_ids) -> int:
+        """Mark paragraphs as retrieved; returns how many IDs were known."""
+        known = 0
+        for pid in paragraph_ids:
+            position = self.position.get(pid)
+            if position is not None:
+                self.retrieved |= 1 << position
+                known += 1
+        return known
+
+    def mark_quoted(self, text: str, shingle_words: int = QUOTE_SHINGLE_WORDS) -> None:
+        """Mark paragraphs that share a run of shingle_words words with text."""
+        text_words = _words(text)
+        lines = {_normalize_line(line) for line in text.splitlines()}
+        by_size = {shingle_words: _shingles(text_words, shingle_words)}
+        for i, paragraph in enumerate(self.paragraphs):
+            words = _words(paragraph.text)
+            if not words:
+                continue
+            if len(words) < MIN_SHINGLE_WORDS:
+                # Too few words to tell a quote from chance: require the exact text
+                if _normalize_line(paragraph.text) in lines:
+                    self.quoted |= 1 << i
+                continue
+            # Short paragraphs count when quoted in full
+            size = min(len(words), shingle_words)
+            if size not in by_size:
+                by_size[size] = _shingles(text_words, size)
+            if not by_size[size].isdisjoint(_shingles(words, size)):
+                self.quoted |= 1 << i
+
+    @property
+    def covered(self) -> int:
+        """Bitset of covered paragraphs."""
+        return self.retrieved | self.quoted
+
+    @property
+    def uncovered(self) -> int:
+        """Bitset of paragraphs neither retrieved nor quoted."""
+        return self.all_bits & ~self.covered
+
+    def uncovered_paragraphs(self) -> list[Paragraph]:
+        """Uncovered paragraphs in index order."""
+        return [self.paragraphs[i] for i in iter_bits(self.uncovered)]
+
+    def per_agent(self) -> dict[str, dict]:
+        """Covered/total paragraph counts per agent."""
+        stats: dict[str, dict] = {}
+        covered = self.covered
+        for i, paragraph in enumerate(self.paragraphs):
+            entry = stats.setdefault(paragraph.agent, {"covered": 0, "total": 0})
+            entry["total"] += 1
+            entry["covered"] += (covered >> i) & 1
+        return stats
+
+
+def kmeans(vectors: "np.ndarray", k: int, iterations: int = KMEANS_ITERATIONS, seed: int = 0) -> "np.ndarray":
+    """
+    Spherical k-means over L2-normalized rows; returns a label per row.
+
+    Centroids are seeded with k-means++ and every assignment step is a
+    single matrix product.
+    """
+    n = len(vectors)
+    rng = np.random.default_rng(seed)
+    centroids = [vectors[rng.integers(n)]]
+    distance = 1.0 - vectors @ centroids[0]
+    for _ in range(1, k):
+        weights = np.clip(distance, 0, None) ** 2
+        total = weights.sum()
+        choice = rng.choice(n, p=weights / total) if total > 0 else rng.integers(n)
+        centroids.append(vectors[choice])
+        distance = np.minimum(distance, 1.0 - vectors @ vectors[choice])
+    centroids = np.array(centroids)
+
+    labels = np.full(n, -1)
+    for _ in range(iterations):
+        new_labels = np.argmax(vectors @ centroids.T, axis=1)
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        one_hot = (labels[:, None] == np.arange(k)).astype(vectors.dtype)
+        sums = one_hot.T @ vectors
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        # Keep the previous centroid for a cluster that lost all members
+        centroids = np.where(norms > 0, sums / np.where(norms > 0, norms, 1), centroids)
+    return labels
+
+
+def label_terms(members: list[Paragraph], index: ResearchIndex) -> list[str]:
+    """
+    Most distinctive terms of a cluster (summed TF-IDF over its members).
+
+    Large clusters are labeled from an evenly spaced sample of members.
+    """
+    step = max(1, len(members) // LABEL_SAMPLE)
+    total = len(index.paragraphs)
+    weights: Counter = Counter()
+    for paragraph in members[::step]:
+        for term, tf in index.terms(paragraph.id).items():
+            weights[term] += (1 + math.log(tf)) * math.log(total / len(index.bm25.postings[term]))
+    return [term for term, _ in weights.most_common(LABEL_TERMS)]
+
+
+def cluster_uncovered(
+    tracker: CoverageTracker,
+    inquiry_path: Path,
+    index: ResearchIndex,
+    max_clusters: int = DEFAULT_MAX_CLUSTERS,
+) -> list[dict]:
+    """
+    Group uncovered paragraphs into emergent themes.
+
+    Uses k-means over paragraph embeddings (k grows with the square root
+    of the number of uncovered paragraphs, up to max_clusters), or groups
+    by section heading when numpy is not installed.
+
+    Returns:
+        Clusters, largest first: {"label", "size", "agents", "paragraphs"}
+    """
+    uncovered = tracker.uncovered_paragraphs()
+    if not uncovered:
+        return []
+
+    if np is not None:
+        from .embedding_index import EmbeddingIndex
+
+        embeddings = EmbeddingIndex(inquiry_path)
+        embeddings.refresh(index)
+        row_of = {row["id"]: i for i, row in enumerate(embeddings.rows)}
+        vectors = np.asarray(embeddings.vectors[[row_of[p.id] for p in uncovered]])
+        k = max(1, min(max_clusters, len(uncovered), round(math.sqrt(len(uncovered) / 2))))
+        labels = kmeans(vectors, k)
+        groups: dict[int, list[Paragraph]] = {}
+        for paragraph, label in zip(uncovered, labels):
+            groups.setdefault(int(label), []).append(paragraph)
+        members_list = list(groups.values())
+    else:
+        groups_by_section: dict[str, list[Paragraph]] = {}
+        for paragraph in uncovered:
+            groups_by_section.setdefault(paragraph.section or "(no section)", []).append(paragraph)
+        members_list = list(groups_by_section.values())
+
+    clusters = [
+        {
+            "label": label_terms(members, index),
+            "size": len(members),
+            "agents": sorted({p.agent for p in members}, key=lambda a: (len(a), a)),
+            "paragraphs": [p.id for p in members],
+        }
+        for members in members_list
+    ]
+    clusters.sort(key=lambda c: -c["size"])
+    return clusters[:max_clusters] if np is None else clusters
+
+
+def build_coverage_report(
+    inquiry_path: Path, max_clusters: int = DEFAULT_MAX_CLUSTERS
+) -> dict:
+    """
+    Compute the coverage report of an inquiry.
+
+    Returns:
+        Dict with totals, per-agent coverage, the inputs that were found
+        and the uncovered clusters
+    """
+    index = ResearchIndex(inquiry_path)
+    index.refresh()
+    tracker = CoverageTracker(index)
+
+    sources = {}
+    record_file = inquiry_path / RETRIEVAL_RECORD_FILE
+    if record_file.exists():
+        with open(record_file) as f:
+            record = json.load(f)
+        # Retrieval mode lists paragraphs per question, full mode in one list
+        ids = [p["id"] for q in record.get("questions", []) for p in q.get("paragraphs", [])]
+        ids += [p["id"] for p in record.get("paragraphs", [])]
+        sources[RETRIEVAL_RECORD_FILE] = tracker.mark_retrieved(ids)
+
+    synthesis_file = inquiry_path / "SYNTHESIS.md"
+    if synthesis_file.exists():
+        tracker.mark_quoted(synthesis_file.read_text())
+        sources["SYNTHESIS.md"] = bin(tracker.quoted).count("1")
+
+    total = len(tracker.paragraphs)
+    covered = bin(tracker.covered).count("1")
+    paragraphs = {p.id: p for p in tracker.paragraphs}
+    clusters = cluster_uncovered(tracker, inquiry_path, index, max_clusters)
+    for cluster in clusters:
+        cluster["examples"] = [
+            {
+                "id": pid,
+                "section": paragraphs[pid].section,
+                "text": paragraphs[pid].text[:160],
+            }
+            for pid in cluster["paragraphs"][:2]
+        ]
+
+    return {
+        "paragraphs": total,
+        "covered": covered,
+        "retrieved": bin(tracker.retrieved).count("1"),
+        "quoted": bin(tracker.quoted).count("1"),
+        "uncovered": total - covered,
+        "coverage": round(covered / total, 3) if total else 1.0,
+        "sources": sources,
+        "agents": tracker.per_agent(),
+        "clusters": clusters,
+    }
+
+
+def format_coverage_report(report: dict) -> str:
+    """Format a coverage report as compact markdown."""
+    lines = [
+        "# Research Coverage",
+        "",
+        f"**Covered**: {report['covered']}/{report['paragraphs']} paragraphs "
+        f"({report['coverage']:.0%}; {report['retrieved']} retrieved, {report['quoted']} quoted)",
+    ]
+    if not report["sources"]:
+        lines.append("")
+        lines.append(f"*Neither {RETRIEVAL_RECORD_FILE} nor SYNTHESIS.md found; nothing is covered yet*")
+
+    lines += ["", "| Agent | Covered | Total |", "|-------|---------|-------|"]
+    for agent, stats in sorted(report["agents"].items(), key=lambda item: (len(item[0]), item[0])):
+        lines.append(f"| {agent} | {stats['covered']} | {stats['total']} |")
+
+    if report["clusters"]:
+        lines += ["", "## Uncovered Themes", ""]
+        for number, cluster in enumerate(report["clusters"], 1):
+            lines.append(
+                f"{number}. **{', '.join(cluster['label']) or '(no terms)'}**: "
+                f"{cluster['size']} paragraph(s) from agent(s) {', '.join(cluster['agents'])}"
+            )
+            for example in cluster["examples"]:
+                text = " ".join(example["text"].split())
+                lines.append(f"   - `{example['id']}` {text}...")
+    return "\n".join(lines)
+
+
+def main():
+    """CLI interface for coverage tracking."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Report which research paragraphs synthesis covered")
+    parser.add_argument("inquiry", help="Inquiry ID or path")
+    parser.add_argument("--clusters", type=int, default=DEFAULT_MAX_CLUSTERS,
+                        help=f"Maximum number of uncovered themes (default: {DEFAULT_MAX_CLUSTERS})")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+    args = parser.parse_args()
+
+    inquiry_path = find_inquiry(args.inquiry)
+    if not inquiry_path:
+        print(f"Error: Could not find inquiry '{args.inquiry}'", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        report = build_coverage_report(inquiry_path, max(1, args.clusters))
+    except json.JSONDecodeError as e:
+        print(f"Error: Invalid JSON in {RETRIEVAL_RECORD_FILE}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_coverage_report(report))
+
+
+if __name__ == "__main__":
+    main()
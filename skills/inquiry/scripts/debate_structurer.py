@@ -6,14 +6,18 @@ Generates debate prompts and structures for Phase 3.
 """
 
 import json
-import re
+import os
 import sys
 from datetime import date
 from pathlib import Path
 from typing import Optional
 
+from .document_parser import parse_document_file
 from .phase_manager import load_inquiry, find_inquiry
 
+ADVOCATE_PROMPTS_DIR = "debate"
+POSITIONS = ("A", "B")
+
 
 ADVOCATE_PROMPT_TEMPLATE = """# Debate Advocate - {position_name}
 
@@ -223,84 +227,53 @@ def parse_synthesis_disagreements(synthesis_path: Path) -> list[dict]:
     """
     Parse SYNTHESIS.md to extract areas of disagreement for debate.
 
+    Rows of the "Areas of Disagreement" table come first, followed by
+    "Key Decision Points" entries whose topic is not already in the table.
+
     Returns list of decision points with positions.
     """
-    if not synthesis_path.exists():
-        return []
-
-    content = synthesis_path.read_text()
-    decision_points = []
-
-    # Look for "Areas of Disagreement" section
-    disagreement_match = re.search(
-        r'## Areas of Disagreement\s*\n(.*?)(?=\n## |\Z)',
-        content,
-        re.DOTALL
-    )
-
-    if disagreement_match:
-        section = disagreement_match.group(1)
-        # Parse table rows
-        rows = re.findall(r'\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|', section)
-        for i, row in enumerate(rows[1:], 1):  # Skip header
-            if row[0].strip() and row[0].strip() != '---':
-                decision_points.append({
-                    "num": i,
-                    "topic": row[0].strip(),
-                    "position_a": row[1].strip(),
-                    "position_b": row[2].strip(),
-                })
-
-    # Also look for "Key Decision Points" section
-    decision_match = re.search(
-        r'## Key Decision Points\s*\n(.*?)(?=\n## |\Z)',
-        content,
-        re.DOTALL
-    )
-
-    if decision_match:
-        section = decision_match.group(1)
-        # Parse decision point subsections
-        decisions = re.findall(
-            r'### Decision \d+:\s*([^\n]+)\s*\n.*?'
-            r'\*\*Question\*\*:\s*([^\n]+)',
-            section,
-            re.DOTALL
-        )
-        for i, (topic, question) in enumerate(decisions, len(decision_points) + 1):
-            if not any(dp["topic"] == topic.strip() for dp in decision_points):
-                decision_points.append({
-                    "num": i,
-                    "topic": topic.strip(),
-                    "question": question.strip(),
-                    "position_a": "[Needs definition]",
-                    "position_b": "[Needs definition]",
-                })
+    parsed = parse_document_file(synthesis_path)
+    decision_points = [dict(row) for row in parsed["disagreements"]]
+
+    for point in parsed["decision_points"]:
+        existing = next((dp for dp in decision_points if dp["topic"] == point["topic"]), None)
+        if existing is not None:
+            if point["question"] and "question" not in existing:
+                existing["question"] = point["question"]
+            continue
+        entry = {
+            "num": len(decision_points) + 1,
+            "topic": point["topic"],
+            "position_a": point["position_a"] or "[Needs definition]",
+            "position_b": point["position_b"] or "[Needs definition]",
+        }
+        if point["question"]:
+            entry["question"] = point["question"]
+        decision_points.append(entry)
 
     return decision_points
 
 
-def generate_advocate_prompt(
-    inquiry_path: Path,
-    position: str,
+def render_advocate_prompt(
+    report: dict,
     position_description: str,
     position_rationale: str = "",
-    advocate_id: str = "A"
+    advocate_id: str = "A",
+    title: Optional[str] = None,
+    question: Optional[str] = None
 ) -> str:
-    """Generate a prompt for a debate advocate."""
-    report = load_inquiry(inquiry_path)
-
+    """Render an advocate prompt from an already loaded inquiry report."""
     constraints = report.get("constraints", [])
     constraints_text = "\n".join(f"- {c}" for c in constraints) if constraints else "*None specified*"
 
     return ADVOCATE_PROMPT_TEMPLATE.format(
         position_name=f"Position {advocate_id}",
         advocate_id=advocate_id,
-        title=report.get("title", "Untitled"),
+        title=title or report.get("title", "Untitled"),
         position=advocate_id,
         position_description=position_description,
         position_rationale=position_rationale or "See supporting evidence below",
-        question=report.get("question", "No question specified"),
+        question=question or report.get("question", "No question specified"),
         context=report.get("context", "No context provided"),
         constraints=constraints_text,
         supporting_evidence="[Extract from synthesis]",
@@ -308,6 +281,92 @@ def generate_advocate_prompt(
     )
 
 
+def generate_advocate_prompt(
+    inquiry_path: Path,
+    position: str,
+    position_description: str,
+    position_rationale: str = "",
+    advocate_id: str = "A"
+) -> str:
+    """Generate a prompt for a debate advocate."""
+    report = load_inquiry(inquiry_path)
+    return render_advocate_prompt(report, position_description, position_rationale, advocate_id)
+
+
+def generate_advocate_prompts(inquiry_path: Path) -> list[dict]:
+    """
+    Generate advocate prompts for every decision point and position.
+
+    SYNTHESIS.md and inquiry_report.json are read once; each decision
+    point gets a Position A and a Position B prompt.
+
+    Returns:
+        Prompts as {"num", "topic", "position", "file", "prompt"} dicts,
+        where file is relative to the inquiry directory
+    """
+    report = load_inquiry(inquiry_path)
+    decision_points = parse_synthesis_disagreements(inquiry_path / "SYNTHESIS.md")
+    title = report.get("title", "Untitled")
+
+    prompts = []
+    for dp in decision_points:
+        question = dp.get("question", f"What is the best approach for {dp['topic']}?")
+        for position in POSITIONS:
+            prompts.append({
+                "num": dp["num"],
+                "topic": dp["topic"],
+                "position": position,
+                "file": f"{ADVOCATE_PROMPTS_DIR}/decision-{dp['num']}-{position}.md",
+                "prompt": render_advocate_prompt(
+                    report,
+                    dp[f"position_{position.lower()}"],
+                    advocate_id=position,
+                    title=f"{title} - Decision Point {dp['num']}: {dp['topic']}",
+                    question=question
+                ),
+            })
+    return prompts
+
+
+def write_advocate_prompts(inquiry_path: Path, prompts: list[dict]) -> list[str]:
+    """
+    Write advocate prompts into debate/ with one atomic-rename pass.
+
+    Every file is first written to a temporary name next to its target;
+    only when all of them were written are they renamed into place.
+    Prompts left over from an earlier run with more decision points are
+    removed afterwards.
+
+    Returns:
+        Paths of the written files
+    """
+    prompts_dir = inquiry_path / ADVOCATE_PROMPTS_DIR
+    prompts_dir.mkdir(exist_ok=True)
+
+    staged: list[tuple[Path, Path]] = []
+    try:
+        for item in prompts:
+            output_path = inquiry_path / item["file"]
+            tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+            with open(tmp_path, "w") as f:
+                f.write(item["prompt"])
+            staged.append((tmp_path, output_path))
+    except OSError:
+        for tmp_path, _ in staged:
+            tmp_path.unlink(missing_ok=True)
+        raise
+
+    for tmp_path, output_path in staged:
+        os.replace(tmp_path, output_path)
+
+    written = {output_path for _, output_path in staged}
+    for stale in prompts_dir.glob("decision-*-[AB].md"):
+        if stale not in written:
+            stale.unlink()
+
+    return [str(output_path) for _, output_path in staged]
+
+
 def create_debate_template(inquiry_path: Path) -> str:
     """Create a debate document template from synthesis."""
     report = load_inquiry(inquiry_path)
@@ -353,8 +412,10 @@ def main():
 
     parser = argparse.ArgumentParser(description="Generate debate structure and prompts")
     parser.add_argument("inquiry", help="Inquiry ID or path")
-    parser.add_argument("--output", choices=["template", "advocate", "analysis"],
-                        default="template", help="What to generate")
+    parser.add_argument("--output", choices=["template", "advocate", "advocates", "analysis"],
+                        default="template",
+                        help="What to generate (advocates: write every decision point's "
+                             "A and B prompts to debate/)")
     parser.add_argument("--position", help="Position for advocate prompt (A or B)")
     parser.add_argument("--position-desc", help="Position description")
     parser.add_argument("--write", action="store_true",
@@ -399,6 +460,24 @@ def main():
             else:
                 print(prompt)
 
+        elif args.output == "advocates":
+            prompts = generate_advocate_prompts(inquiry_path)
+            if not prompts:
+                print("Error: No decision points found in SYNTHESIS.md", file=sys.stderr)
+                sys.exit(1)
+            files = write_advocate_prompts(inquiry_path, prompts)
+            if args.json:
+                print(json.dumps({
+                    "files": files,
+                    "decision_points": len(prompts) // len(POSITIONS)
+                }, indent=2))
+            else:
+                print(f"Wrote {len(files)} advocate prompts for "
+                      f"{len(prompts) // len(POSITIONS)} decision points to "
+                      f"{inquiry_path / ADVOCATE_PROMPTS_DIR}")
+                for item in prompts:
+                    print(f"  {item['file']}: Decision {item['num']} ({item['topic']}), Position {item['position']}")
+
         elif args.output == "analysis":
             synthesis_path = inquiry_path / "SYNTHESIS.md"
             decision_points = parse_synthesis_disagreements(synthesis_path)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Deliberation Document Parser
+
+Single-pass, line-oriented parser for SYNTHESIS.md, DEBATE.md and
+CONSENSUS.md. One compiled regex walks the document and stops only at
+structural lines (code fences, headings, rules, table rows and
+"**Field**:" lines); each is fed to a small state machine that tracks the
+current "##" section, the open "###" block and the field being collected.
+Field values are sliced from the text between structural lines. Parsing
+is linear in document size and never backtracks across sections, unlike
+searching the whole document with lazy DOTALL regexes.
+
+Recognized structures:
+- "### Decision Point N: topic" blocks (DEBATE.md) -> decisions
+- table rows under "## Areas of Disagreement" (SYNTHESIS.md) -> disagreements
+- "### Decision N: topic" blocks under "## Key Decision Points"
+  (SYNTHESIS.md) -> decision_points
+- "### FEAT-XXX: title" blocks under "## Work Items to Spawn"
+  (CONSENSUS.md) -> work_items
+
+A field's value is the text after "**Field**:" plus the lines that follow
+it, up to the next field, heading or "---" rule. Only the first occurrence
+of a field within a block counts. Missing fields are None; callers choose
+their own defaults.
+
+Usage:
+    python3 -m skills.inquiry.scripts.document_parser INQ-001/DEBATE.md --json
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Optional
+
+# One alternation classifies every structural line; ordinary lines are
+# skipped inside the regex engine and never reach Python code
+LINE_PATTERN = re.compile(
+    r"^[ \t]*(?:"
+    r"(?P<fence>`{3,}|~{3,})(?P<info>[^\n]*)"
+    r"|(?P<hashes>#{1,6})[ \t]+(?P<title>[^\n]*?)[ \t]*#*[ \t\r]*$"
+    r"|(?P<rule>-{3,}|\*{3,}|_{3,})[ \t\r]*$"
+    r"|\*\*(?P<field>[^*\n]+)\*\*:[ \t]*"
+    r"|(?P<row>\|[^\n]*)"
+    r")",
+    re.MULTILINE,
+)
+TABLE_SEPARATOR_PATTERN = re.compile(r"^:?-+:?$")
+OPTION_PATTERN = re.compile(r"^[-*]\s*(?:Option|Position)\s+([AB])\s*:\s*(.*)$", re.MULTILINE)
+LIST_ITEM_PATTERN = re.compile(r"^[ \t]*[-*][ \t]+(?:\[[ xX]\][ \t]*)?(\S[^\n]*?)[ \t\r]*$", re.MULTILINE)
+
+DECISION_POINT_PATTERN = re.compile(r"^Decision Point (\d+):\s*(.*)$")
+KEY_DECISION_PATTERN = re.compile(r"^Decision (\d+):\s*(.*)$")
+WORK_ITEM_PATTERN = re.compile(r"^(FEAT-\w+):\s*(.*)$")
+
+DISAGREEMENT_SECTION = "areas of disagreement"
+KEY_DECISIONS_SECTION = "key decision points"
+WORK_ITEMS_SECTION = "work items to spawn"
+
+
+def _first_line(value: Optional[str]) -> Optional[str]:
+    """First non-blank line of a field value (None if the field is absent)."""
+    if value is None:
+        return None
+    return value.strip().partition("\n")[0].strip()
+
+
+def _block_text(value: Optional[str]) -> Optional[str]:
+    """Whole field value with surrounding whitespace removed."""
+    return value.strip() if value is not None else None
+
+
+def _finish_block(kind: str, block: dict, result: dict) -> None:
+    """Turn a closed block's raw fields into its result record."""
+    fields = block["fields"]
+    if kind == "decision":
+        result["decisions"].append({
+            "num": block["num"],
+            "topic": block["topic"],
+            "question": _first_line(fields.get("question")),
+            "resolution": _first_line(fields.get("prevailing position")),
+            "rationale": _block_text(fields.get("rationale")),
+            "confidence": _first_line(fields.get("confidence")),
+        })
+    elif kind == "decision_point":
+        options = {}
+        for option, description in OPTION_PATTERN.findall(fields.get("options") or ""):
+            options.setdefault(option, description.strip())
+        result["decision_points"].append({
+            "num": block["num"],
+            "topic": block["topic"],
+            "question": _first_line(fields.get("question")),
+            "position_a": options.get("A"),
+            "position_b": options.get("B"),
+        })
+    elif kind == "work_item":
+        result["work_items"].append({
+            "id": block["id"],
+            "title": block["topic"],
+            "type": _first_line(fields.get("type")),
+            "priority": _first_line(fields.get("priority")),
+            "effort": _first_line(fields.get("estimated effort")),
+            "description": _block_text(fields.get("description")),
+            "acceptance_criteria": LIST_ITEM_PATTERN.findall(fields.get("acceptance criteria") or ""),
+            "source": _first_line(fields.get("source")),
+        })
+
+
+def parse_document(content: str) -> dict:
+    """
+    Parse a deliberation document in one pass.
+
+    Args:
+        content: Markdown text of SYNTHESIS.md, DEBATE.md or CONSENSUS.md
+
+    Returns:
+        Dict with "decisions", "disagreements", "decision_points" and
+        "work_items" lists, each in document order
+    """
+    result: dict = {"decisions": [], "disagreements": [], "decision_points": [], "work_items": []}
+
+    section = ""                   # Current "##" heading, lowercased
+    kind: Optional[str] = None     # Kind of the open block
+    block: Optional[dict] = None
+    block_level = 0
+    field: Optional[str] = None    # Name of the field being collected
+    field_start = 0                # Offset where its value starts
+    fence: Optional[str] = None
+    table_end = -2                 # End offset of the previous table row
+
+    for match in LINE_PATTERN.finditer(content):
+        line_kind = match.lastgroup  # "info", "title", "rule", "field" or "row"
+        if fence is not None:
+            # Only a bare closing fence of the same kind ends a code block
+            if line_kind == "info":
+                marker = match.group("fence")
+                if marker[0] == fence[0] and len(marker) >= len(fence) and not match.group("info").strip():
+                    fence = None
+            continue
+        if line_kind == "info":
+            fence = match.group("fence")
+            continue
+
+        # Every other structural line ends the field being collected
+        if field is not None:
+            block["fields"][field] = content[field_start:match.start()]
+            field = None
+
+        if line_kind == "field":
+            if block is not None:
+                name = match.group("field").strip().lower()
+                if name not in block["fields"]:
+                    field, field_start = name, match.end()
+            continue
+
+        if line_kind == "row":
+            header = match.start() != table_end + 1
+            table_end = match.end()
+            if section == DISAGREEMENT_SECTION and not header:
+                cells = [cell.strip() for cell in match.group("row").strip().strip("|").split("|")]
+                if len(cells) >= 3 and cells[0] \
+                        and not all(TABLE_SEPARATOR_PATTERN.match(cell) for cell in cells if cell):
+                    result["disagreements"].append({
+                        "num": len(result["disagreements"]) + 1,
+                        "topic": cells[0],
+                        "position_a": cells[1],
+                        "position_b": cells[2],
+                    })
+            continue
+
+        if line_kind == "rule":
+            continue
+
+        level = len(match.group("hashes"))
+        title = match.group("title")
+        if block is not None and level <= block_level:
+            _finish_block(kind, block, result)
+            block, kind = None, None
+        if level <= 2:
+            section = title.lower()
+            continue
+        # Blocks start at "###"; deeper headings inside a block are part of it
+        if block is not None:
+            continue
+        heading = DECISION_POINT_PATTERN.match(title)
+        if heading:
+            kind = "decision"
+        elif section == KEY_DECISIONS_SECTION:
+            heading = KEY_DECISION_PATTERN.match(title)
+            kind = "decision_point"
+        elif section == WORK_ITEMS_SECTION:
+            heading = WORK_ITEM_PATTERN.match(title)
+            kind = "work_item"
+        if heading:
+            block, block_level = {"fields": {}}, level
+            if kind == "work_item":
+                block["id"], block["topic"] = heading.group(1), heading.group(2).strip()
+            else:
+                block["num"], block["topic"] = int(heading.group(1)), heading.group(2).strip()
+
+    if field is not None:
+        block["fields"][field] = content[field_start:]
+    if block is not None:
+        _finish_block(kind, block, result)
+    return result
+
+
+def parse_document_file(path: Path) -> dict:
+    """
+    Parse a deliberation document file.
+
+    Returns:
+        Parse result (see parse_document); all lists are empty if the file
+        does not exist
+    """
+    try:
+        content = Path(path).read_text()
+    except FileNotFoundError:
+        content = ""
+    return parse_document(content)
+
+
+def main():
+    """CLI interface for the document parser."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Parse SYNTHESIS.md, DEBATE.md or CONSENSUS.md")
+    parser.add_argument("file", help="Markdown document to parse")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+    args = parser.parse_args()
+
+    path = Path(args.file)
+    if not path.is_file():
+        print(f"Error: File not found: {path}", file=sys.stderr)
+        sys.exit(1)
+
+    result = parse_document_file(path)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for key, items in result.items():
+            print(f"{key}: {len(items)}")
+            for item in items:
+                label = item.get("num", item.get("id"))
+                print(f"  {label}: {item.get('topic', item.get('title'))}")
+
+
+if __name__ == "__main__":
+    main()
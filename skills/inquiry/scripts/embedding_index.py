@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Embedding Index for Inquiry Orchestration
+
+Dense vectors for the research paragraphs of an inquiry, for semantic
+retrieval and coverage tracking. Vectors are L2-normalized float32 rows of
+a memory-mapped NumPy array in the inquiry's .cache/embeddings/vectors.f32.
+A sidecar metadata table (meta.json) stores each row's paragraph ID,
+source file, section header and line range, plus the embedder identity and
+the size and mtime of every indexed report. refresh() re-embeds only the
+paragraphs of reports that changed.
+
+Embedders are pluggable: anything with a ``name``, a ``dim`` and an
+``embed(texts) -> float32 array`` method can be registered with
+register_embedder(). The default "hashing" embedder is an offline hashing
+vectorizer (signed feature hashing of words and word bigrams), so indexing
+and search run locally without downloading a model.
+
+Usage:
+    python3 -m skills.inquiry.scripts.embedding_index INQ-001 --query "completion detection"
+"""
+
+import json
+import os
+import shutil
+import sys
+import zlib
+from pathlib import Path
+from typing import Callable, Optional, Protocol
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .paragraphs import Paragraph, tokenize
+from .phase_manager import find_inquiry
+from .research_index import ResearchIndex, scan_reports
+
+INDEX_DIR = ".cache/embeddings"
+VECTORS_FILE = "vectors.f32"
+META_FILE = "meta.json"
+# Bump when the on-disk layout changes
+INDEX_VERSION = 1
+
+DEFAULT_EMBEDDER = "hashing"
+DEFAULT_DIM = 384
+
+
+class Embedder(Protocol):
+    """Interface of an embedding model."""
+
+    name: str
+    dim: int
+
+    def embed(self, texts: list[str]) -> "np.ndarray":
+        """Return a (len(texts), dim) float32 array."""
+        ...
+
+
+class HashingEmbedder:
+    """Offline hashing vectorizer: signed feature hashing of words and bigrams."""
+
+    def __init__(self, dim: int = DEFAULT_DIM, bigrams: bool = True):
+        """
+        Initialize embedder.
+
+        Args:
+            dim: Vector dimension (number of hash buckets)
+            bigrams: Whether to hash adjacent word pairs as well as words
+        """
+        self.dim = dim
+        self.bigrams = bigrams
+        self.name = f"hashing-{dim}{'-bigrams' if bigrams else ''}"
+        self._cache: dict[str, int] = {}
+
+    def _hash(self, feature: str) -> int:
+        value = self._cache.get(feature)
+        if value is None:
+            value = zlib.crc32(feature.encode("utf-8"))
+            self._cache[feature] = value
+        return value
+
+    def embed(self, texts: list[str]) -> "np.ndarray":
+        """Embed texts as sublinear-TF hashed vectors (not normalized)."""
+        rows, hashes = [], []
+        for row, text in enumerate(texts):
+            words = tokenize(text)
+            features = words + [f"{a} {b}" for a, b in zip(words, words[1:])] if self.bigrams else words
+            hashes.extend(self._hash(f) for f in features)
+            rows.extend([row] * len(features))
+
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        if hashes:
+            hashes = np.asarray(hashes, dtype=np.uint32)
+            signs = np.where(hashes & 0x80000000, -1.0, 1.0).astype(np.float32)
+            np.add.at(matrix, (np.asarray(rows), hashes % self.dim), signs)
+            # Dampen repeated features
+            np.copyto(matrix, np.sign(matrix) * np.log1p(np.abs(matrix)))
+        return matrix
+
+
+EMBEDDERS: dict[str, Callable[[], Embedder]] = {
+    "hashing": HashingEmbedder,
+}
+
+
+def register_embedder(name: str, factory: Callable[[], Embedder]) -> None:
+    """Make an embedder available by name (e.g. a local sentence model)."""
+    EMBEDDERS[name] = factory
+
+
+def get_embedder(name: str = DEFAULT_EMBEDDER) -> Embedder:
+    """Instantiate a registered embedder."""
+    if name not in EMBEDDERS:
+        raise ValueError(f"Unknown embedder '{name}' (available: {', '.join(sorted(EMBEDDERS))})")
+    return EMBEDDERS[name]()
+
+
+def normalize_rows(matrix: "np.ndarray") -> "np.ndarray":
+    """L2-normalize rows in place (zero rows stay zero) and return the matrix."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def paragraph_text(paragraph: Paragraph) -> str:
+    """Text embedded for a paragraph; its section heading adds context."""
+    return f"{paragraph.section}\n{paragraph.text}" if paragraph.section else paragraph.text
+
+
+class EmbeddingIndex:
+    """Memory-mapped paragraph embeddings with a sidecar metadata table."""
+
+    def __init__(self, inquiry_path: Path, embedder: Optional[Embedder] = None, persist: bool = True):
+        """
+        Initialize the index.
+
+        Args:
+            inquiry_path: Path to inquiry directory
+            embedder: Embedding model (defaults to the hashing embedder)
+            persist: Whether to read/write the index files
+        """
+        if np is None:
+            raise ImportError("embedding_index requires numpy (pip install numpy)")
+
+        self.inquiry_path = Path(inquiry_path)
+        self.index_dir = self.inquiry_path / INDEX_DIR
+        self.embedder = embedder or get_embedder()
+        self.persist = persist
+
+        self.rows: list[dict] = []
+        self.files: dict[str, dict] = {}
+        self.vectors = np.zeros((0, self.embedder.dim), dtype=np.float32)
+        self.embedded = 0
+        self._loaded = False
+
+    def _load(self) -> None:
+        self._loaded = True
+        if not self.persist:
+            return
+        try:
+            with open(self.index_dir / META_FILE) as f:
+                meta = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if (
+            meta.get("version") != INDEX_VERSION
+            or meta.get("embedder") != self.embedder.name
+            or meta.get("dim") != self.embedder.dim
+        ):
+            return
+
+        rows = meta.get("rows", [])
+        vectors_path = self.index_dir / VECTORS_FILE
+        expected = len(rows) * self.embedder.dim * 4
+        try:
+            if os.path.getsize(vectors_path) != expected:
+                return
+        except OSError:
+            return
+        if rows:
+            self.vectors = np.memmap(
+                vectors_path, dtype=np.float32, mode="r", shape=(len(rows), self.embedder.dim)
+            )
+        self.rows = rows
+        self.files = meta.get("files", {})
+
+    def _save(self) -> None:
+        if not self.persist:
+            return
+        vectors_path = self.index_dir / VECTORS_FILE
+        meta_path = self.index_dir / META_FILE
+        tmp_vectors = vectors_path.with_name(vectors_path.name + ".tmp")
+        tmp_meta = meta_path.with_name(meta_path.name + ".tmp")
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            np.ascontiguousarray(self.vectors, dtype=np.float32).tofile(tmp_vectors)
+            with open(tmp_meta, "w") as f:
+                f.write(json.dumps({
+                    "version": INDEX_VERSION,
+                    "embedder": self.embedder.name,
+                    "dim": self.embedder.dim,
+                    "files": self.files,
+                    "rows": self.rows,
+                }))
+            os.replace(tmp_vectors, vectors_path)
+            os.replace(tmp_meta, meta_path)
+        except OSError:
+            # The index is an optimization only; keep serving from memory
+            tmp_vectors.unlink(missing_ok=True)
+            tmp_meta.unlink(missing_ok=True)
+
+    def refresh(self, research_index: Optional[ResearchIndex] = None) -> list[str]:
+        """
+        Bring the embeddings up to date with the research reports.
+
+        Args:
+            research_index: Up-to-date research index to take paragraphs
+                from (opened here, only if a report changed, when not given)
+
+        Returns:
+            Names of the reports whose paragraphs were (re)embedded or dropped
+        """
+        if not self._loaded:
+            self._load()
+
+        current = research_index.files if research_index else scan_reports(self.inquiry_path / "research")
+        changed = {name for name, meta in current.items() if self.files.get(name) != meta}
+        removed = {name for name in self.files if name not in current}
+        if not changed and not removed:
+            return []
+
+        if research_index is None:
+            research_index = ResearchIndex(self.inquiry_path, persist=self.persist)
+            research_index.refresh()
+            current = research_index.files
+            changed = {name for name, meta in current.items() if self.files.get(name) != meta}
+            removed = {name for name in self.files if name not in current}
+
+        keep = [i for i, row in enumerate(self.rows) if row["source"] not in changed | removed]
+        new_paragraphs = [
+            p for p in sorted(research_index.paragraphs.values(), key=lambda p: (p.source, p.index))
+            if p.source in changed
+        ]
+        new_vectors = self.embedder.embed([paragraph_text(p) for p in new_paragraphs])
+        new_vectors = normalize_rows(np.asarray(new_vectors, dtype=np.float32).reshape(-1, self.embedder.dim))
+        self.embedded = len(new_paragraphs)
+
+        self.vectors = np.concatenate([np.asarray(self.vectors[keep]), new_vectors])
+        self.rows = [self.rows[i] for i in keep] + [
+            {
+                "id": p.id,
+                "source": p.source,
+                "section": p.section,
+                "line_start": p.line_start,
+                "line_end": p.line_end,
+            }
+            for p in new_paragraphs
+        ]
+        self.files = {name: dict(meta) for name, meta in current.items()}
+
+        self._save()
+        return sorted(changed | removed)
+
+    def search(self, queries: list[str], k: int = 10) -> list[list[tuple[dict, float]]]:
+        """
+        Batched top-K cosine search.
+
+        All queries are embedded in one call and scored with one matrix
+        product; argpartition selects each query's top K without sorting
+        every row.
+
+        Returns:
+            For each query, up to k (row metadata, cosine similarity) pairs, best first
+        """
+        if not queries:
+            return []
+        if not self.rows or k <= 0:
+            return [[] for _ in queries]
+
+        query_vectors = normalize_rows(np.asarray(self.embedder.embed(queries), dtype=np.float32))
+        similarities = query_vectors @ self.vectors.T
+
+        k = min(k, len(self.rows))
+        if k < len(self.rows):
+            top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(len(self.rows)), (len(queries), k))
+        top_scores = np.take_along_axis(similarities, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+
+        results = []
+        for q in range(len(queries)):
+            results.append([
+                (self.rows[int(top[q, j])], float(top_scores[q, j])) for j in order[q]
+            ])
+        return results
+
+
+def main():
+    """CLI interface for the embedding index."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Semantic search over research paragraphs")
+    parser.add_argument("inquiry", help="Inquiry ID or path")
+    parser.add_argument("--query", action="append", default=[],
+                        help="Text to search for (repeat for a batched search)")
+    parser.add_argument("-k", type=int, default=5, help="Results per query")
+    parser.add_argument("--embedder", default=DEFAULT_EMBEDDER,
+                        help=f"Registered embedder (default: {DEFAULT_EMBEDDER})")
+    parser.add_argument("--rebuild", action="store_true", help="Discard the index and rebuild it")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+    args = parser.parse_args()
+
+    inquiry_path = find_inquiry(args.inquiry)
+    if not inquiry_path:
+        print(f"Error: Could not find inquiry '{args.inquiry}'", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        index = EmbeddingIndex(inquiry_path, get_embedder(args.embedder))
+    except (ImportError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.rebuild:
+        shutil.rmtree(inquiry_path / INDEX_DIR, ignore_errors=True)
+    updated = index.refresh()
+
+    if not args.query:
+        stats = {
+            "paragraphs": len(index.rows),
+            "dim": index.embedder.dim,
+            "embedder": index.embedder.name,
+            "updated": updated,
+        }
+        if args.json:
+            print(json.dumps(stats, indent=2))
+        else:
+            print(f"{stats['paragraphs']} paragraphs embedded with {stats['embedder']}; "
+                  f"updated: {', '.join(updated) or 'none'}")
+        return
+
+    results = index.search(args.query, args.k)
+    if args.json:
+        print(json.dumps([
+            {"query": query, "results": [{**row, "score": round(score, 4)} for row, score in hits]}
+            for query, hits in zip(args.query, results)
+        ], indent=2))
+    else:
+        for query, hits in zip(args.query, results):
+            print(f"Query: {query}")
+            for row, score in hits:
+                print(f"  [{score:.3f}] {row['source']}:{row['line_start']}-{row['line_end']} "
+                      f"({row['section'] or 'no section'})")
+            print()
+
+
+if __name__ == "__main__":
+    main()
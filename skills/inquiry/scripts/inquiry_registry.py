@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Inquiry Registry
+
+Resolves inquiry IDs (e.g. INQ-001) to inquiry directories through an
+ID -> directory map persisted next to inquiries.md, in
+.cache/inquiry_index.json. The map is refreshed only when the inquiries
+directory's mtime changes (an inquiry was added, removed or renamed), so a
+lookup normally costs one stat() and a dict access instead of a directory
+listing. The index lives in a subdirectory so that writing it does not
+itself change the inquiries directory's mtime.
+
+This module is shared by the inquiry skills: skills/inquiry-collector
+loads it by file path, so it must only import the standard library.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+INDEX_FILE = ".cache/inquiry_index.json"
+INDEX_VERSION = 1
+
+# Directory names start with the inquiry ID: INQ-001-topic-name
+INQUIRY_ID_PATTERN = re.compile(r"^(INQ-\d+)", re.IGNORECASE)
+
+
+def normalize_inquiry_id(identifier: str) -> str:
+    """Normalize an inquiry identifier: "1" / "001" / "inq-001" -> "INQ-001"."""
+    identifier = identifier.strip().upper()
+    if identifier.isdigit():
+        identifier = f"INQ-{identifier.zfill(3)}"
+    return identifier
+
+
+class InquiryRegistry:
+    """ID -> directory index for one inquiries directory."""
+
+    def __init__(self, inquiries_dir: Path, persist: Optional[bool] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            inquiries_dir: Directory containing INQ-* directories
+            persist: Whether to read/write the index file. Defaults to True
+                only when the directory holds inquiries.md, so arbitrary
+                search directories (e.g. the working directory) are not
+                written to.
+        """
+        self.inquiries_dir = Path(inquiries_dir)
+        self.index_path = self.inquiries_dir / INDEX_FILE
+        if persist is None:
+            persist = (self.inquiries_dir / "inquiries.md").exists()
+        self.persist = persist
+
+        self._mtime_ns: Optional[int] = None
+        self._entries: dict[str, str] = {}
+        self._names: list[str] = []
+        self._loaded = False
+
+    def _load(self) -> None:
+        self._loaded = True
+        if not self.persist:
+            return
+        try:
+            with open(self.index_path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self._mtime_ns = data.get("dir_mtime_ns")
+        self._names = list(data.get("names", []))
+        self._entries = dict(data.get("entries", {}))
+
+    def _save(self) -> None:
+        if not self.persist:
+            return
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            self.index_path.parent.mkdir(exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({
+                    "version": INDEX_VERSION,
+                    "dir_mtime_ns": self._mtime_ns,
+                    "names": self._names,
+                    "entries": self._entries,
+                }, f, indent=2)
+                f.write("\n")
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)  # The index is an optimization only
+
+    def refresh(self, force: bool = False) -> None:
+        """Rescan the inquiries directory if its mtime changed."""
+        if not self._loaded:
+            self._load()
+
+        if self.persist:
+            # Create the cache directory first: doing so changes the mtime
+            try:
+                self.index_path.parent.mkdir(exist_ok=True)
+            except OSError:
+                self.persist = False
+
+        try:
+            mtime_ns = os.stat(self.inquiries_dir).st_mtime_ns
+        except OSError:
+            self._mtime_ns, self._names, self._entries = None, [], {}
+            return
+
+        if not force and mtime_ns == self._mtime_ns:
+            return
+
+        known = set(self._names)
+        names = []
+        with os.scandir(self.inquiries_dir) as entries:
+            for entry in entries:
+                if entry.name in known or (
+                    INQUIRY_ID_PATTERN.match(entry.name) and entry.is_dir()
+                ):
+                    names.append(entry.name)
+        names.sort()
+
+        index: dict[str, str] = {}
+        for name in names:
+            match = INQUIRY_ID_PATTERN.match(name)
+            if match:
+                # First directory (by name) wins if an ID is duplicated
+                index.setdefault(match.group(1).upper(), name)
+
+        self._mtime_ns = mtime_ns
+        self._names = names
+        self._entries = index
+        self._save()
+
+    def entries(self) -> dict[str, Path]:
+        """Return the full ID -> path map."""
+        self.refresh()
+        return {inquiry_id: self.inquiries_dir / name for inquiry_id, name in self._entries.items()}
+
+    def lookup(self, identifier: str) -> Optional[Path]:
+        """
+        Resolve an inquiry ID (or a directory-name prefix) to its directory.
+
+        Returns the first of candidates(), or None if nothing matches.
+        """
+        return next(iter(self.candidates(identifier)), None)
+
+    def candidates(self, identifier: str) -> list[Path]:
+        """
+        Every existing directory matching an inquiry ID or name prefix.
+
+        A bare ID (e.g. "INQ-001") matches the directories with exactly that
+        ID; other identifiers (e.g. "INQ-001-auth") match by name prefix.
+        Matches are in name order, so the first is the indexed directory.
+        """
+        self.refresh()
+        key = normalize_inquiry_id(identifier)
+
+        names = self._match_names(key)
+        if any(not (self.inquiries_dir / name).is_dir() for name in names):
+            # Stale entry (e.g. renamed within the mtime granularity)
+            self.refresh(force=True)
+            names = self._match_names(key)
+        return [self.inquiries_dir / name for name in names if (self.inquiries_dir / name).is_dir()]
+
+    def _match_names(self, key: str) -> list[str]:
+        match = INQUIRY_ID_PATTERN.match(key)
+        if match and match.group(1).upper() == key:
+            return [
+                name for name in self._names
+                if (name_match := INQUIRY_ID_PATTERN.match(name)) and name_match.group(1).upper() == key
+            ]
+        return [name for name in self._names if name.upper().startswith(key)]
+
+
+def find_inquiry_dir(identifier: str, base_dirs: list[Path]) -> Optional[Path]:
+    """Resolve an inquiry through the registries of several base directories, in order."""
+    for base in base_dirs:
+        path = InquiryRegistry(base).lookup(identifier)
+        if path is not None:
+            return path
+    return None
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Paragraph Extraction for Research Reports
+
+Splits research markdown into paragraphs, the unit used for retrieval and
+context packing. Blank lines and headings separate paragraphs; a fenced
+code block is kept whole as one paragraph, even if it contains blank
+lines or lines that look like headings. Each paragraph remembers its
+source file, section header and line range.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+# Rough token estimate for prompt budgeting
+CHARS_PER_TOKEN = 4
+
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+FENCE_PATTERN = re.compile(r"^\s*(`{3,}|~{3,})")
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[_'][a-z0-9]+)*")
+
+# Words that carry no topical signal for lexical scoring
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "been", "but", "by", "can",
+    "do", "does", "for", "from", "has", "have", "how", "if", "in", "into",
+    "is", "it", "its", "not", "of", "on", "or", "should", "so", "such",
+    "that", "the", "their", "then", "there", "these", "this", "to", "was",
+    "we", "were", "what", "when", "which", "while", "will", "with", "would",
+})
+
+
+@dataclass
+class Paragraph:
+    """One paragraph of a research report."""
+    source: str           # Report file name, e.g. "agent-1.md"
+    index: int            # Position within the report (0-based)
+    section: str          # Nearest preceding heading text ("" if none)
+    section_level: int    # Heading level of the section (0 if none)
+    line_start: int       # First line, 1-based
+    line_end: int         # Last line, inclusive
+    text: str
+    kind: str = "text"    # "text" or "code"
+
+    @property
+    def id(self) -> str:
+        """Stable identifier within an inquiry: "agent-1.md#3"."""
+        return f"{self.source}#{self.index}"
+
+    @property
+    def agent(self) -> str:
+        """Agent number derived from the source name ("agent-2.md" -> "2")."""
+        stem = self.source.rsplit(".", 1)[0]
+        return stem[len("agent-"):] if stem.startswith("agent-") else stem
+
+    @property
+    def tokens(self) -> int:
+        """Estimated prompt tokens of the paragraph text."""
+        return estimate_tokens(self.text)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate prompt tokens for text (about 4 characters per token)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase content words of text, in order, without stopwords."""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def split_paragraphs(content: str, source: str = "") -> list[Paragraph]:
+    """
+    Split markdown content into paragraphs.
+
+    Args:
+        content: Markdown text
+        source: Name recorded as each paragraph's source
+
+    Returns:
+        Paragraphs in document order (headings themselves are not
+        paragraphs; they become the section of the paragraphs below them)
+    """
+    paragraphs: list[Paragraph] = []
+    section, section_level = "", 0
+    buffer: list[str] = []
+    start = 0
+    fence: Optional[str] = None
+
+    def flush(end: int, kind: str = "text") -> None:
+        text = "\n".join(buffer).strip("\n")
+        if text.strip():
+            paragraphs.append(Paragraph(
+                source=source,
+                index=len(paragraphs),
+                section=section,
+                section_level=section_level,
+                line_start=start,
+                line_end=end,
+                text=text,
+                kind=kind,
+            ))
+        buffer.clear()
+
+    for number, line in enumerate(content.split("\n"), start=1):
+        if fence is not None:
+            buffer.append(line)
+            match = FENCE_PATTERN.match(line)
+            if match and match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence) \
+                    and not line.strip()[len(match.group(1)):].strip():
+                flush(number, "code")
+                fence = None
+            continue
+
+        match = FENCE_PATTERN.match(line)
+        if match:
+            flush(number - 1)
+            fence = match.group(1)
+            start = number
+            buffer.append(line)
+            continue
+
+        if not line.strip():
+            flush(number - 1)
+            continue
+
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            flush(number - 1)
+            section_level = len(heading.group(1))
+            section = heading.group(2)
+            continue
+
+        if not buffer:
+            start = number
+        buffer.append(line)
+
+    # An unterminated code fence runs to the end of the document
+    flush(len(content.split("\n")), "code" if fence is not None else "text")
+    return paragraphs
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Phase Journal
+
+Append-only log of phase events for one inquiry, stored as JSON lines in
+phase_journal.jsonl next to inquiry_report.json. Recording a transition is
+a single O_APPEND write of one line, so concurrent writers never rewrite
+(or clobber) the report. Readers fold pending events in memory
+(load_report); the report file itself is brought up to date by folding the
+journal into it (compaction), explicitly or lazily once the pending events
+exceed COMPACT_THRESHOLD bytes. The report's "journal_offset" records how
+many journal bytes it already reflects, so each event is applied exactly
+once.
+
+The journal is never truncated and keeps a timestamp for every event,
+which gives a full phase history for latency analysis.
+
+This module is shared by the inquiry skills: skills/inquiry-collector
+loads it by file path, so it must only import the standard library.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+JOURNAL_FILE = "phase_journal.jsonl"
+REPORT_FILE = "inquiry_report.json"
+OFFSET_KEY = "journal_offset"
+# load_report() compacts once this many journal bytes are pending
+COMPACT_THRESHOLD = 64 * 1024
+
+
+def append_event(inquiry_path: Path, event: dict) -> dict:
+    """
+    Append one event to the inquiry's journal.
+
+    The line is written with a single os.write() on an O_APPEND descriptor,
+    so events from concurrent processes are not interleaved.
+
+    Args:
+        inquiry_path: Path to inquiry directory
+        event: JSON-serializable event; "ts" is added if missing
+
+    Returns:
+        The event as written
+    """
+    event = {"ts": datetime.now().isoformat(timespec="milliseconds"), **event}
+    line = (json.dumps(event, separators=(",", ":")) + "\n").encode("utf-8")
+
+    fd = os.open(Path(inquiry_path) / JOURNAL_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+    return event
+
+
+def record_transition(
+    inquiry_path: Path,
+    to_phase: str,
+    from_phase: Optional[str] = None,
+    notes: Optional[str] = None,
+    source: Optional[str] = None,
+) -> dict:
+    """
+    Journal a phase transition without touching inquiry_report.json.
+
+    Args:
+        inquiry_path: Path to inquiry directory
+        to_phase: Phase being entered
+        from_phase: Phase being left, if known
+        notes: Optional notes for the phase history
+        source: Optional name of the tool recording the transition
+
+    Returns:
+        The journaled event
+    """
+    event = {"type": "phase", "phase": to_phase}
+    if from_phase:
+        event["from"] = from_phase
+    if notes:
+        event["notes"] = notes
+    if source:
+        event["source"] = source
+    return append_event(inquiry_path, event)
+
+
+def read_events(inquiry_path: Path, offset: int = 0) -> tuple[list[dict], int]:
+    """
+    Read journal events starting at a byte offset.
+
+    A trailing line without a newline (a write in progress, or one cut
+    short by a crash) is not returned and not consumed.
+
+    Args:
+        inquiry_path: Path to inquiry directory
+        offset: Byte offset to start reading at
+
+    Returns:
+        Tuple of (events, offset just past the last complete line)
+    """
+    try:
+        with open(Path(inquiry_path) / JOURNAL_FILE, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        return [], offset
+
+    end = data.rfind(b"\n") + 1
+    events = []
+    for line in data[:end].splitlines():
+        if not line.strip():
+            continue
+        try:
+            events.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue  # Skip a corrupt line rather than blocking every later event
+    return events, offset + end
+
+
+def apply_events(report: dict, events: list[dict]) -> dict:
+    """Fold phase events into a report dict (in place) and return it."""
+    for event in events:
+        if event.get("type") != "phase":
+            continue
+        ts = event.get("ts", "")
+        entry = {"phase": event["phase"], "entered_date": ts[:10], "entered_at": ts}
+        if event.get("notes"):
+            entry["notes"] = event["notes"]
+        report.setdefault("phase_history", []).append(entry)
+        report["phase"] = event["phase"]
+        report["status"] = event["phase"]
+        if ts:
+            report["updated_date"] = ts[:10]
+    return report
+
+
+def apply_pending(inquiry_path: Path, report: dict) -> tuple[dict, int]:
+    """
+    Fold journal events the report does not reflect yet, in memory.
+
+    The report's journal offset is advanced with them, so saving the
+    returned report is equivalent to compacting.
+
+    Returns:
+        Tuple of (report, number of events applied)
+    """
+    events, offset = read_events(inquiry_path, report.get(OFFSET_KEY, 0))
+    if offset != report.get(OFFSET_KEY, 0):
+        apply_events(report, events)
+        report[OFFSET_KEY] = offset
+    return report, len(events)
+
+
+def load_report(inquiry_path: Path, compact_threshold: int = COMPACT_THRESHOLD) -> dict:
+    """
+    Load inquiry_report.json with pending journal events folded in.
+
+    When the folded events span compact_threshold bytes or more, the
+    folded report is also written back (lazy compaction), so the journal
+    tail replayed by later reads stays short.
+
+    Raises:
+        FileNotFoundError: If inquiry_report.json does not exist
+    """
+    with open(Path(inquiry_path) / REPORT_FILE) as f:
+        report = json.load(f)
+
+    offset = report.get(OFFSET_KEY, 0)
+    report, _ = apply_pending(inquiry_path, report)
+    if report.get(OFFSET_KEY, 0) - offset >= compact_threshold:
+        try:
+            write_report(inquiry_path, report)
+        except OSError:
+            pass  # Compaction is an optimization only; the journal still has the events
+    return report
+
+
+def write_report(inquiry_path: Path, report: dict) -> None:
+    """Write inquiry_report.json atomically (temp file + rename)."""
+    report_file = Path(inquiry_path) / REPORT_FILE
+    tmp_file = report_file.with_name(report_file.name + ".tmp")
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        os.replace(tmp_file, report_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def compact(inquiry_path: Path) -> int:
+    """
+    Fold pending journal events into inquiry_report.json.
+
+    The report is rewritten only if there was something to fold. Concurrent
+    compactions are safe: each written report is consistent with the
+    journal offset stored in it, and anything a losing writer missed is
+    folded by the next compaction.
+
+    Returns:
+        Number of events folded
+    """
+    report_file = Path(inquiry_path) / REPORT_FILE
+    with open(report_file) as f:
+        report = json.load(f)
+
+    offset = report.get(OFFSET_KEY, 0)
+    report, applied = apply_pending(inquiry_path, report)
+    if report.get(OFFSET_KEY, 0) != offset:
+        write_report(inquiry_path, report)
+    return applied
+
+
+def phase_durations(events: list[dict], now: Optional[datetime] = None) -> list[dict]:
+    """
+    Compute how long the inquiry spent in each journaled phase.
+
+    Args:
+        events: Journal events, oldest first
+        now: End time for the current phase (defaults to the current time)
+
+    Returns:
+        One dict per phase entry: phase, entered_at, left_at (None for the
+        current phase) and seconds spent
+    """
+    now = now or datetime.now()
+    phases = [e for e in events if e.get("type") == "phase" and e.get("ts")]
+
+    durations = []
+    for i, event in enumerate(phases):
+        entered = datetime.fromisoformat(event["ts"])
+        left_at = phases[i + 1]["ts"] if i + 1 < len(phases) else None
+        left = datetime.fromisoformat(left_at) if left_at else None
+        durations.append({
+            "phase": event["phase"],
+            "entered_at": event["ts"],
+            "left_at": left_at,
+            "seconds": round(((left or now) - entered).total_seconds(), 3),
+        })
+    return durations
@@ -5,12 +5,21 @@ Phase Manager for Inquiry Orchestration
 Handles phase detection, validation, and transitions for INQ work items.
 """
 
+import fnmatch
 import json
+import os
 import sys
 from datetime import date
 from pathlib import Path
 from typing import Optional
 
+try:
+    from . import phase_journal
+    from .inquiry_registry import InquiryRegistry
+except ImportError:
+    import phase_journal
+    from inquiry_registry import InquiryRegistry
+
 # Phase order and requirements
 PHASES = ["research", "synthesis", "debate", "consensus", "completed"]
 
@@ -22,28 +31,66 @@ PHASE_ARTIFACTS = {
     "completed": {"required": ["CONSENSUS.md"], "produces": []},
 }
 
+# Artifacts whose presence drives phase detection and status reports
+ARTIFACT_FILES = ["SUMMARY.md", "SYNTHESIS.md", "DEBATE.md", "CONSENSUS.md"]
+RESEARCH_REPORT_PATTERN = "agent-*.md"
+
+DEFAULT_INQUIRIES_DIR = "feature-management/inquiries"
+STATUS_CACHE_FILE = ".cache/phase_status.json"
+
 
 def load_inquiry(inquiry_path: Path) -> dict:
-    """Load inquiry_report.json from the inquiry directory."""
+    """
+    Load inquiry_report.json from the inquiry directory.
+
+    Phase events journaled since the last compaction are folded in, so the
+    result always reflects the current phase.
+    """
     report_file = inquiry_path / "inquiry_report.json"
     if not report_file.exists():
         raise FileNotFoundError(f"inquiry_report.json not found at {report_file}")
 
-    with open(report_file) as f:
-        return json.load(f)
+    return phase_journal.load_report(inquiry_path)
 
 
 def save_inquiry(inquiry_path: Path, data: dict) -> None:
-    """Save inquiry_report.json to the inquiry directory."""
-    report_file = inquiry_path / "inquiry_report.json"
+    """Save inquiry_report.json to the inquiry directory (atomically)."""
     data["updated_date"] = date.today().isoformat()
+    phase_journal.write_report(inquiry_path, data)
 
-    with open(report_file, "w") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
 
+def scan_artifacts(inquiry_path: Path) -> dict:
+    """
+    Build the artifact presence map of an inquiry with one directory scan.
 
-def detect_phase(inquiry_path: Path, report: dict) -> str:
+    Returns dict with "research/" and each ARTIFACT_FILES name mapped to
+    whether it exists, plus "research_reports", the number of
+    research/agent-*.md files.
+    """
+    artifacts = {"research/": False, **{name: False for name in ARTIFACT_FILES}}
+    research_is_dir = False
+
+    with os.scandir(inquiry_path) as entries:
+        for entry in entries:
+            if entry.name == "research":
+                artifacts["research/"] = True
+                research_is_dir = entry.is_dir()
+            elif entry.name in artifacts:
+                artifacts[entry.name] = True
+
+    reports = 0
+    if research_is_dir:
+        with os.scandir(inquiry_path / "research") as entries:
+            reports = sum(
+                1 for entry in entries
+                if fnmatch.fnmatch(entry.name, RESEARCH_REPORT_PATTERN)
+            )
+    artifacts["research_reports"] = reports
+
+    return artifacts
+
+
+def detect_phase(inquiry_path: Path, report: dict, artifacts: Optional[dict] = None) -> str:
     """
     Detect the current phase based on existing artifacts.
 
@@ -60,31 +107,33 @@ def detect_phase(inquiry_path: Path, report: dict) -> str:
     if status in ["completed", "cancelled"]:
         return status
 
+    if artifacts is None:
+        artifacts = scan_artifacts(inquiry_path)
+
     # Check artifact-based detection
     # If we have CONSENSUS.md, we're done
-    if (inquiry_path / "CONSENSUS.md").exists():
+    if artifacts["CONSENSUS.md"]:
         return "completed"
 
     # If we have DEBATE.md, proceed to consensus
-    if (inquiry_path / "DEBATE.md").exists():
+    if artifacts["DEBATE.md"]:
         return "consensus"
 
     # If we have SYNTHESIS.md, proceed to debate
-    if (inquiry_path / "SYNTHESIS.md").exists():
+    if artifacts["SYNTHESIS.md"]:
         return "debate"
 
     # If we have research outputs, proceed to synthesis
-    research_dir = inquiry_path / "research"
-    if research_dir.exists():
-        research_files = list(research_dir.glob("agent-*.md"))
-        if research_files:
-            return "synthesis"
+    if artifacts["research_reports"]:
+        return "synthesis"
 
     # Default to research
     return "research"
 
 
-def validate_phase_requirements(inquiry_path: Path, phase: str) -> tuple[bool, list[str]]:
+def validate_phase_requirements(
+    inquiry_path: Path, phase: str, artifacts: Optional[dict] = None
+) -> tuple[bool, list[str]]:
     """
     Validate that all requirements for a phase are met.
 
@@ -93,44 +142,47 @@ def validate_phase_requirements(inquiry_path: Path, phase: str) -> tuple[bool, l
     requirements = PHASE_ARTIFACTS.get(phase, {}).get("required", [])
     missing = []
 
+    if requirements and artifacts is None:
+        artifacts = scan_artifacts(inquiry_path)
+
     for req in requirements:
         if req.endswith("/"):
-            # Directory requirement
-            dir_path = inquiry_path / req.rstrip("/")
-            if not dir_path.exists() or not list(dir_path.glob("agent-*.md")):
+            # Directory requirement: must contain research reports
+            if not artifacts["research_reports"]:
                 missing.append(req)
         else:
-            # File requirement
-            if not (inquiry_path / req).exists():
+            # File requirement (stat only what the cached scan does not cover)
+            present = artifacts[req] if req in artifacts else (inquiry_path / req).exists()
+            if not present:
                 missing.append(req)
 
     return len(missing) == 0, missing
 
 
-def transition_phase(inquiry_path: Path, from_phase: str, to_phase: str, notes: str = "") -> dict:
+def transition_phase(
+    inquiry_path: Path, from_phase: str, to_phase: str, notes: str = "", compact: bool = False
+) -> dict:
     """
     Transition the inquiry from one phase to another.
 
-    Updates inquiry_report.json with new phase and history.
-    """
-    report = load_inquiry(inquiry_path)
-
-    # Update phase and status
-    report["phase"] = to_phase
-    report["status"] = to_phase
+    The transition is only appended to the phase journal; inquiry_report.json
+    is not rewritten. Readers going through load_inquiry() see it at once,
+    and the report file catches up when the journal is compacted (lazily by
+    load_inquiry(), or with --action compact). Pass compact=True to fold the
+    journal into the report file right away.
 
-    # Add to phase history
-    if "phase_history" not in report:
-        report["phase_history"] = []
-
-    report["phase_history"].append({
-        "phase": to_phase,
-        "entered_date": date.today().isoformat(),
-        "notes": notes or f"Transitioned from {from_phase}"
-    })
-
-    save_inquiry(inquiry_path, report)
-    return report
+    Returns the updated report.
+    """
+    phase_journal.record_transition(
+        inquiry_path,
+        to_phase,
+        from_phase=from_phase,
+        notes=notes or f"Transitioned from {from_phase}",
+        source="phase_manager",
+    )
+    if compact:
+        phase_journal.compact(inquiry_path)
+    return load_inquiry(inquiry_path)
 
 
 def get_next_phase(current_phase: str) -> Optional[str]:
@@ -150,32 +202,40 @@ def get_research_agent_count(inquiry_path: Path) -> int:
     return report.get("research_agents", 3)
 
 
-def count_completed_research(inquiry_path: Path) -> tuple[int, int]:
+def count_completed_research(
+    inquiry_path: Path, report: Optional[dict] = None, artifacts: Optional[dict] = None
+) -> tuple[int, int]:
     """
     Count completed research reports.
 
     Returns (completed_count, expected_count).
     """
-    expected = get_research_agent_count(inquiry_path)
-    research_dir = inquiry_path / "research"
+    if report is None:
+        report = load_inquiry(inquiry_path)
+    if artifacts is None:
+        artifacts = scan_artifacts(inquiry_path)
 
-    if not research_dir.exists():
-        return 0, expected
+    return artifacts["research_reports"], report.get("research_agents", 3)
 
-    completed = len(list(research_dir.glob("agent-*.md")))
-    return completed, expected
 
-
-def get_phase_status(inquiry_path: Path) -> dict:
+def get_phase_status(
+    inquiry_path: Path, report: Optional[dict] = None, artifacts: Optional[dict] = None
+) -> dict:
     """
     Get comprehensive status of the inquiry.
 
     Returns dict with phase info, artifacts, and readiness.
     """
-    report = load_inquiry(inquiry_path)
-    detected_phase = detect_phase(inquiry_path, report)
-    is_valid, missing = validate_phase_requirements(inquiry_path, detected_phase)
-    completed_research, expected_research = count_completed_research(inquiry_path)
+    if report is None:
+        report = load_inquiry(inquiry_path)
+    if artifacts is None:
+        artifacts = scan_artifacts(inquiry_path)
+
+    detected_phase = detect_phase(inquiry_path, report, artifacts)
+    is_valid, missing = validate_phase_requirements(inquiry_path, detected_phase, artifacts)
+    completed_research, expected_research = count_completed_research(
+        inquiry_path, report, artifacts
+    )
 
     return {
         "inquiry_id": report.get("inquiry_id"),
@@ -191,15 +251,107 @@ def get_phase_status(inquiry_path: Path) -> dict:
             "all_complete": completed_research >= expected_research
         },
         "artifacts": {
-            "research/": (inquiry_path / "research").exists(),
-            "SUMMARY.md": (inquiry_path / "SUMMARY.md").exists(),
-            "SYNTHESIS.md": (inquiry_path / "SYNTHESIS.md").exists(),
-            "DEBATE.md": (inquiry_path / "DEBATE.md").exists(),
-            "CONSENSUS.md": (inquiry_path / "CONSENSUS.md").exists(),
+            name: artifacts[name] for name in ["research/", *ARTIFACT_FILES]
         }
     }
 
 
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_all_phase_status(inquiries_dir: Path, use_cache: bool = True) -> list[dict]:
+    """
+    Get the status of every inquiry in a directory in one pass.
+
+    Artifact presence maps are cached in inquiries_dir/.cache/ keyed by the
+    modification times of each inquiry directory and its research/
+    directory, which change whenever an artifact is added or removed, so
+    unchanged inquiries are not rescanned.
+
+    Returns list of get_phase_status() dicts (plus "path"), sorted by
+    directory name. Unreadable inquiries are reported with an "error" key.
+    """
+    cache_file = inquiries_dir / STATUS_CACHE_FILE
+    cache: dict = {}
+    if use_cache:
+        try:
+            with open(cache_file) as f:
+                cache = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            cache = {}
+
+    fresh_cache = {}
+    statuses = []
+
+    with os.scandir(inquiries_dir) as entries:
+        inquiry_entries = sorted(
+            (e for e in entries if e.is_dir() and e.name.startswith("INQ-")),
+            key=lambda e: e.name,
+        )
+
+    for entry in inquiry_entries:
+        inquiry_path = Path(entry.path)
+        key = [entry.stat().st_mtime_ns, _mtime_ns(inquiry_path / "research")]
+
+        cached = cache.get(entry.name)
+        if cached and cached.get("key") == key:
+            artifacts = cached["artifacts"]
+        else:
+            artifacts = scan_artifacts(inquiry_path)
+        fresh_cache[entry.name] = {"key": key, "artifacts": artifacts}
+
+        try:
+            status = get_phase_status(inquiry_path, artifacts=artifacts)
+        except (OSError, json.JSONDecodeError) as e:
+            statuses.append({"path": str(inquiry_path), "error": str(e)})
+            continue
+        status["path"] = str(inquiry_path)
+        statuses.append(status)
+
+    if use_cache and fresh_cache != cache:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(fresh_cache, f)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # The cache is an optimization only
+
+    return statuses
+
+
+def format_status_table(statuses: list[dict]) -> str:
+    """Format get_all_phase_status() results as a plain-text table."""
+    headers = ["ID", "Recorded", "Detected", "Research", "Ready", "Title"]
+    rows = []
+    for status in statuses:
+        if "error" in status:
+            rows.append([Path(status["path"]).name, "-", "-", "-", "-", f"Error: {status['error']}"])
+            continue
+        research = status["research_agents"]
+        rows.append([
+            status.get("inquiry_id") or Path(status["path"]).name,
+            status.get("recorded_phase") or "-",
+            status["detected_phase"] + ("" if status["phase_match"] else " *"),
+            f"{research['completed']}/{research['expected']}",
+            "yes" if status["requirements_met"] else "no",
+            status.get("title") or "",
+        ])
+
+    widths = [max(len(str(row[i])) for row in [headers] + rows) for i in range(len(headers) - 1)]
+    lines = []
+    for row in [headers] + rows:
+        cells = [str(cell).ljust(width) for cell, width in zip(row, widths)]
+        lines.append("  ".join(cells + [str(row[-1])]))
+    lines.append(f"\n{len(rows)} inquiries (* detected phase differs from recorded)")
+    return "\n".join(lines)
+
+
 def find_inquiry(identifier: str, search_paths: Optional[list[str]] = None) -> Optional[Path]:
     """
     Find an inquiry directory by ID or path.
@@ -233,11 +385,11 @@ def find_inquiry(identifier: str, search_paths: Optional[list[str]] = None) -> O
         if exact.exists() and (exact / "inquiry_report.json").exists():
             return exact
 
-        # Try prefix match (INQ-001 matches INQ-001-topic-name)
-        for subdir in base_path.iterdir():
-            if subdir.is_dir() and subdir.name.startswith(identifier):
-                if (subdir / "inquiry_report.json").exists():
-                    return subdir
+        # Indexed ID / prefix match (INQ-001 matches INQ-001-topic-name);
+        # stale or partial directories sharing the prefix are passed over
+        for candidate in InquiryRegistry(base_path).candidates(identifier):
+            if (candidate / "inquiry_report.json").exists():
+                return candidate
 
     return None
 
@@ -247,15 +399,41 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="Inquiry Phase Manager")
-    parser.add_argument("inquiry", help="Inquiry ID or path")
-    parser.add_argument("--action", choices=["detect", "status", "transition", "validate"],
+    parser.add_argument("inquiry", nargs="?", help="Inquiry ID or path")
+    parser.add_argument("--action",
+                        choices=["detect", "status", "transition", "validate", "history", "compact"],
                         default="status", help="Action to perform")
     parser.add_argument("--to-phase", help="Target phase for transition")
     parser.add_argument("--notes", help="Notes for phase transition")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--all", action="store_true",
+                        help="With --action status, report every inquiry")
+    parser.add_argument("--inquiries-dir", default=DEFAULT_INQUIRIES_DIR,
+                        help=f"Directory scanned by --all (default: {DEFAULT_INQUIRIES_DIR})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="With --all, rescan every inquiry instead of using the cache")
 
     args = parser.parse_args()
 
+    if args.all:
+        if args.action != "status":
+            print("Error: --all is only supported with --action status", file=sys.stderr)
+            sys.exit(1)
+        inquiries_dir = Path(args.inquiries_dir)
+        if not inquiries_dir.is_dir():
+            print(f"Error: Inquiries directory not found: {inquiries_dir}", file=sys.stderr)
+            sys.exit(1)
+        statuses = get_all_phase_status(inquiries_dir, use_cache=not args.no_cache)
+        if args.json:
+            print(json.dumps(statuses, indent=2))
+        else:
+            print(format_status_table(statuses))
+        return
+
+    if not args.inquiry:
+        print("Error: inquiry ID or path required (or use --all)", file=sys.stderr)
+        sys.exit(1)
+
     # Find inquiry
     inquiry_path = find_inquiry(args.inquiry)
     if not inquiry_path:
@@ -322,6 +500,25 @@ def main():
             else:
                 print(f"Transitioned from '{from_phase}' to '{args.to_phase}'")
 
+        elif args.action == "history":
+            events, _ = phase_journal.read_events(inquiry_path)
+            durations = phase_journal.phase_durations(events)
+            if args.json:
+                print(json.dumps(durations, indent=2))
+            elif not durations:
+                print(f"No journaled phase events ({phase_journal.JOURNAL_FILE})")
+            else:
+                for entry in durations:
+                    left = entry["left_at"] or "(current)"
+                    print(f"{entry['phase']:<10} {entry['entered_at']} -> {left:<19} {entry['seconds']:>10.0f}s")
+
+        elif args.action == "compact":
+            folded = phase_journal.compact(inquiry_path)
+            if args.json:
+                print(json.dumps({"folded": folded}))
+            else:
+                print(f"Folded {folded} journal event(s) into inquiry_report.json")
+
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
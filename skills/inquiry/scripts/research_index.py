@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Research Index for Inquiry Orchestration
+
+Paragraph-level BM25 index over an inquiry's research/agent-*.md reports,
+persisted in the inquiry's .cache/research_index/ directory as one shard
+per report (paragraphs, term counts, size and mtime). refresh() re-splits
+and rewrites only the shards of reports that changed (and drops deleted
+ones), so synthesis, debate and consensus tools can pull evidence by query
+without re-reading every report.
+
+Usage:
+    python3 -m skills.inquiry.scripts.research_index INQ-001 --query "completion markers"
+"""
+
+import json
+import os
+import shutil
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+from .bm25 import BM25Index
+from .paragraphs import Paragraph, split_paragraphs, tokenize
+from .phase_manager import RESEARCH_REPORT_PATTERN, find_inquiry
+
+INDEX_DIR = ".cache/research_index"
+# Bump when paragraph splitting or tokenizing changes
+INDEX_VERSION = 1
+
+
+def scan_reports(research_dir: Path) -> dict[str, dict]:
+    """Report name -> {"mtime_ns", "size"} for research/agent-*.md."""
+    reports = {}
+    if research_dir.is_dir():
+        with os.scandir(research_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and Path(entry.name).match(RESEARCH_REPORT_PATTERN):
+                    stat = entry.stat()
+                    reports[entry.name] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    return reports
+
+
+def paragraph_terms(paragraph: Paragraph) -> Counter:
+    """Index terms of a paragraph; its section heading counts as text."""
+    return Counter(tokenize(f"{paragraph.section} {paragraph.text}"))
+
+
+class ResearchIndex:
+    """Persisted, incrementally updated BM25 index of research paragraphs."""
+
+    def __init__(self, inquiry_path: Path, persist: bool = True):
+        """
+        Initialize the index.
+
+        Args:
+            inquiry_path: Path to inquiry directory
+            persist: Whether to read/write the index shards
+        """
+        self.inquiry_path = Path(inquiry_path)
+        self.research_dir = self.inquiry_path / "research"
+        self.index_dir = self.inquiry_path / INDEX_DIR
+        self.persist = persist
+
+        self.files: dict[str, dict] = {}
+        self.paragraphs: dict[str, Paragraph] = {}
+        self.bm25 = BM25Index()
+        self._terms: dict[str, Counter] = {}
+        self._loaded = False
+        self.updated_files: list[str] = []
+
+    def _load(self) -> None:
+        self._loaded = True
+        if not self.persist or not self.index_dir.is_dir():
+            return
+        with os.scandir(self.index_dir) as entries:
+            shard_paths = [e.path for e in entries if e.name.endswith(".json")]
+        for shard_path in shard_paths:
+            try:
+                with open(shard_path) as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if data.get("version") != INDEX_VERSION:
+                continue
+            name = data["source"]
+            self.files[name] = {"mtime_ns": data["mtime_ns"], "size": data["size"]}
+            for item in data["paragraphs"]:
+                terms = Counter(item.pop("terms"))
+                self._add(Paragraph(source=name, **item), terms)
+
+    def _shard_path(self, name: str) -> Path:
+        return self.index_dir / f"{name}.json"
+
+    def _save_file(self, name: str) -> None:
+        if not self.persist:
+            return
+        paragraphs = sorted(
+            (p for p in self.paragraphs.values() if p.source == name), key=lambda p: p.index
+        )
+        data = {
+            "version": INDEX_VERSION,
+            "source": name,
+            **self.files[name],
+            "paragraphs": [
+                {
+                    "index": p.index,
+                    "section": p.section,
+                    "section_level": p.section_level,
+                    "line_start": p.line_start,
+                    "line_end": p.line_end,
+                    "text": p.text,
+                    "kind": p.kind,
+                    "terms": self._terms[p.id],
+                }
+                for p in paragraphs
+            ],
+        }
+
+        shard_path = self._shard_path(name)
+        tmp_path = shard_path.with_name(shard_path.name + ".tmp")
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                f.write(json.dumps(data))
+            os.replace(tmp_path, shard_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)  # The index is an optimization only
+
+    def _add(self, paragraph: Paragraph, terms: Counter) -> None:
+        self.paragraphs[paragraph.id] = paragraph
+        self._terms[paragraph.id] = terms
+        self.bm25.add_counts(paragraph.id, terms)
+
+    def _remove_file(self, name: str) -> None:
+        for pid in [pid for pid, p in self.paragraphs.items() if p.source == name]:
+            self.bm25.remove(pid, self._terms.pop(pid))
+            del self.paragraphs[pid]
+        self.files.pop(name, None)
+        if self.persist:
+            self._shard_path(name).unlink(missing_ok=True)
+
+    def update_file(self, name: str) -> None:
+        """(Re)index one report from research/, or drop it if it is gone."""
+        if not self._loaded:
+            self._load()
+        self._remove_file(name)
+        path = self.research_dir / name
+        try:
+            stat = path.stat()
+            content = path.read_text()
+        except OSError:
+            return
+        self.files[name] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        for paragraph in split_paragraphs(content, name):
+            self._add(paragraph, paragraph_terms(paragraph))
+        self._save_file(name)
+        self.updated_files.append(name)
+
+    def refresh(self) -> list[str]:
+        """
+        Bring the index up to date with research/.
+
+        Returns:
+            Names of the reports that were (re)indexed or dropped
+        """
+        if not self._loaded:
+            self._load()
+        self.updated_files = []
+
+        current = scan_reports(self.research_dir)
+
+        changed = [name for name, meta in current.items() if self.files.get(name) != meta]
+        removed = [name for name in self.files if name not in current]
+        for name in removed:
+            self._remove_file(name)
+            self.updated_files.append(name)
+        for name in sorted(changed):
+            self.update_file(name)
+        return list(self.updated_files)
+
+    def by_agent(self) -> dict[str, list[Paragraph]]:
+        """Agent number -> paragraphs in document order, agents sorted by file name."""
+        grouped: dict[str, list[Paragraph]] = {}
+        for paragraph in sorted(self.paragraphs.values(), key=lambda p: (p.source, p.index)):
+            grouped.setdefault(paragraph.agent, []).append(paragraph)
+        return grouped
+
+    def terms(self, paragraph_id: str) -> Counter:
+        """Index term counts of a paragraph."""
+        return self._terms[paragraph_id]
+
+    def scores(self, query: str) -> dict[str, float]:
+        """BM25 score of every paragraph sharing a term with the query."""
+        return self.bm25.scores(tokenize(query))
+
+    def query(self, query: str, k: int = 10) -> list[tuple[Paragraph, float]]:
+        """Return the k most relevant paragraphs with their scores, best first."""
+        return [(self.paragraphs[pid], score) for pid, score in self.bm25.top_k(tokenize(query), k)]
+
+
+def load_research_index(inquiry_path: Path, persist: bool = True) -> ResearchIndex:
+    """Open an inquiry's research index and bring it up to date."""
+    index = ResearchIndex(inquiry_path, persist=persist)
+    index.refresh()
+    return index
+
+
+def main():
+    """CLI interface for the research index."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Query the research paragraph index")
+    parser.add_argument("inquiry", help="Inquiry ID or path")
+    parser.add_argument("--query", help="Text to search for")
+    parser.add_argument("-k", type=int, default=10, help="Number of paragraphs to return")
+    parser.add_argument("--rebuild", action="store_true", help="Discard the index and rebuild it")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+    args = parser.parse_args()
+
+    inquiry_path = find_inquiry(args.inquiry)
+    if not inquiry_path:
+        print(f"Error: Could not find inquiry '{args.inquiry}'", file=sys.stderr)
+        sys.exit(1)
+
+    if args.rebuild:
+        shutil.rmtree(inquiry_path / INDEX_DIR, ignore_errors=True)
+
+    index = ResearchIndex(inquiry_path)
+    updated = index.refresh()
+
+    if not args.query:
+        stats = {
+            "reports": len(index.files),
+            "paragraphs": len(index.paragraphs),
+            "terms": len(index.bm25.postings),
+            "updated": updated,
+        }
+        if args.json:
+            print(json.dumps(stats, indent=2))
+        else:
+            print(f"Indexed {stats['paragraphs']} paragraphs from {stats['reports']} reports "
+                  f"({stats['terms']} terms); updated: {', '.join(updated) or 'none'}")
+        return
+
+    results = index.query(args.query, args.k)
+    if args.json:
+        print(json.dumps([
+            {
+                "id": p.id,
+                "score": round(score, 4),
+                "source": p.source,
+                "section": p.section,
+                "lines": [p.line_start, p.line_end],
+                "text": p.text,
+            }
+            for p, score in results
+        ], indent=2))
+    else:
+        for p, score in results:
+            print(f"[{score:.2f}] {p.source}:{p.line_start}-{p.line_end} ({p.section or 'no section'})")
+            print(f"  {p.text[:200]}{'...' if len(p.text) > 200 else ''}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,45 @@ Generates synthesis prompts and documents for Phase 2.
 """
 
 import json
+import re
+import runpy
 import sys
+from collections import deque
 from datetime import date
 from pathlib import Path
 from typing import Optional
 
+from .bm25 import BM25Index
+from .paragraphs import Paragraph, estimate_tokens, split_paragraphs, tokenize
 from .phase_manager import load_inquiry, find_inquiry
+from .research_index import ResearchIndex, paragraph_terms
+
+# Token budget for the research reports section of the synthesis prompt
+DEFAULT_CONTEXT_TOKENS = 12000
+
+# Retrieval mode: evidence per QUESTION.md sub-question
+MODES = ("full", "retrieval")
+RETRIEVERS = ("bm25", "embedding")
+DEFAULT_TOP_K = 5
+DEFAULT_QUESTION_TOKENS = 1500
+RETRIEVAL_RECORD_FILE = "synthesis_context.json"
+
+# Modules of other skills are loaded by path with the shared loader
+SKILL_MODULES_PATH = Path(__file__).resolve().parents[2] / "_shared" / "skill_modules.py"
+load_module = runpy.run_path(str(SKILL_MODULES_PATH))["load_module"]
+
+# QUESTION.md is parsed with the inquiry-prompts skill's parser
+QUESTION_PARSER_PATH = (
+    Path(__file__).resolve().parents[2] / "inquiry-prompts" / "scripts" / "generate_prompts.py"
+)
+
+# SUMMARY.md sections whose text is used as relevance query terms
+SUMMARY_THEME_SECTIONS = (
+    "Common Themes",
+    "Points of Agreement",
+    "Points of Divergence",
+    "Key Questions for Synthesis",
+)
 
 
 SYNTHESIS_PROMPT_TEMPLATE = """# Synthesis Agent - Consolidate Research Findings
@@ -166,39 +199,357 @@ def format_constraints(constraints: list[str]) -> str:
     return "\n".join(f"- {c}" for c in constraints)
 
 
-def format_research_reports(reports: list[dict]) -> str:
-    """Format research reports for inclusion in prompt."""
+def extract_summary_themes(summary: str) -> str:
+    """Return the text of the theme-bearing sections of SUMMARY.md."""
+    themes = []
+    for match in re.finditer(r"^## +(.+?)\s*$(.*?)(?=^## |\Z)", summary, re.M | re.S):
+        if match.group(1) in SUMMARY_THEME_SECTIONS:
+            themes.append(match.group(2).strip())
+    return "\n".join(themes)
+
+
+def pack_research_context(
+    candidates: dict[str, list[Paragraph]], scores: dict[str, float], budget_tokens: int
+) -> dict[str, list[Paragraph]]:
+    """
+    Choose the research paragraphs to include within a token budget.
+
+    Paragraphs are ranked by their relevance score (BM25 against the
+    inquiry question and summary themes). Agents take turns picking their best
+    remaining paragraph, best-scoring agent first, so every agent is
+    represented before any agent gets its second paragraph; a paragraph
+    that no longer fits is skipped. Ties, including paragraphs that share
+    no terms with the query, go to the earlier paragraph.
+
+    Args:
+        candidates: Agent number -> the agent's report paragraphs
+        scores: Paragraph ID -> relevance score (missing means 0)
+        budget_tokens: Maximum estimated tokens of selected paragraph text
+
+    Returns:
+        Agent number -> selected paragraphs in document order
+    """
+    queues = {
+        agent: deque(sorted(paragraphs, key=lambda p: (-scores.get(p.id, 0.0), p.index)))
+        for agent, paragraphs in candidates.items()
+    }
+
+    selected: dict[str, list[Paragraph]] = {agent: [] for agent in candidates}
+    remaining = budget_tokens
+    while remaining > 0 and any(queues.values()):
+        # One pick per agent per round, best next candidate first
+        order = sorted(
+            (agent for agent in queues if queues[agent]),
+            key=lambda a: -scores.get(queues[a][0].id, 0.0),
+        )
+        for agent in order:
+            queue = queues[agent]
+            while queue:
+                paragraph = queue.popleft()
+                if paragraph.tokens <= remaining:
+                    selected[agent].append(paragraph)
+                    remaining -= paragraph.tokens
+                    break
+
+    return {agent: sorted(chosen, key=lambda p: p.index) for agent, chosen in selected.items()}
+
+
+def format_packed_report(paragraphs: list[Paragraph], total: int) -> str:
+    """Render selected paragraphs with their headings and omission markers."""
+    lines = []
+    section = None
+    previous = -1
+    for p in paragraphs:
+        if p.index > previous + 1:
+            lines.append(f"[... {p.index - previous - 1} paragraph(s) omitted ...]\n")
+        if p.section != section:
+            section = p.section
+            if section:
+                lines.append(f"{'#' * p.section_level} {section}\n")
+        lines.append(p.text + "\n")
+        previous = p.index
+    if previous < total - 1:
+        lines.append(f"[... {total - previous - 1} paragraph(s) omitted ...]\n")
+    return "\n".join(lines).rstrip("\n")
+
+
+def format_research_reports(
+    reports: list[dict],
+    query: str = "",
+    budget_tokens: Optional[int] = DEFAULT_CONTEXT_TOKENS,
+    index: Optional[ResearchIndex] = None,
+    included: Optional[list[str]] = None,
+) -> str:
+    """
+    Format research reports for inclusion in prompt.
+
+    Reports are included in full when they fit the token budget. Otherwise
+    the most relevant paragraphs (see pack_research_context) are kept.
+
+    Args:
+        reports: Reports from load_research_reports()
+        query: Relevance query used when the reports must be packed
+        budget_tokens: Token budget for all reports (None for no limit)
+        index: Research index of the same inquiry; when given, it is
+            refreshed and paragraphs and scores come from it instead of
+            re-splitting every report
+        included: If given, the IDs of the paragraphs that end up in the
+            prompt are appended to it
+    """
     if not reports:
         return "*No research reports found*"
 
+    total_tokens = sum(estimate_tokens(r["content"]) for r in reports)
+    packed = candidates = None
+    if budget_tokens is not None and total_tokens > budget_tokens:
+        if index is not None:
+            index.refresh()
+            candidates = index.by_agent()
+            scores = index.scores(query)
+        else:
+            candidates = {
+                r["agent_number"]: split_paragraphs(r["content"], r["filename"]) for r in reports
+            }
+            bm25 = BM25Index()
+            for paragraphs in candidates.values():
+                for p in paragraphs:
+                    bm25.add_counts(p.id, paragraph_terms(p))
+            scores = bm25.scores(tokenize(query))
+        packed = pack_research_context(candidates, scores, budget_tokens)
+
+    if included is not None:
+        if packed is not None:
+            chosen = packed
+        elif index is not None:
+            index.refresh()
+            chosen = index.by_agent()
+        else:
+            chosen = {r["agent_number"]: split_paragraphs(r["content"], r["filename"]) for r in reports}
+        included.extend(p.id for paragraphs in chosen.values() for p in paragraphs)
+
     formatted = []
     for report in reports:
+        content = report["content"]
+        if packed is not None:
+            agent = report["agent_number"]
+            content = format_packed_report(packed.get(agent, []), len(candidates.get(agent, [])))
         formatted.append(f"""
 ### Agent {report['agent_number']} Report
 
 ```markdown
-{report['content'][:5000]}
-{"[... truncated ...]" if len(report['content']) > 5000 else ""}
+{content}
 ```
 """)
 
     return "\n".join(formatted)
 
 
-def generate_synthesis_prompt(inquiry_path: Path) -> str:
-    """Generate the synthesis phase prompt."""
+def load_question_parser():
+    """Load parse_question_md from the inquiry-prompts skill, or None if unavailable."""
+    try:
+        return load_module("inquiry_prompts_generate_prompts", QUESTION_PARSER_PATH).parse_question_md
+    except Exception:
+        return None
+
+
+def load_sub_questions(inquiry_path: Path, report: dict) -> list[dict]:
+    """
+    Sub-questions of the inquiry as {"text", "group"} dicts.
+
+    QUESTION.md is parsed with generate_prompts.parse_question_md, as for
+    the research prompts. Without QUESTION.md (or the parser) the inquiry's
+    main question is the only question.
+    """
+    question_file = inquiry_path / "QUESTION.md"
+    parse_question_md = load_question_parser() if question_file.exists() else None
+    if parse_question_md is not None:
+        parsed = parse_question_md(question_file.read_text())
+        questions = [{"text": q.text, "group": q.group} for q in parsed.sub_questions]
+        if questions:
+            return questions
+    return [{"text": report.get("question", ""), "group": None}]
+
+
+def retrieve_question_context(
+    inquiry_path: Path,
+    questions: list[dict],
+    top_k: int = DEFAULT_TOP_K,
+    budget_tokens: int = DEFAULT_QUESTION_TOKENS,
+    retriever: str = "bm25",
+    index: Optional[ResearchIndex] = None,
+) -> list[dict]:
+    """
+    Retrieve the most relevant research paragraphs for each question.
+
+    Each question's group heading is part of its query. Of the top_k
+    paragraphs, those that fit the per-question token budget are kept, in
+    rank order, so the context grows with the number of questions rather
+    than with the volume of research.
+
+    Args:
+        inquiry_path: Path to inquiry directory
+        questions: Questions from load_sub_questions()
+        top_k: Paragraphs retrieved per question
+        budget_tokens: Token budget per question
+        retriever: "bm25" (research index) or "embedding" (embedding index)
+        index: Refreshed research index of the inquiry (default: loaded
+            and refreshed here)
+
+    Returns:
+        One {"question", "group", "paragraphs": [(Paragraph, score)]} per question
+    """
+    if index is None:
+        index = ResearchIndex(inquiry_path)
+        index.refresh()
+    queries = [f"{q['group'] or ''} {q['text']}".strip() for q in questions]
+
+    if retriever == "embedding":
+        from .embedding_index import EmbeddingIndex
+
+        embeddings = EmbeddingIndex(inquiry_path)
+        embeddings.refresh(index)
+        ranked = [
+            [(index.paragraphs[row["id"]], score) for row, score in hits if score > 0]
+            for hits in embeddings.search(queries, top_k)
+        ]
+    else:
+        ranked = [index.query(query, top_k) for query in queries]
+
+    results = []
+    for question, hits in zip(questions, ranked):
+        remaining = budget_tokens
+        chosen = []
+        for paragraph, score in hits:
+            if paragraph.tokens <= remaining:
+                chosen.append((paragraph, score))
+                remaining -= paragraph.tokens
+        results.append({"question": question["text"], "group": question["group"], "paragraphs": chosen})
+    return results
+
+
+def format_question_context(results: list[dict]) -> str:
+    """Format retrieved evidence as one bounded block per question."""
+    if not results:
+        return "*No research reports found*"
+
+    blocks = []
+    for number, result in enumerate(results, 1):
+        title = f"{result['group']}: {result['question']}" if result["group"] else result["question"]
+        lines = [f"### Question {number}: {title}\n"]
+        if not result["paragraphs"]:
+            lines.append("*No relevant research paragraphs found*\n")
+        for paragraph, _score in result["paragraphs"]:
+            section = f" - {paragraph.section}" if paragraph.section else ""
+            lines.append(
+                f"**Agent {paragraph.agent}{section}** "
+                f"({paragraph.source}:{paragraph.line_start}-{paragraph.line_end})\n"
+            )
+            lines.append(paragraph.text + "\n")
+        blocks.append("\n".join(lines))
+
+    return "\n".join(blocks)
+
+
+def write_context_record(inquiry_path: Path, record: dict) -> Path:
+    """Write synthesis_context.json, the record of the paragraphs a prompt used."""
+    record_file = inquiry_path / RETRIEVAL_RECORD_FILE
+    with open(record_file, "w") as f:
+        json.dump(record, f, indent=2)
+        f.write("\n")
+    return record_file
+
+
+def write_full_record(inquiry_path: Path, paragraph_ids: list[str]) -> Path:
+    """Record which paragraphs a full-mode prompt included."""
+    return write_context_record(inquiry_path, {
+        "mode": "full",
+        "generated": date.today().isoformat(),
+        "paragraphs": [{"id": pid} for pid in paragraph_ids],
+    })
+
+
+def write_retrieval_record(inquiry_path: Path, results: list[dict], retriever: str) -> Path:
+    """Record which paragraphs were used for each question."""
+    record = {
+        "mode": "retrieval",
+        "retriever": retriever,
+        "generated": date.today().isoformat(),
+        "questions": [
+            {
+                "question": result["question"],
+                "group": result["group"],
+                "paragraphs": [
+                    {
+                        "id": p.id,
+                        "score": round(score, 4),
+                        "source": p.source,
+                        "section": p.section,
+                        "lines": [p.line_start, p.line_end],
+                    }
+                    for p, score in result["paragraphs"]
+                ],
+            }
+            for result in results
+        ],
+    }
+    return write_context_record(inquiry_path, record)
+
+
+def generate_synthesis_prompt(
+    inquiry_path: Path,
+    budget_tokens: Optional[int] = DEFAULT_CONTEXT_TOKENS,
+    mode: str = "full",
+    top_k: int = DEFAULT_TOP_K,
+    question_tokens: int = DEFAULT_QUESTION_TOKENS,
+    retriever: str = "bm25",
+    record: bool = False,
+) -> str:
+    """
+    Generate the synthesis phase prompt.
+
+    In "full" mode the research reports are included (packed to
+    budget_tokens if needed). In "retrieval" mode each QUESTION.md
+    sub-question gets its own bounded block of paragraphs retrieved from
+    the research index; the reports themselves are not read. With record,
+    the paragraphs used are recorded in synthesis_context.json.
+    """
     report = load_inquiry(inquiry_path)
-    research_reports = load_research_reports(inquiry_path)
     summary = load_summary(inquiry_path)
 
+    if mode == "retrieval":
+        index = ResearchIndex(inquiry_path)
+        index.refresh()
+        results = retrieve_question_context(
+            inquiry_path,
+            load_sub_questions(inquiry_path, report),
+            top_k=top_k,
+            budget_tokens=question_tokens,
+            retriever=retriever,
+            index=index,
+        )
+        if record:
+            write_retrieval_record(inquiry_path, results, retriever)
+        research_section = format_question_context(results) if index.files else format_research_reports([])
+        agent_count = len(index.files)
+    else:
+        research_reports = load_research_reports(inquiry_path)
+        query = f"{report.get('question', '')}\n{extract_summary_themes(summary)}"
+        included: Optional[list[str]] = [] if record else None
+        research_section = format_research_reports(
+            research_reports, query, budget_tokens, ResearchIndex(inquiry_path), included
+        )
+        if record:
+            write_full_record(inquiry_path, included)
+        agent_count = len(research_reports)
+
     return SYNTHESIS_PROMPT_TEMPLATE.format(
         title=report.get("title", "Untitled Inquiry"),
         question=report.get("question", "No question specified"),
         context=report.get("context", "No context provided"),
         constraints=format_constraints(report.get("constraints", [])),
-        research_reports=format_research_reports(research_reports),
+        research_reports=research_section,
         summary_content=summary,
-        agent_count=len(research_reports),
+        agent_count=agent_count,
         date=date.today().isoformat()
     )
 
@@ -299,9 +650,29 @@ def main():
                         default="prompt", help="What to generate")
     parser.add_argument("--write", action="store_true",
                         help="Write template to SYNTHESIS.md (only with --output template)")
+    parser.add_argument("--context-tokens", type=int, default=DEFAULT_CONTEXT_TOKENS,
+                        help="Token budget for research reports in the prompt "
+                             f"(default: {DEFAULT_CONTEXT_TOKENS}, 0 for no limit)")
+    parser.add_argument("--mode", choices=MODES, default="full",
+                        help="full: include reports (packed to --context-tokens); "
+                             "retrieval: per-question evidence from the research index")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K,
+                        help=f"Paragraphs retrieved per question (default: {DEFAULT_TOP_K})")
+    parser.add_argument("--question-tokens", type=int, default=DEFAULT_QUESTION_TOKENS,
+                        help=f"Token budget per question (default: {DEFAULT_QUESTION_TOKENS})")
+    parser.add_argument("--retriever", choices=RETRIEVERS, default="bm25",
+                        help="Retrieval index for --mode retrieval (embedding requires numpy)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
 
     args = parser.parse_args()
+    prompt_options = {
+        "budget_tokens": args.context_tokens or None,
+        "mode": args.mode,
+        "top_k": args.top_k,
+        "question_tokens": args.question_tokens,
+        "retriever": args.retriever,
+        "record": True,
+    }
 
     inquiry_path = find_inquiry(args.inquiry)
     if not inquiry_path:
@@ -310,7 +681,7 @@ def main():
 
     try:
         if args.output == "prompt":
-            prompt = generate_synthesis_prompt(inquiry_path)
+            prompt = generate_synthesis_prompt(inquiry_path, **prompt_options)
             if args.json:
                 print(json.dumps({"prompt": prompt}))
             else:
@@ -332,7 +703,7 @@ def main():
                     print(template)
 
         elif args.output == "both":
-            prompt = generate_synthesis_prompt(inquiry_path)
+            prompt = generate_synthesis_prompt(inquiry_path, **prompt_options)
             template = create_synthesis_template(inquiry_path)
             if args.json:
                 print(json.dumps({"prompt": prompt, "template": template}))
@@ -342,7 +713,7 @@ def main():
                 print("\n=== SYNTHESIS TEMPLATE ===\n")
                 print(template)
 
-    except FileNotFoundError as e:
+    except (FileNotFoundError, ImportError) as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
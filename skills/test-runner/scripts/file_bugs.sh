@@ -0,0 +1,18 @@
+#!/bin/bash
+# file_bugs.sh
+# Files bugs for test failures, skipping near-duplicates of open bugs
+# Run from the project root (the directory containing feature-management/)
+
+INPUT_JSON=$1
+
+if [[ -z "$INPUT_JSON" ]]; then
+    echo "Usage: ./file_bugs.sh <bugs.json>"
+    exit 1
+fi
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+CREATE_ITEM="$SCRIPT_DIR/../../work-item-creation/scripts/create_item.py"
+
+# A failure that is already filed as an open bug is not filed again: the
+# output names the existing bug with "skipped": true
+python3 "$CREATE_ITEM" "$INPUT_JSON" --dedupe skip
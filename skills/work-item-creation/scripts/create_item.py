@@ -3,12 +3,21 @@ import os
 import json
 import argparse
 import re
+import runpy
+import shutil
 from datetime import datetime
 
 # Paths
 BASE_DIR = os.getcwd()
 FEATURE_MGMT_DIR = os.path.join(BASE_DIR, "feature-management")
 TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates")
+DEDUPE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dedupe.py")
+SKILL_MODULES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                                  "_shared", "skill_modules.py")
+
+# Loaded by path: this module is itself imported by path from other skills
+load_module = runpy.run_path(SKILL_MODULES_PATH)["load_module"]
+dedupe_index = load_module("work_item_creation_dedupe", DEDUPE_PATH)
 
 def get_next_id(prefix, directory):
     """Finds the next available ID in a directory."""
@@ -31,10 +40,8 @@ def slugify(text):
     text = re.sub(r'\s+', '-', text)
     return text[:50]
 
-def create_bug(data):
-    bugs_dir = os.path.join(FEATURE_MGMT_DIR, "bugs")
-    next_id = get_next_id("BUG", bugs_dir)
-    bug_id = f"BUG-{next_id:03d}"
+def write_bug(data, bug_id, bugs_dir, tags=None):
+    """Writes a bug's directory and returns (item_dir, bugs.md row)."""
     slug = slugify(data['title'])
     item_dir = os.path.join(bugs_dir, f"{bug_id}-{slug}")
     
@@ -56,6 +63,8 @@ def create_bug(data):
         "actual_behavior": metadata.get('actual_behavior', ''),
         "evidence": data.get('evidence', [])
     }
+    if tags:
+        bug_json["tags"] = tags
     
     with open(os.path.join(item_dir, "bug_report.json"), "w") as f:
         json.dump(bug_json, f, indent=2)
@@ -82,18 +91,14 @@ def create_bug(data):
     with open(os.path.join(item_dir, "PROMPT.md"), "w") as f:
         f.write(content)
 
-    # Append to bugs.md
-    bugs_md = os.path.join(FEATURE_MGMT_DIR, "bugs", "bugs.md")
-    if os.path.exists(bugs_md):
-        with open(bugs_md, "a") as f:
-            f.write(f"| {bug_id} | {data['title']} | {data['priority']} | new | {data['component']} | [Link](bugs/{bug_id}-{slug}/) |\n")
+    row = f"| {bug_id} | {data['title']} | {data['priority']} | new | {data['component']} | [Link](bugs/{bug_id}-{slug}/) |\n"
+    return item_dir, row
 
-    print(json.dumps({"success": True, "id": bug_id, "path": item_dir}))
+def create_bug(data, dedupe=dedupe_index.DEFAULT_POLICY):
+    print(json.dumps(create_items([data], dedupe=dedupe)[0]))
 
-def create_feature(data):
-    feats_dir = os.path.join(FEATURE_MGMT_DIR, "features")
-    next_id = get_next_id("FEAT", feats_dir)
-    feat_id = f"FEAT-{next_id:03d}"
+def write_feature(data, feat_id, feats_dir, tags=None):
+    """Writes a feature's directory and returns (item_dir, features.md row)."""
     slug = slugify(data['title'])
     item_dir = os.path.join(feats_dir, f"{feat_id}-{slug}")
     
@@ -112,6 +117,8 @@ def create_feature(data):
         "description": data['description'],
         "business_value": metadata.get('business_value', 'medium')
     }
+    if tags:
+        feat_json["tags"] = tags
     
     with open(os.path.join(item_dir, "feature_request.json"), "w") as f:
         json.dump(feat_json, f, indent=2)
@@ -137,25 +144,112 @@ def create_feature(data):
     with open(os.path.join(item_dir, "PROMPT.md"), "w") as f:
         f.write(content)
 
-    # Append to features.md
-    feats_md = os.path.join(FEATURE_MGMT_DIR, "features", "features.md")
-    if os.path.exists(feats_md):
-        with open(feats_md, "a") as f:
-            f.write(f"| {feat_id} | {data['title']} | {data['component']} | {data['priority']} | new | [Link](features/{feat_id}-{slug}/) |\n")
+    row = f"| {feat_id} | {data['title']} | {data['component']} | {data['priority']} | new | [Link](features/{feat_id}-{slug}/) |\n"
+    return item_dir, row
+
+# Item type -> (ID prefix, directory, summary file, writer)
+ITEM_TYPES = {
+    "bug": ("BUG", "bugs", "bugs.md", write_bug),
+    "feature": ("FEAT", "features", "features.md", write_feature),
+}
+
+def create_items(items, feature_mgmt_dir=None, dedupe=dedupe_index.DEFAULT_POLICY):
+    """
+    Creates several bugs and/or features in one transaction.
+
+    Each item type gets a single ID scan and one summary append. Unless
+    dedupe is "force", each item is first checked against the open items
+    of its type, including those created earlier in the batch: "skip"
+    returns the existing item instead of creating a new one, "link"
+    creates it tagged "duplicate-of:<ID>". Returns a list of
+    {"success", "id", "path"} dicts; checked items also list their
+    "duplicates" and skipped ones are marked "skipped".
+
+    If writing an item fails, the directories created so far are removed
+    and the exception is re-raised: no summary row or index entry is kept.
+    """
+    if dedupe not in dedupe_index.POLICIES:
+        raise ValueError(f"Unknown dedupe policy: {dedupe}")
+    root = feature_mgmt_dir or FEATURE_MGMT_DIR
+    index = dedupe_index.DuplicateIndex(root)
+    index.refresh()
+
+    next_ids = {}
+    rows = {}
+    results = []
+    created_dirs = []
+    try:
+        for data in items:
+            item_type = data['item_type']
+            prefix, dir_name, summary, write = ITEM_TYPES[item_type]
+            duplicates = []
+            if dedupe != "force":
+                duplicates = index.candidates(item_type, data['title'], data['description'])
+            if duplicates and dedupe == "skip":
+                results.append({"success": True, "id": duplicates[0]["id"], "path": duplicates[0]["path"],
+                                "skipped": True, "duplicates": duplicates})
+                continue
+
+            items_dir = os.path.join(root, dir_name)
+            if prefix not in next_ids:
+                next_ids[prefix] = get_next_id(prefix, items_dir)
+            item_id = f"{prefix}-{next_ids[prefix]:03d}"
+            next_ids[prefix] += 1
+
+            tags = [f"duplicate-of:{d['id']}" for d in duplicates]
+            created_dirs.append(os.path.join(items_dir, f"{item_id}-{slugify(data['title'])}"))
+            item_dir, row = write(data, item_id, items_dir, tags)
+            index.add(f"{dir_name}/{os.path.basename(item_dir)}", item_type, item_id,
+                      data['title'], data['description'])
+            rows.setdefault(os.path.join(items_dir, summary), []).append(row)
+
+            result = {"success": True, "id": item_id, "path": item_dir}
+            if dedupe != "force":
+                result["duplicates"] = duplicates
+            results.append(result)
+    except Exception:
+        index.conn.rollback()
+        for item_dir in created_dirs:
+            shutil.rmtree(item_dir, ignore_errors=True)
+        raise
+    finally:
+        index.close()
+
+    # Append to bugs.md / features.md
+    for summary_path, summary_rows in rows.items():
+        if os.path.exists(summary_path):
+            with open(summary_path, "a") as f:
+                f.write("".join(summary_rows))
+
+    return results
+
+def create_features(items, feature_mgmt_dir=None, dedupe=dedupe_index.DEFAULT_POLICY):
+    """Creates several features in one transaction (see create_items)."""
+    return create_items(items, feature_mgmt_dir, dedupe)
 
-    print(json.dumps({"success": True, "id": feat_id, "path": item_dir}))
+def create_feature(data, dedupe=dedupe_index.DEFAULT_POLICY):
+    print(json.dumps(create_items([data], dedupe=dedupe)[0]))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("input_json", help="Path to input JSON file")
+    parser.add_argument("--dedupe", choices=dedupe_index.POLICIES, default=dedupe_index.DEFAULT_POLICY,
+                        help="What to do when an open item of the same type is a near-duplicate: "
+                             "skip creating it, link it with a duplicate-of tag, or force creation")
     args = parser.parse_args()
     
     with open(args.input_json, 'r') as f:
         data = json.load(f)
     
-    if data['item_type'] == 'bug':
-        create_bug(data)
+    if isinstance(data, list):
+        # Batch: one ID scan per type, one summary update per type
+        if any(item.get('item_type') not in ITEM_TYPES for item in data):
+            print(json.dumps({"success": False, "error": "Unknown item type"}))
+        else:
+            print(json.dumps({"success": True, "items": create_items(data, dedupe=args.dedupe)}))
+    elif data['item_type'] == 'bug':
+        create_bug(data, args.dedupe)
     elif data['item_type'] == 'feature':
-        create_feature(data)
+        create_feature(data, args.dedupe)
     else:
         print(json.dumps({"success": False, "error": "Unknown item type"}))
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate detection for new work items.
+
+Each open bug and feature is reduced to the set of content words of its
+title and description and summarized by a MinHash signature, split into
+LSH bands. The bands are stored alongside the items in
+feature-management/.cache/dedupe.sqlite3, so checking a new item only
+looks up its own band keys: items that share no band are never read.
+Candidates are verified with exact Jaccard similarity and their current
+status is read from their metadata file, so items resolved since they
+were indexed are not reported.
+
+The index follows the bugs/ and features/ directories by their mtime:
+when an item directory is added or removed, the listing is diffed against
+the indexed paths and only the difference is (re)indexed. Items created
+through create_item.py are added as they are written. Each indexed item
+also keeps the size/mtime signature of its metadata file. LSH candidates
+are stat'ed again before they are scored, and a candidate edited in place
+is re-indexed from its current title and description.
+
+The MinHash scheme matches inquiry-collector's similarity.py.
+"""
+import os
+import re
+import json
+import random
+import hashlib
+import sqlite3
+
+# Paths
+BASE_DIR = os.getcwd()
+FEATURE_MGMT_DIR = os.path.join(BASE_DIR, "feature-management")
+INDEX_FILE = os.path.join(".cache", "dedupe.sqlite3")
+
+# Bump when shingling or the signature scheme changes
+INDEX_VERSION = 3
+
+POLICIES = ("skip", "link", "force")
+DEFAULT_POLICY = "link"
+
+# Minimum Jaccard similarity of title + description words for a duplicate
+DUPLICATE_THRESHOLD = 0.7
+# Most duplicates reported per item (bounds the metadata files read)
+MAX_DUPLICATES = 5
+
+# 16 bands x 4 rows: pairs at the threshold become candidates ~99% of the time
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+# Directory -> (item type, metadata file, ID field)
+ITEM_DIRS = {
+    "bugs": ("bug", "bug_report.json", "bug_id"),
+    "features": ("feature", "feature_request.json", "feature_id"),
+}
+CLOSED_STATUSES = {"resolved", "closed", "completed", "verified", "implemented", "wont_do", "deprecated"}
+
+# Mersenne prime used for universal hashing of shingle hashes
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_KEY_MASK = (1 << 63) - 1
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "been", "but", "by", "can",
+    "for", "from", "has", "have", "in", "is", "it", "its", "of", "on", "or",
+    "that", "the", "this", "to", "was", "we", "were", "which", "while",
+    "will", "with",
+})
+
+ITEM_DIR_PATTERN = re.compile(r"^(BUG|FEAT)-\d+")
+
+_rng = random.Random(1)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    path TEXT PRIMARY KEY,
+    item_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    words TEXT NOT NULL,
+    signature TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bands (
+    key INTEGER NOT NULL,
+    path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bands_key ON bands (key);
+CREATE INDEX IF NOT EXISTS bands_path ON bands (path);
+CREATE TABLE IF NOT EXISTS dirs (
+    name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+"""
+
+
+def shingle(text):
+    """Reduces text to its set of normalized content words."""
+    return frozenset(w for w in re.findall(r"\w+", text.lower()) if w not in STOPWORDS)
+
+
+def jaccard(a, b):
+    """Exact Jaccard similarity of two word sets."""
+    if not a or not b:
+        return 0.0
+    intersection = len(a & b)
+    return intersection / (len(a) + len(b) - intersection)
+
+
+def band_keys(words):
+    """LSH band keys of a word set's MinHash signature (one per band)."""
+    if not words:
+        return []
+    hashes = [int.from_bytes(hashlib.blake2b(w.encode("utf-8"), digest_size=8).digest(), "little")
+              for w in words]
+    signature = [min((a * h + b) % _PRIME for h in hashes) & _MAX_HASH for a, b in _PERMS]
+    keys = []
+    for band in range(BANDS):
+        key = band
+        for value in signature[band * ROWS:(band + 1) * ROWS]:
+            key = (key * _PRIME + value) & _KEY_MASK
+        keys.append(key)
+    return keys
+
+
+def item_words(title, description):
+    return shingle(f"{title} {description}")
+
+
+class DuplicateIndex:
+    """MinHash/LSH index of the bugs and features of a feature-management directory."""
+
+    def __init__(self, feature_mgmt_dir=None):
+        self.root = feature_mgmt_dir or FEATURE_MGMT_DIR
+        index_path = os.path.join(self.root, INDEX_FILE)
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        self.conn = sqlite3.connect(index_path)
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+            self.conn.executescript("DROP TABLE IF EXISTS items; DROP TABLE IF EXISTS bands; DROP TABLE IF EXISTS dirs;")
+            self.conn.executescript(SCHEMA)
+            self.conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+            self.conn.commit()
+
+    def close(self):
+        """Commits items added since the last refresh and closes the index."""
+        self.conn.commit()
+        self.conn.close()
+
+    def _metadata_path(self, path):
+        _, metadata_file, _ = ITEM_DIRS[path.split("/", 1)[0]]
+        return os.path.join(self.root, path, metadata_file)
+
+    def _signature(self, path):
+        """Size/mtime signature of an item's metadata file ("-" if missing)."""
+        try:
+            st = os.stat(self._metadata_path(path))
+        except OSError:
+            return "-"
+        return f"{st.st_mtime_ns}:{st.st_size}"
+
+    def _read_metadata(self, path):
+        try:
+            with open(self._metadata_path(path), "r") as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return metadata if isinstance(metadata, dict) else None
+
+    def add(self, path, item_type, item_id, title, description):
+        """Indexes an item (path relative to feature-management/, e.g. "bugs/BUG-001-x")."""
+        self.remove(path)
+        words = item_words(title, description)
+        self.conn.execute("INSERT INTO items (path, item_id, type, words, signature) VALUES (?, ?, ?, ?, ?)",
+                          (path, item_id, item_type, " ".join(sorted(words)), self._signature(path)))
+        self.conn.executemany("INSERT INTO bands (key, path) VALUES (?, ?)",
+                              [(key, path) for key in band_keys(words)])
+
+    def remove(self, path):
+        self.conn.execute("DELETE FROM items WHERE path = ?", (path,))
+        self.conn.execute("DELETE FROM bands WHERE path = ?", (path,))
+
+    def _add_from_metadata(self, path, metadata):
+        """Indexes an item from its metadata file contents and returns its word set."""
+        item_type, _, id_field = ITEM_DIRS[path.split("/", 1)[0]]
+        item_id = metadata.get(id_field) or ITEM_DIR_PATTERN.match(path.split("/")[1]).group(0)
+        title, description = metadata.get("title", ""), str(metadata.get("description", ""))
+        self.add(path, item_type, item_id, title, description)
+        return item_id, item_words(title, description)
+
+    def refresh(self):
+        """
+        Indexes item directories added (and drops those removed) since the
+        last refresh. Directories whose mtime is unchanged are not listed,
+        so a refresh with no new items costs two stats.
+
+        Returns:
+            Number of items added or removed
+        """
+        stored = dict(self.conn.execute("SELECT name, mtime_ns FROM dirs"))
+        changes = 0
+        with self.conn:
+            for name in ITEM_DIRS:
+                top_dir = os.path.join(self.root, name)
+                try:
+                    mtime_ns = os.stat(top_dir).st_mtime_ns
+                except OSError:
+                    mtime_ns = 0
+                if stored.get(name) == mtime_ns:
+                    continue
+
+                current = set()
+                if mtime_ns:
+                    with os.scandir(top_dir) as entries:
+                        current = {f"{name}/{e.name}" for e in entries
+                                   if ITEM_DIR_PATTERN.match(e.name) and e.is_dir()}
+                indexed = {path for (path,) in self.conn.execute(
+                    "SELECT path FROM items WHERE path LIKE ?", (f"{name}/%",))}
+
+                for path in indexed - current:
+                    self.remove(path)
+                    changes += 1
+                for path in current - indexed:
+                    metadata = self._read_metadata(path)
+                    if metadata is None:
+                        continue
+                    self._add_from_metadata(path, metadata)
+                    changes += 1
+                self.conn.execute("INSERT OR REPLACE INTO dirs (name, mtime_ns) VALUES (?, ?)", (name, mtime_ns))
+        return changes
+
+    def candidates(self, item_type, title, description, threshold=DUPLICATE_THRESHOLD, limit=MAX_DUPLICATES):
+        """
+        Finds open items of the same type similar to a new item.
+
+        Candidates whose metadata file changed since they were indexed are
+        re-indexed first and scored on their current title and description.
+
+        Returns:
+            Up to limit {"id", "path", "similarity"} dicts, most similar first
+        """
+        words = item_words(title, description)
+        keys = band_keys(words)
+        if not keys:
+            return []
+        marks = ", ".join("?" * len(keys))
+        rows = self.conn.execute(
+            f"SELECT path, item_id, words, signature FROM items WHERE type = ? AND path IN "
+            f"(SELECT path FROM bands WHERE key IN ({marks}))",
+            [item_type] + keys,
+        ).fetchall()
+
+        scored = []
+        metadata_by_path = {}
+        for path, item_id, indexed_words, signature in rows:
+            indexed_words = frozenset(indexed_words.split())
+            if self._signature(path) != signature:
+                metadata = self._read_metadata(path)
+                if metadata is None:
+                    self.remove(path)
+                    continue
+                item_id, indexed_words = self._add_from_metadata(path, metadata)
+                metadata_by_path[path] = metadata
+            similarity = jaccard(words, indexed_words)
+            if similarity >= threshold:
+                scored.append((-similarity, item_id, path))
+        scored.sort()
+
+        # Status is read from the item itself: it may have been resolved since indexing
+        found = []
+        for negative_similarity, item_id, path in scored:
+            metadata = metadata_by_path.get(path) or self._read_metadata(path)
+            if metadata is None or str(metadata.get("status", "")).lower() in CLOSED_STATUSES:
+                continue
+            found.append({"id": item_id, "path": os.path.join(self.root, path),
+                          "similarity": round(-negative_similarity, 3)})
+            if len(found) == limit:
+                break
+        return found
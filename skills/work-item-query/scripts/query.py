@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Work item query engine.
+
+Indexes every bug, feature, human action and inquiry under
+feature-management/ (active and completed) in an on-disk SQLite database
+with an FTS5 full-text table over titles, descriptions, tags and the
+PROMPT.md / INSTRUCTIONS.md / QUESTION.md bodies. The index lives in
+feature-management/.cache/work_items.sqlite3 and is refreshed
+incrementally: only items whose metadata or body file changed size or
+mtime are re-read.
+
+Usage:
+    python3 scripts/query.py 'status:new priority:P1 cache'
+    python3 scripts/query.py 'is:open type:bug component:templates' --json
+"""
+import os
+import json
+import re
+import sqlite3
+import argparse
+import time
+
+# Paths
+BASE_DIR = os.getcwd()
+FEATURE_MGMT_DIR = os.path.join(BASE_DIR, "feature-management")
+INDEX_FILE = os.path.join(".cache", "work_items.sqlite3")
+
+# Bump when the schema or the indexed fields change
+INDEX_VERSION = 1
+
+# Directories scanned for items, relative to feature-management/
+ITEM_DIRS = ["bugs", "features", "human-actions", "completed", "inquiries"]
+
+# ID prefix -> (type, metadata file, ID field, body file)
+ITEM_TYPES = {
+    "BUG": ("bug", "bug_report.json", "bug_id", "PROMPT.md"),
+    "FEAT": ("feature", "feature_request.json", "feature_id", "PROMPT.md"),
+    "ACTION": ("action", "action_report.json", "action_id", "INSTRUCTIONS.md"),
+    "INQ": ("inquiry", "inquiry_report.json", "inquiry_id", "QUESTION.md"),
+}
+JOURNAL_FILE = "phase_journal.jsonl"
+
+CLOSED_STATUSES = ["resolved", "closed", "completed", "verified", "implemented", "wont_do", "deprecated"]
+
+# Query fields -> SQL column (compared case-insensitively)
+FILTER_FIELDS = {
+    "status": "status",
+    "priority": "priority",
+    "component": "component",
+    "type": "type",
+    "id": "item_id",
+}
+
+ITEM_DIR_PATTERN = re.compile(r"^(BUG|FEAT|ACTION|INQ)-\d+")
+TERM_PATTERN = re.compile(r"\w+\*?")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    rowid INTEGER PRIMARY KEY,
+    item_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    title TEXT,
+    status TEXT,
+    priority TEXT,
+    component TEXT,
+    created TEXT,
+    updated TEXT,
+    path TEXT NOT NULL UNIQUE,
+    signature TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_status ON items (status COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS items_priority ON items (priority COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS items_component ON items (component COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS tags (
+    item INTEGER NOT NULL,
+    tag TEXT NOT NULL COLLATE NOCASE
+);
+CREATE INDEX IF NOT EXISTS tags_tag ON tags (tag, item);
+CREATE INDEX IF NOT EXISTS tags_item ON tags (item);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5 (
+    item_id, title, description, tags, body, tokenize = 'porter unicode61'
+);
+"""
+
+
+def open_index(feature_mgmt_dir=None):
+    """Opens (creating if needed) the index database of a feature-management directory."""
+    root = feature_mgmt_dir or FEATURE_MGMT_DIR
+    index_path = os.path.join(root, INDEX_FILE)
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    conn = sqlite3.connect(index_path)
+    if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+        conn.executescript("DROP TABLE IF EXISTS items; DROP TABLE IF EXISTS tags; DROP TABLE IF EXISTS items_fts;")
+        conn.executescript(SCHEMA)
+        conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        conn.commit()
+    return conn
+
+
+def _stat_signature(paths):
+    """Size/mtime signature of a set of files ("-" for a missing file)."""
+    parts = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append("-")
+    return "|".join(parts)
+
+
+def scan_items(feature_mgmt_dir=None):
+    """
+    Finds item directories and their file signatures without reading them.
+
+    Returns:
+        Dict of path (relative to feature-management/) -> (ID prefix, signature)
+    """
+    root = feature_mgmt_dir or FEATURE_MGMT_DIR
+    found = {}
+    for top in ITEM_DIRS:
+        top_dir = os.path.join(root, top)
+        if not os.path.isdir(top_dir):
+            continue
+        with os.scandir(top_dir) as entries:
+            for entry in entries:
+                match = ITEM_DIR_PATTERN.match(entry.name)
+                if not match or not entry.is_dir():
+                    continue
+                prefix = match.group(1)
+                _, metadata_file, _, body_file = ITEM_TYPES[prefix]
+                base = entry.path + os.sep
+                files = [base + metadata_file, base + body_file]
+                if prefix == "INQ":
+                    files.append(base + JOURNAL_FILE)
+                found[top + "/" + entry.name] = (prefix, _stat_signature(files))
+    return found
+
+
+def _read_text(path):
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
+def _pending_phase(item_dir, metadata):
+    """Latest phase journaled after the inquiry report was last compacted."""
+    try:
+        with open(os.path.join(item_dir, JOURNAL_FILE), "rb") as f:
+            f.seek(metadata.get("journal_offset", 0))
+            data = f.read()
+    except OSError:
+        return None
+    phase = None
+    # A partial last line is still being written; ignore it
+    for line in data.split(b"\n")[:-1]:
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if event.get("type") == "phase":
+            phase = event.get("phase")
+    return phase
+
+
+def load_item(feature_mgmt_dir, rel_path, prefix):
+    """Reads one item directory into an index record, or None if it has no metadata."""
+    item_type, metadata_file, id_field, body_file = ITEM_TYPES[prefix]
+    item_dir = os.path.join(feature_mgmt_dir, rel_path)
+    try:
+        with open(os.path.join(item_dir, metadata_file), "r") as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(metadata, dict):
+        return None
+
+    status = metadata.get("status", "")
+    if prefix == "INQ":
+        status = _pending_phase(item_dir, metadata) or status
+
+    tags = metadata.get("tags") or []
+    if not isinstance(tags, list):
+        tags = [str(tags)]
+    description = metadata.get("description") or metadata.get("question") or ""
+    return {
+        "item_id": metadata.get(id_field) or ITEM_DIR_PATTERN.match(os.path.basename(rel_path)).group(0),
+        "type": item_type,
+        "title": metadata.get("title", ""),
+        "status": str(status),
+        "priority": metadata.get("priority", ""),
+        "component": metadata.get("component", ""),
+        "created": metadata.get("created_date") or metadata.get("reported_date") or "",
+        "updated": metadata.get("updated_date") or "",
+        "path": rel_path,
+        "tags": [str(t) for t in tags],
+        "description": description if isinstance(description, str) else json.dumps(description),
+        "body": _read_text(os.path.join(item_dir, body_file)),
+    }
+
+
+def _delete_item(conn, rowid):
+    conn.execute("DELETE FROM items WHERE rowid = ?", (rowid,))
+    conn.execute("DELETE FROM tags WHERE item = ?", (rowid,))
+    conn.execute("DELETE FROM items_fts WHERE rowid = ?", (rowid,))
+
+
+def refresh_index(conn, feature_mgmt_dir=None):
+    """
+    Brings the index up to date with the item directories.
+
+    Only items whose files changed size or mtime are re-read; items whose
+    directories are gone are dropped. Everything happens in one transaction.
+
+    Returns:
+        Dict with "updated" and "removed" counts
+    """
+    root = feature_mgmt_dir or FEATURE_MGMT_DIR
+    current = scan_items(root)
+    indexed = {path: (rowid, signature) for rowid, path, signature in
+               conn.execute("SELECT rowid, path, signature FROM items")}
+
+    updated = removed = 0
+    with conn:
+        for path, (rowid, _) in indexed.items():
+            if path not in current:
+                _delete_item(conn, rowid)
+                removed += 1
+
+        for path, (prefix, signature) in current.items():
+            old = indexed.get(path)
+            if old is not None and old[1] == signature:
+                continue
+            if old is not None:
+                _delete_item(conn, old[0])
+            item = load_item(root, path, prefix)
+            if item is None:
+                continue
+            cursor = conn.execute(
+                "INSERT INTO items (item_id, type, title, status, priority, component, created, updated, path, signature) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (item["item_id"], item["type"], item["title"], item["status"], item["priority"],
+                 item["component"], item["created"], item["updated"], path, signature),
+            )
+            rowid = cursor.lastrowid
+            conn.executemany("INSERT INTO tags (item, tag) VALUES (?, ?)", [(rowid, t) for t in item["tags"]])
+            conn.execute(
+                "INSERT INTO items_fts (rowid, item_id, title, description, tags, body) VALUES (?, ?, ?, ?, ?, ?)",
+                (rowid, item["item_id"], item["title"], item["description"], " ".join(item["tags"]), item["body"]),
+            )
+            updated += 1
+
+    return {"updated": updated, "removed": removed}
+
+
+def parse_query(query):
+    """
+    Splits a query string into filters and free-text terms.
+
+    "field:value" restricts a field (status, priority, component, type, id
+    or tag); "field:a,b" matches any of the values and "-field:value"
+    excludes them. "is:open" / "is:closed" filter on the status. Every
+    other word is a full-text term; all terms must match and "term*"
+    matches a prefix.
+
+    Returns:
+        Tuple of (filters, excludes, terms) where filters and excludes map
+        a field to a list of values
+    """
+    filters, excludes, terms = {}, {}, []
+    for token in query.split():
+        field, sep, value = token.partition(":")
+        negate = field.startswith("-")
+        field = field.lstrip("-").lower()
+        if sep and value and (field in FILTER_FIELDS or field in ("tag", "is")):
+            target = excludes if negate else filters
+            target.setdefault(field, []).extend(v for v in value.split(",") if v)
+        else:
+            terms.extend(TERM_PATTERN.findall(token))
+    return filters, excludes, terms
+
+
+def search(conn, query, limit=50):
+    """
+    Runs a query against the index.
+
+    Returns:
+        Matching items as dicts, best full-text match first (or by
+        priority and ID when the query has no free-text terms)
+    """
+    filters, excludes, terms = parse_query(query)
+    where, params = [], []
+
+    for negate, source in ((False, filters), (True, excludes)):
+        for field, values in source.items():
+            marks = ", ".join("?" * len(values))
+            if field == "tag":
+                clause = f"items.rowid IN (SELECT item FROM tags WHERE tag IN ({marks}))"
+                params.extend(values)
+            elif field == "is":
+                open_values = {v.lower() for v in values}
+                if open_values - {"open", "closed"}:
+                    raise ValueError(f"Unknown is: value in {','.join(values)} (use open or closed)")
+                if open_values == {"open", "closed"}:
+                    continue
+                closed = ", ".join("?" * len(CLOSED_STATUSES))
+                op = "NOT IN" if "open" in open_values else "IN"
+                clause = f"lower(items.status) {op} ({closed})"
+                params.extend(CLOSED_STATUSES)
+            else:
+                clause = f"items.{FILTER_FIELDS[field]} COLLATE NOCASE IN ({marks})"
+                params.extend(values)
+            where.append(f"NOT ({clause})" if negate else clause)
+
+    columns = "items.item_id, items.type, items.title, items.status, items.priority, items.component, items.path"
+    if terms:
+        match = " ".join(f'"{t[:-1]}"*' if t.endswith("*") else f'"{t}"' for t in terms)
+        sql = (f"SELECT {columns}, bm25(items_fts) AS score FROM items_fts "
+               f"JOIN items ON items.rowid = items_fts.rowid WHERE items_fts MATCH ?")
+        params.insert(0, match)
+        if where:
+            sql += " AND " + " AND ".join(where)
+        sql += " ORDER BY score LIMIT ?"
+    else:
+        sql = f"SELECT {columns}, 0 AS score FROM items"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        # Priority order P0..P3, then unprioritized; IDs compare numerically
+        sql += (" ORDER BY CASE upper(items.priority) WHEN 'P0' THEN 0 WHEN 'P1' THEN 1 "
+                "WHEN 'P2' THEN 2 WHEN 'P3' THEN 3 ELSE 4 END, items.type, "
+                "CAST(substr(items.item_id, instr(items.item_id, '-') + 1) AS INTEGER) LIMIT ?")
+    params.append(limit)
+
+    keys = ["id", "type", "title", "status", "priority", "component", "path", "score"]
+    return [dict(zip(keys, row)) for row in conn.execute(sql, params)]
+
+
+def format_results(results):
+    if not results:
+        return "No items match the query."
+    lines = [
+        f"Found {len(results)} items:",
+        "",
+        "| ID | Type | Title | Priority | Status | Component |",
+        "|----|------|-------|----------|--------|-----------|",
+    ]
+    for item in results:
+        lines.append(f"| {item['id']} | {item['type']} | {item['title']} | {item['priority']} | "
+                     f"{item['status']} | {item['component']} |")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query work items and inquiries")
+    parser.add_argument("query", nargs="?", default="",
+                        help="Filters (status:new priority:P1,P2 component:x type:bug tag:x is:open) and search terms")
+    parser.add_argument("--root", default=FEATURE_MGMT_DIR, help="feature-management directory")
+    parser.add_argument("--limit", type=int, default=50, help="Maximum number of results")
+    parser.add_argument("--no-refresh", action="store_true", help="Query the index as is, without checking for changes")
+    parser.add_argument("--rebuild", action="store_true", help="Discard the index and rebuild it")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.root):
+        print(json.dumps({"success": False, "error": f"Not a directory: {args.root}"}))
+        raise SystemExit(1)
+
+    if args.rebuild:
+        try:
+            os.remove(os.path.join(args.root, INDEX_FILE))
+        except FileNotFoundError:
+            pass
+
+    start = time.perf_counter()
+    conn = open_index(args.root)
+    refreshed = None if args.no_refresh else refresh_index(conn, args.root)
+    try:
+        results = search(conn, args.query, args.limit)
+    except (ValueError, sqlite3.OperationalError) as e:
+        print(json.dumps({"success": False, "error": str(e)}))
+        raise SystemExit(1)
+    elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+
+    if args.json:
+        print(json.dumps({"success": True, "count": len(results), "items": results,
+                          "refreshed": refreshed, "elapsed_ms": elapsed_ms}, indent=2))
+    else:
+        print(format_results(results))
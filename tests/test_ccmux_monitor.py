@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for batched ccmux monitoring against the local stand-in server
+(skills/inquiry-collector/scripts/ccmux_monitor.py, local_ccmux.py)
+
+- Round trips per poll_once cycle: one list call plus one read per
+  changed (or, with follow, working) pane
+- Incremental reads neither duplicate nor lose lines, blank lines included,
+  however the output is split across reads and cycles
+- A completion heading split across two reads is detected
+
+Run with: python3 tests/test_ccmux_monitor.py
+"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "skills" / "inquiry-collector" / "scripts"))
+
+from ccmux_monitor import AgentStatus, CcmuxMonitor  # noqa: E402
+from local_ccmux import LocalCcmuxServer  # noqa: E402
+
+INQUIRY_ID = "INQ-TEST"
+
+
+def make_server(agents: int) -> LocalCcmuxServer:
+    server = LocalCcmuxServer()
+    for n in range(1, agents + 1):
+        server.add_pane(f"pane-{n}", f"inquiry-{INQUIRY_ID}-agent-{n}", [f"inquiry-{INQUIRY_ID}", f"agent-{n}"])
+    return server
+
+
+def make_monitor(server: LocalCcmuxServer, agents: int) -> CcmuxMonitor:
+    monitor = CcmuxMonitor(INQUIRY_ID, expected_agents=agents)
+    monitor.parse_sessions_response(server.list_panes())
+    server.calls = dict.fromkeys(server.calls, 0)
+    return monitor
+
+
+def session_for(monitor: CcmuxMonitor, pane_id: str):
+    return next(s for s in monitor.sessions if s.pane_id == pane_id)
+
+
+class RoundTripTests(unittest.TestCase):
+    def test_unchanged_cycle_is_one_list_call(self):
+        server = make_server(20)
+        monitor = make_monitor(server, 20)
+        for n in range(1, 21):
+            server.write(f"pane-{n}", "working on it")
+
+        stats = monitor.poll_once(server)
+        self.assertEqual(stats["round_trips"], 1)
+        self.assertEqual(server.calls, {"list_panes": 1, "get_status": 0, "read_pane": 0})
+
+    def test_changed_panes_are_read_once_each(self):
+        server = make_server(20)
+        monitor = make_monitor(server, 20)
+        for n in (3, 7, 11):
+            server.write(f"pane-{n}", "Finding\n## Conclusion\nDone.")
+            server.set_status(f"pane-{n}", "complete")
+
+        stats = monitor.poll_once(server)
+        self.assertEqual(stats["round_trips"], 1 + 3)
+        self.assertEqual(stats["round_trips"], server.total_calls())
+        self.assertEqual(stats["complete"], 3)
+
+        # Nothing changed since: back to the single list call
+        server.calls = dict.fromkeys(server.calls, 0)
+        self.assertEqual(monitor.poll_once(server)["round_trips"], 1)
+
+    def test_follow_reads_working_panes(self):
+        server = make_server(10)
+        monitor = make_monitor(server, 10)
+        server.set_status("pane-1", "complete")
+        server.write("pane-1", "## Summary\nDone.")
+
+        stats = monitor.poll_once(server, follow=True)
+        # pane-1 changed; the nine working panes are followed
+        self.assertEqual(stats["round_trips"], 1 + 10)
+        self.assertEqual(stats["round_trips"], server.total_calls())
+
+    def test_large_output_is_drained_in_chunks(self):
+        server = make_server(1)
+        monitor = make_monitor(server, 1)
+        server.write("pane-1", "\n".join(f"line {i}" for i in range(95)))
+        server.set_status("pane-1", "complete")
+
+        stats = monitor.poll_once(server, lines=10)
+        self.assertEqual(stats["round_trips"], 1 + 10)
+        self.assertEqual(stats["lines_read"], 95)
+
+
+class IncrementalReadTests(unittest.TestCase):
+    def test_no_lines_duplicated_or_lost(self):
+        rng = random.Random(7)
+        agents = 8
+        server = make_server(agents)
+        monitor = make_monitor(server, agents)
+
+        for _cycle in range(30):
+            for pane_id in server.panes:
+                lines = [rng.choice(["", "finding", "evidence", "  indented", "---"])
+                         for _ in range(rng.randint(0, 12))]
+                server.panes[pane_id].lines.extend(lines)
+            monitor.poll_once(server, lines=rng.randint(1, 9), follow=True)
+
+        for pane_id, pane in server.panes.items():
+            session = session_for(monitor, pane_id)
+            self.assertEqual(session.read_offset, len(pane.lines))
+            self.assertEqual(session.output, "\n".join(pane.lines))
+
+    def test_blank_reads_advance_the_cursor(self):
+        server = make_server(1)
+        monitor = make_monitor(server, 1)
+        server.panes["pane-1"].lines.extend(["", ""])
+        monitor.poll_once(server, follow=True)
+        server.panes["pane-1"].lines.extend(["after"])
+        monitor.poll_once(server, follow=True)
+
+        session = session_for(monitor, "pane-1")
+        self.assertEqual(session.read_offset, 3)
+        self.assertEqual(session.output, "\n\nafter")
+
+
+class CompletionTests(unittest.TestCase):
+    def test_heading_split_across_reads(self):
+        server = make_server(1)
+        monitor = make_monitor(server, 1)
+        server.write("pane-1", "Findings so far\n##")
+        monitor.poll_once(server, follow=True)
+        session = session_for(monitor, "pane-1")
+        self.assertEqual(session.status, AgentStatus.WORKING)
+
+        server.write("pane-1", "Conclusion\nAll done.")
+        monitor.poll_once(server, follow=True)
+        self.assertEqual(session.status, AgentStatus.COMPLETE)
+
+    def test_heading_split_by_read_limit(self):
+        server = make_server(1)
+        monitor = make_monitor(server, 1)
+        server.write("pane-1", "a\nb\n##\nSummary\nDone.")
+
+        monitor.poll_once(server, lines=3, follow=True)
+        self.assertEqual(session_for(monitor, "pane-1").status, AgentStatus.COMPLETE)
+
+    def test_mid_line_hashes_are_not_a_heading(self):
+        server = make_server(1)
+        monitor = make_monitor(server, 1)
+        server.write("pane-1", "see section ##")
+        monitor.poll_once(server, follow=True)
+        server.write("pane-1", "Conclusion is pending")
+        monitor.poll_once(server, follow=True)
+        self.assertEqual(session_for(monitor, "pane-1").status, AgentStatus.WORKING)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Tests for the inquiry document parser (skills/inquiry/scripts/document_parser.py)
+
+- Differential fuzz: on well-formed DEBATE.md and CONSENSUS.md documents
+  built from the skill's own templates, the parser returns what the regex
+  extraction it replaced returned
+- Mutated documents (junk lines, truncated markers) parse without raising
+- A ~10 MB document parses within a generous time bound
+
+Run with: python3 tests/test_document_parser.py
+"""
+
+import random
+import re
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from skills.inquiry.scripts import consensus_builder  # noqa: E402
+from skills.inquiry.scripts.debate_structurer import DECISION_POINT_TEMPLATE  # noqa: E402
+from skills.inquiry.scripts.document_parser import parse_document, parse_document_file  # noqa: E402
+
+FUZZ_ITERATIONS = 300
+LARGE_DOCUMENT_BYTES = 10_000_000
+# The parser is linear; 10 MB takes well under a second. The bound only
+# catches a return to backtracking scans, which take minutes.
+LARGE_DOCUMENT_SECONDS = 10.0
+
+WORDS = "cache latency token budget agent paragraph index merge shard retry".split()
+JUNK_LINES = [
+    "", "**", "**Bold**: ", "|", "| a |", "---", "```", "### ", "#",
+    "**Confidence**:", "### Decision Point 9:", "## ", "- [ ] x", "\t", "***", "~~~",
+]
+
+
+# --- Regex extraction the parser replaced (oracles) ---
+
+def regex_debate_resolutions(content: str) -> list[dict]:
+    decisions = []
+    decision_sections = re.findall(
+        r'### Decision Point (\d+):\s*([^\n]+)(.*?)(?=### Decision Point|\Z)',
+        content,
+        re.DOTALL
+    )
+    for num, topic, section in decision_sections:
+        resolution_match = re.search(r'\*\*Prevailing Position\*\*:\s*([^\n]+)', section)
+        rationale_match = re.search(r'\*\*Rationale\*\*:\s*\n(.*?)(?=\*\*|\n---|\Z)', section, re.DOTALL)
+        confidence_match = re.search(r'\*\*Confidence\*\*:\s*([^\n]+)', section)
+        decisions.append({
+            "num": int(num),
+            "topic": topic.strip(),
+            "resolution": resolution_match.group(1).strip() if resolution_match else "[Not specified]",
+            "rationale": rationale_match.group(1).strip() if rationale_match else "[See debate document]",
+            "confidence": confidence_match.group(1).strip() if confidence_match else "Medium"
+        })
+    return decisions
+
+
+def regex_work_items(content: str) -> list[tuple]:
+    section = re.search(r'## Work Items to Spawn\s*\n(.*?)(?=\n## |\Z)', content, re.DOTALL)
+    if not section:
+        return []
+    matches = re.findall(
+        r'### FEAT-\w+:\s*([^\n]+)\s*\n.*?'
+        r'\*\*Type\*\*:\s*([^\n]+)\s*\n.*?'
+        r'\*\*Priority\*\*:\s*([^\n]+)\s*\n.*?'
+        r'\*\*Estimated Effort\*\*:\s*([^\n]+)',
+        section.group(1),
+        re.DOTALL
+    )
+    return [tuple(field.strip() for field in match) for match in matches]
+
+
+# --- Document generators ---
+
+class DocumentGenerator:
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+
+    def phrase(self, max_words: int = 4) -> str:
+        return " ".join(self.rng.choice(WORDS) for _ in range(self.rng.randint(1, max_words)))
+
+    def debate(self, count: int) -> str:
+        parts = ["# Debate: x\n\n## Overview\n\ntext\n\n## Decision Points\n"]
+        for num in range(1, count + 1):
+            section = DECISION_POINT_TEMPLATE.format(
+                num=num, topic=self.phrase(), question=self.phrase(8),
+                position_a=self.phrase(), position_b=self.phrase()
+            )
+            section = section.replace("[A or B or Hybrid]", self.rng.choice(["A", "B", "Hybrid"]))
+            section = section.replace(
+                "[Why this position was selected]",
+                "\n".join(self.phrase(10) for _ in range(self.rng.randint(1, 4)))
+            )
+            section = section.replace("[High/Medium/Low]", self.rng.choice(["High", "Medium", "Low"]))
+            parts.append(section)
+        parts.append("\n## Debate Summary\n\n### Resolutions\n\n| a | b |\n|---|---|\n")
+        return "\n".join(parts)
+
+    def consensus(self, count: int) -> str:
+        parts = ["# Consensus\n\n## Decision Record\n\nx\n\n## Work Items to Spawn\n"]
+        for num in range(count):
+            parts.append(consensus_builder.WORK_ITEM_TEMPLATE.format(
+                title=self.phrase(),
+                type=self.rng.choice(["new_feature", "enhancement"]),
+                priority=self.rng.choice(["P0", "P1", "P2"]),
+                effort=self.rng.choice(["small", "medium", "large"]),
+                description=self.phrase(20),
+                inquiry_id="INQ-001",
+                decision_ref=f"Decision {num}"
+            ))
+        parts.append("\n## Constraints Verification\n\n| c | y | h |\n")
+        return "\n".join(parts)
+
+    def mutate(self, doc: str) -> str:
+        lines = doc.split("\n")
+        for _ in range(self.rng.randint(0, 30)):
+            op = self.rng.random()
+            i = self.rng.randrange(len(lines))
+            junk = self.rng.choice(JUNK_LINES)
+            if op < 0.3:
+                lines.insert(i, junk)
+            elif op < 0.5:
+                del lines[i]
+            elif op < 0.8:
+                lines[i] = lines[i][:self.rng.randint(0, len(lines[i]))] + junk
+            else:
+                lines[i] = "".join(self.rng.choice("#*|-`: \tAB") for _ in range(self.rng.randint(0, 12)))
+        return "\n".join(lines)
+
+
+def parsed_work_items(content: str) -> list[tuple]:
+    return [(w["title"], w["type"], w["priority"], w["effort"]) for w in parse_document(content)["work_items"]]
+
+
+class DocumentParserTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.doc_path = Path(self.tmp.name) / "doc.md"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_debate_resolutions_match_regex(self):
+        gen = DocumentGenerator(seed=1)
+        for iteration in range(FUZZ_ITERATIONS):
+            doc = gen.debate(gen.rng.randint(0, 6))
+            self.doc_path.write_text(doc)
+            with self.subTest(iteration=iteration):
+                self.assertEqual(consensus_builder.parse_debate_resolutions(self.doc_path),
+                                 regex_debate_resolutions(doc))
+
+    def test_work_items_match_regex(self):
+        gen = DocumentGenerator(seed=2)
+        for iteration in range(FUZZ_ITERATIONS):
+            doc = gen.consensus(gen.rng.randint(0, 6))
+            with self.subTest(iteration=iteration):
+                self.assertEqual(parsed_work_items(doc), regex_work_items(doc))
+
+    def test_mutated_documents_parse(self):
+        gen = DocumentGenerator(seed=3)
+        for iteration in range(FUZZ_ITERATIONS):
+            doc = gen.mutate(gen.debate(gen.rng.randint(0, 6)) + gen.consensus(gen.rng.randint(0, 4)))
+            self.doc_path.write_text(doc)
+            with self.subTest(iteration=iteration):
+                parse_document(doc)
+                parse_document_file(self.doc_path)
+                consensus_builder.parse_debate_resolutions(self.doc_path)
+
+    def test_large_debate_document(self):
+        gen = DocumentGenerator(seed=4)
+        count = LARGE_DOCUMENT_BYTES // len(gen.debate(1))
+        # Without a Confidence field the replaced regex rescanned to the end of the file
+        doc = gen.debate(count).replace("**Confidence**", "Confidence")
+        self.doc_path.write_text(doc)
+
+        start = time.perf_counter()
+        decisions = consensus_builder.parse_debate_resolutions(self.doc_path)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(decisions), count)
+        self.assertLess(elapsed, LARGE_DOCUMENT_SECONDS)
+
+    def test_large_consensus_document(self):
+        gen = DocumentGenerator(seed=5)
+        count = LARGE_DOCUMENT_BYTES // len(gen.consensus(1))
+        doc = gen.consensus(count)
+        self.doc_path.write_text(doc)
+
+        start = time.perf_counter()
+        work_items = parse_document_file(self.doc_path)["work_items"]
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(work_items), count)
+        self.assertLess(elapsed, LARGE_DOCUMENT_SECONDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
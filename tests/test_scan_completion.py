@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for completion detection across scan chunks
+(skills/inquiry-collector/scripts/utils.py scan_completion)
+
+A "## Conclusion" heading split across two chunks is detected only when
+the "##" starts its line, however long the line before the cut is.
+
+Run with: python3 tests/test_scan_completion.py
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "skills" / "inquiry-collector" / "scripts"))
+
+import utils  # noqa: E402
+
+CHUNK = utils.SCAN_CHUNK_SIZE
+
+
+def padding(length: int) -> str:
+    """Short lines totalling length characters (length must be even)."""
+    return "a\n" * (length // 2)
+
+
+class ScanCompletionTests(unittest.TestCase):
+    def assertMarker(self, doc: str, expected: bool):
+        self.assertEqual(utils.scan_completion(doc)[0], expected)
+        self.assertEqual(utils.scan_completion(doc.encode())[0], expected)
+
+    def test_heading_split_across_chunks(self):
+        # "## " is the last line of the first chunk, its title the first of the next
+        self.assertMarker(padding(CHUNK - 2) + "## \nsummary\n", True)
+
+    def test_mid_line_hashes_before_cut(self):
+        # A long last line ending in "##" and whitespace is not a heading
+        self.assertMarker(padding(CHUNK - 50) + "x" * 100 + "##" + " " * 61 + "\nconclusion here\n", False)
+        self.assertMarker(padding(CHUNK - 50) + "x" * 5000 + " ##\nconclusion here\n", False)
+
+    def test_heading_within_chunk(self):
+        self.assertMarker("# Report\n\n## Conclusion\n\nDone.\n", True)
+        self.assertMarker("# Report\n\nSee ## Conclusion below\n", False)
+
+
+if __name__ == "__main__":
+    unittest.main()
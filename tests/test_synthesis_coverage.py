@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for synthesis context records and research coverage
+(skills/inquiry/scripts/synthesis_generator.py, coverage.py)
+
+- A full-mode synthesis prompt records the paragraphs it packed in
+  synthesis_context.json, and coverage counts them as retrieved
+- When the reports fit the budget, every paragraph is recorded
+- Without record, generating a prompt writes nothing
+- Retrieval mode builds its prompt from the research index, without
+  reading the reports
+
+Run with: python3 tests/test_synthesis_coverage.py
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from skills.inquiry.scripts import synthesis_generator  # noqa: E402
+from skills.inquiry.scripts.coverage import build_coverage_report  # noqa: E402
+from skills.inquiry.scripts.synthesis_generator import (  # noqa: E402
+    RETRIEVAL_RECORD_FILE,
+    generate_synthesis_prompt,
+)
+
+TOPICS = ["caching", "latency", "sharding", "retries", "indexing", "batching"]
+
+
+def write_inquiry(inquiry_path: Path, agents: int = 3, paragraphs: int = 12) -> None:
+    report = {
+        "inquiry_id": "INQ-900",
+        "title": "Coverage test inquiry",
+        "question": "How should the service reduce caching latency?",
+        "context": "Test fixture",
+        "constraints": [],
+        "status": "active",
+        "phase": "synthesis",
+    }
+    (inquiry_path / "inquiry_report.json").write_text(json.dumps(report, indent=2))
+    research_dir = inquiry_path / "research"
+    research_dir.mkdir()
+    for agent in range(1, agents + 1):
+        lines = [f"# Agent {agent} Research\n"]
+        for number in range(paragraphs):
+            topic = TOPICS[(agent + number) % len(TOPICS)]
+            lines.append(
+                f"Finding {number} from agent {agent} concerns {topic}: measured {topic} "
+                f"behaviour under load shows the {topic} path dominates request time "
+                f"in scenario {number}, so it should be addressed early.\n"
+            )
+        (research_dir / f"agent-{agent}.md").write_text("\n".join(lines))
+
+
+class FullModeCoverageTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.inquiry_path = Path(self.tmp.name) / "INQ-900-coverage"
+        self.inquiry_path.mkdir()
+        write_inquiry(self.inquiry_path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def record_ids(self) -> list[str]:
+        record = json.loads((self.inquiry_path / RETRIEVAL_RECORD_FILE).read_text())
+        self.assertEqual(record["mode"], "full")
+        return [p["id"] for p in record["paragraphs"]]
+
+    def test_packed_paragraphs_count_as_retrieved(self):
+        prompt = generate_synthesis_prompt(self.inquiry_path, budget_tokens=300, record=True)
+        ids = self.record_ids()
+
+        coverage = build_coverage_report(self.inquiry_path)
+        self.assertGreater(coverage["retrieved"], 0)
+        self.assertEqual(coverage["retrieved"], len(ids))
+        self.assertLess(coverage["retrieved"], coverage["paragraphs"])
+        self.assertEqual(coverage["sources"][RETRIEVAL_RECORD_FILE], len(ids))
+        # Every recorded paragraph is in the prompt
+        for pid in ids:
+            source, index = pid.split("#")
+            self.assertIn(f"Finding {index} from agent {source[len('agent-'):-len('.md')]} ", prompt)
+
+    def test_unpacked_reports_record_every_paragraph(self):
+        generate_synthesis_prompt(self.inquiry_path, budget_tokens=None, record=True)
+
+        coverage = build_coverage_report(self.inquiry_path)
+        self.assertEqual(len(self.record_ids()), coverage["paragraphs"])
+        self.assertEqual(coverage["retrieved"], coverage["paragraphs"])
+        self.assertEqual(coverage["uncovered"], 0)
+
+    def test_prompt_without_record_writes_nothing(self):
+        for mode in ("full", "retrieval"):
+            generate_synthesis_prompt(self.inquiry_path, budget_tokens=300, mode=mode)
+        self.assertFalse((self.inquiry_path / RETRIEVAL_RECORD_FILE).exists())
+
+    def test_retrieval_mode_uses_index_only(self):
+        with mock.patch.object(synthesis_generator, "load_research_reports",
+                               side_effect=AssertionError("reports read")):
+            prompt = generate_synthesis_prompt(self.inquiry_path, mode="retrieval", record=True)
+
+        record = json.loads((self.inquiry_path / RETRIEVAL_RECORD_FILE).read_text())
+        self.assertEqual(record["mode"], "retrieval")
+        ids = [p["id"] for q in record["questions"] for p in q["paragraphs"]]
+        self.assertTrue(ids)
+        self.assertIn("Finding", prompt)
+        self.assertEqual(build_coverage_report(self.inquiry_path)["retrieved"], len(set(ids)))
+
+
+if __name__ == "__main__":
+    unittest.main()